@@ -11,6 +11,7 @@ import plotly.express as px
 from typing import Optional, Tuple
 import logging
 import sys
+import time
 import traceback
 import os
 
@@ -35,9 +36,14 @@ logger = logging.getLogger(__name__)
 
 # Import our modules
 from config.settings import config
-from models.model_factory import ModelFactory
+from models.model_registry import get_model_registry
+from models.warmup import get_model_warmup
 from attacks.attack_factory import AttackFactory
+from attacks.attack_jobs import get_attack_job_manager
 from utils.image_processing import ImageProcessor, ImageValidator
+from utils.result_cache import get_result_cache, image_digest, make_cache_key
+from utils.result_store import get_result_store
+from utils.worker_pool import configure_torch_threads, get_worker_pool, resolve_intra_op_threads, run_work
 
 
 class AdversarialComparatorApp:
@@ -50,42 +56,87 @@ class AdversarialComparatorApp:
         self.config = config
         logger.info(f"📋 Config loaded: phase={self.config.phase}, model={self.config.model.model_type}")
         
-        self.model_factory = ModelFactory(config.model)
+        self._setup_worker_pool()
+        self._setup_models()
+        self._setup_result_storage()
+        
         self.attack_factory = AttackFactory(config.attack)
+        self.attack_jobs = get_attack_job_manager()
+        self.poll_attack_job = False
         self.image_processor = ImageProcessor(config.ui)
         self.image_validator = ImageValidator(config.ui)
         
         logger.info("🏭 Factories and processors initialized")
         
-        # Initialize model immediately
-        self.model = None
-        logger.info("🤖 Model initialized as None (will be loaded on demand)")
-        
-        # Initialize session state
-        if 'model_loaded' not in st.session_state:
-            st.session_state.model_loaded = False
-            logger.info("📝 Session state: model_loaded initialized as False")
-        if 'current_image' not in st.session_state:
-            st.session_state.current_image = None
-            logger.info("📝 Session state: current_image initialized as None")
-        if 'current_predictions' not in st.session_state:
-            st.session_state.current_predictions = None
-            logger.info("📝 Session state: current_predictions initialized as None")
-        if 'adversarial_image' not in st.session_state:
-            st.session_state.adversarial_image = None
-            logger.info("📝 Session state: adversarial_image initialized as None")
-        if 'adversarial_predictions' not in st.session_state:
-            st.session_state.adversarial_predictions = None
-            logger.info("📝 Session state: adversarial_predictions initialized as None")
-        if 'image_processed' not in st.session_state:
-            st.session_state.image_processed = False
-            logger.info("📝 Session state: image_processed initialized as False")
-        if 'force_sidebar_update' not in st.session_state:
-            st.session_state.force_sidebar_update = False
-            logger.info("📝 Session state: force_sidebar_update initialized as False")
+        self._init_session_state()
         
         logger.info("✅ AdversarialComparatorApp initialization complete")
     
+    def _setup_worker_pool(self):
+        """Bound CPU use across sessions: fixed torch thread counts and a shared worker pool."""
+        performance = self.config.performance
+        intra_op_threads = resolve_intra_op_threads(performance.intra_op_threads, performance.attack_workers)
+        configure_torch_threads(intra_op_threads, performance.inter_op_threads)
+        self.worker_pool = get_worker_pool(performance.attack_workers, intra_op_threads)
+    
+    def _setup_models(self):
+        """Attach the process-wide model registry, its warm-up and any model already loaded."""
+        self.model_registry = get_model_registry(
+            self.config.model,
+            enable_quantization=self.config.performance.enable_quantization,
+            max_memory_usage=self.config.performance.max_memory_usage
+        )
+        self.model_factory = self.model_registry.factory
+        
+        # Load and warm up models in the background, once per process
+        self.warmup = None
+        if self.config.performance.enable_warmup:
+            self.warmup = get_model_warmup(self.model_registry, self.config)
+        
+        # Reuse the model if another rerun or session already loaded it
+        self.model = self.model_registry.get_cached_model()
+        if self.model is None:
+            logger.info("🤖 Model initialized as None (will be loaded on demand)")
+        else:
+            logger.info("🤖 Model reused from process-wide registry")
+    
+    def _setup_result_storage(self):
+        """Attach the in-memory result cache and the on-disk result store."""
+        performance = self.config.performance
+        
+        # Predictions and attack results keyed by image content, shared by all sessions
+        self.result_cache = None
+        if performance.enable_caching:
+            self.result_cache = get_result_cache(performance.result_cache_bytes)
+        
+        # Attack results persisted on disk, shared across restarts and worker processes
+        self.result_store = None
+        if performance.enable_result_store:
+            try:
+                self.result_store = get_result_store(performance.result_store_dir)
+            except Exception as e:
+                logger.warning(f"⚠️ Result store unavailable, attack results will not persist: {str(e)}")
+    
+    def _init_session_state(self):
+        """Initialize the session state keys this session has not set yet."""
+        defaults = {
+            'model_loaded': self.model is not None,
+            'current_image': None,
+            'current_predictions': None,
+            'adversarial_image': None,
+            'adversarial_predictions': None,
+            'processed_file_id': None,
+            'epsilon_sweep': None,
+            'force_sidebar_update': False,
+            'image_hash': None,
+            'attack_job_id': None,
+            'attack_job_image_hash': None
+        }
+        for key, value in defaults.items():
+            if key not in st.session_state:
+                st.session_state[key] = value
+                logger.info(f"📝 Session state: {key} initialized as {value}")
+    
     def setup_page(self):
         """Setup page configuration."""
         st.set_page_config(
@@ -94,6 +145,32 @@ class AdversarialComparatorApp:
             layout=self.config.ui.layout
         )
     
+    def render_warmup_status(self):
+        """Show whether the background model warm-up has finished."""
+        if self.warmup is None:
+            return
+        
+        status = self.warmup.get_status()
+        if status["ready"]:
+            st.caption("✅ Model warmed up")
+        elif status["state"] == "failed":
+            st.caption(f"⚠️ Warm-up failed, model loads on first upload: {status['error']}")
+        else:
+            st.caption("⏳ Warming up model in the background...")
+    
+    def render_cache_status(self):
+        """Show result cache and result store usage."""
+        if self.result_cache is not None:
+            stats = self.result_cache.get_stats()
+            st.caption(
+                f"⚡ Result cache: {stats['hits']} hits / {stats['misses']} misses, "
+                f"{stats['bytes'] / (1024 * 1024):.1f} of {stats['max_bytes'] / (1024 * 1024):.0f} MB"
+            )
+        
+        if self.result_store is not None:
+            stats = self.result_store.get_stats()
+            st.caption(f"💾 Stored attack runs: {stats['runs']} ({stats['bytes'] / (1024 * 1024):.1f} MB)")
+    
     def render_header(self):
         """Render application header."""
         st.title("🎯 Adversarial Comparator")
@@ -117,7 +194,7 @@ class AdversarialComparatorApp:
         logger.info("⚙️ Rendering sidebar controls")
         logger.info(f"📊 Session state - current_image: {st.session_state.current_image is not None}")
         logger.info(f"📊 Session state - model_loaded: {st.session_state.model_loaded}")
-        logger.info(f"📊 Session state - image_processed: {st.session_state.image_processed}")
+        logger.info(f"📊 Session state - processed_file_id: {st.session_state.processed_file_id}")
         
         with st.sidebar:
             st.header("⚙️ Configuration")
@@ -129,6 +206,8 @@ class AdversarialComparatorApp:
                 self.model_factory.list_available_models(),
                 index=0
             )
+            self.render_warmup_status()
+            self.render_cache_status()
             
             # Attack configuration
             st.subheader("Attack Settings")
@@ -147,8 +226,8 @@ class AdversarialComparatorApp:
                 help="Attack strength parameter"
             )
             
-            # Generate attack button
-            button_disabled = st.session_state.current_image is None
+            # Generate attack button (one attack job per session at a time)
+            button_disabled = st.session_state.current_image is None or st.session_state.attack_job_id is not None
             logger.info(f"🔘 Button disabled state: {button_disabled}")
             
             if st.button("🚀 Generate Attack", type="primary", disabled=button_disabled):
@@ -160,6 +239,9 @@ class AdversarialComparatorApp:
                     logger.error("❌ No image available for attack generation")
                     st.error("Please upload an image first!")
             
+            # Progress of a running attack job
+            self.render_attack_job()
+            
             # Show status
             if st.session_state.current_image is None:
                 status_msg = "📁 Upload an image to start"
@@ -213,12 +295,21 @@ class AdversarialComparatorApp:
         # Reset processed flag if no file is uploaded
         if uploaded_file is None:
             logger.info("📁 No file uploaded, resetting session state")
-            st.session_state.image_processed = False
+            st.session_state.processed_file_id = None
             st.session_state.current_image = None
+            st.session_state.image_hash = None
             st.session_state.current_predictions = None
             st.session_state.adversarial_image = None
             st.session_state.adversarial_predictions = None
+            st.session_state.epsilon_sweep = None
             st.session_state.force_sidebar_update = False
+            
+            # A running attack belongs to the removed image
+            if st.session_state.attack_job_id is not None:
+                logger.info(f"⏹️ Cancelling attack job {st.session_state.attack_job_id} for the removed image")
+                self.attack_jobs.cancel(st.session_state.attack_job_id)
+                st.session_state.attack_job_id = None
+                st.session_state.attack_job_image_hash = None
         else:
             logger.info(f"📁 File uploaded: {uploaded_file.name}")
         
@@ -247,8 +338,9 @@ class AdversarialComparatorApp:
         logger.info(f"📊 File type: {uploaded_file.type}")
         
         try:
-            # Check if we've already processed this file
-            if st.session_state.image_processed:
+            # Every upload gets its own file id, so a new file replaces the old one;
+            # uploading the same picture again is served by the result cache
+            if st.session_state.processed_file_id == uploaded_file.file_id:
                 logger.info("⏭️ File already processed, skipping...")
                 return
             
@@ -267,9 +359,9 @@ class AdversarialComparatorApp:
             file_content = uploaded_file.read()
             logger.info(f"📖 File content read: {len(file_content)} bytes")
             
-            # Load image
+            # Load image, decoding large JPEGs at a reduced scale (the model input is far smaller)
             logger.info("🖼️ Loading image from bytes...")
-            image = self.image_processor.load_image_from_bytes(file_content)
+            image = self.image_processor.load_image_from_bytes(file_content, self.config.ui.decode_min_size or None)
             logger.info(f"🖼️ Image loaded: {image.size} {image.mode}")
             
             # Validate image
@@ -280,6 +372,10 @@ class AdversarialComparatorApp:
             # Store in session state
             logger.info("💾 Storing image in session state...")
             st.session_state.current_image = image
+            st.session_state.image_hash = image_digest(image)
+            st.session_state.adversarial_image = None
+            st.session_state.adversarial_predictions = None
+            st.session_state.epsilon_sweep = None
             logger.info("✅ Image stored in session state")
             
             # Show immediate preview
@@ -288,10 +384,15 @@ class AdversarialComparatorApp:
             logger.info("🖼️ Image preview displayed")
             
             # Load model if not already loaded
+            if self.model is None and self.warmup is not None and not self.warmup.is_ready():
+                logger.info("🔥 Waiting for model warm-up...")
+                with st.spinner("Warming up model..."):
+                    self.warmup.wait(timeout=self.config.performance.model_loading_timeout)
+            
             if self.model is None:
                 logger.info("🤖 Model not loaded, loading now...")
                 with st.spinner("Loading model..."):
-                    self.model = self.model_factory.get_model()
+                    self.model = self.model_registry.get_model()
                     st.session_state.model_loaded = True
                     st.success("Model loaded successfully!")
                     logger.info("✅ Model loaded successfully")
@@ -301,10 +402,7 @@ class AdversarialComparatorApp:
             # Get predictions
             logger.info("🔮 Getting model predictions...")
             with st.spinner("Analyzing image..."):
-                image_tensor = self.model.preprocess(image)
-                logger.info(f"🔮 Image preprocessed to tensor: {image_tensor.shape}")
-                
-                st.session_state.current_predictions = self.model.get_predictions(image_tensor)
+                st.session_state.current_predictions = self.predict_image(image)
                 logger.info(f"🔮 Predictions obtained: {len(st.session_state.current_predictions)} predictions")
                 
                 # Log top prediction
@@ -313,7 +411,7 @@ class AdversarialComparatorApp:
                     logger.info(f"🏆 Top prediction: {top_pred['class_name']} ({top_pred['confidence']:.3f})")
             
             # Mark as processed to avoid reprocessing
-            st.session_state.image_processed = True
+            st.session_state.processed_file_id = uploaded_file.file_id
             st.session_state.force_sidebar_update = True
             logger.info("✅ Image processing complete, marked as processed")
             logger.info("🔄 Setting force_sidebar_update flag")
@@ -324,6 +422,96 @@ class AdversarialComparatorApp:
             st.error(f"Error processing image: {str(e)}")
             st.error(f"Technical details: {traceback.format_exc()}")
     
+    def result_key(self, operation: str, **params) -> Optional[str]:
+        """Build the result key for the current image and model, or None if caching is off."""
+        if (self.result_cache is None and self.result_store is None) or st.session_state.image_hash is None:
+            return None
+        
+        return make_cache_key(
+            st.session_state.image_hash,
+            self.model.config.model_type,
+            operation,
+            weights=self.model.get_weights_hash(),
+            quantization=self.model.quantization_mode,
+            inference_backend=self.model.inference_backend,
+            **params
+        )
+    
+    def predict_image(self, image: Image.Image) -> list:
+        """Get predictions for an image, reusing cached results for identical pixels."""
+        key = self.result_key('predict', top_k=self.config.ui.max_predictions)
+        predictions = self.lookup_result(key)
+        if predictions is not None:
+            logger.info("⚡ Predictions served from result cache")
+            return predictions
+        
+        image_tensor = self.model.preprocess(image)
+        logger.info(f"🔮 Image preprocessed to tensor: {image_tensor.shape}")
+        predictions = self.get_predictions(image_tensor)
+        
+        self.save_result(key, predictions)
+        return predictions
+    
+    def lookup_result(self, key: Optional[str], persistent: bool = False):
+        """Find a result in the memory cache, then (if persistent) in the on-disk store."""
+        if key is None:
+            return None
+        
+        if self.result_cache is not None:
+            result = self.result_cache.get(key)
+            if result is not None:
+                return result
+        
+        if persistent and self.result_store is not None:
+            try:
+                result = self.result_store.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not read result store: {str(e)}")
+                return None
+            if result is not None and self.result_cache is not None:
+                self.result_cache.put(key, result)
+            return result
+        
+        return None
+    
+    def save_result(self, key: Optional[str], result, run_info: Optional[dict] = None):
+        """Cache a result in memory and, when run_info is given, record it in the on-disk store."""
+        if key is None:
+            return
+        
+        if self.result_cache is not None:
+            self.result_cache.put(key, result)
+        
+        if run_info is not None and self.result_store is not None:
+            try:
+                self.result_store.put(key, result, **run_info)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not persist attack result: {str(e)}")
+    
+    def get_predictions(self, image_tensor: torch.Tensor) -> list:
+        """Get top-k predictions, batched with other sessions when enabled."""
+        if not self.config.performance.enable_inference_batching:
+            return run_work(self.compute_predictions, self.model, image_tensor)
+        
+        return self.compute_predictions(self.model, image_tensor)
+    
+    def compute_predictions(self, model, image_tensor: torch.Tensor) -> list:
+        """Get top-k predictions on the calling thread (used from worker threads too)."""
+        top_k = self.config.ui.max_predictions
+        if not self.config.performance.enable_inference_batching:
+            return model.get_predictions(image_tensor, top_k=top_k)
+        
+        scheduler = self.model_registry.get_scheduler(
+            model.config.model_type,
+            max_batch_size=self.config.performance.inference_max_batch_size,
+            max_wait_ms=self.config.performance.inference_max_wait_ms
+        )
+        if scheduler.model is not model:
+            # The model was evicted and reloaded since this request started
+            return model.get_predictions(image_tensor, top_k=top_k)
+        
+        return scheduler.get_predictions(image_tensor, top_k=top_k)
+    
     def generate_adversarial_attack(self, attack_type: str, epsilon: float):
         """Generate adversarial attack."""
         logger.info(f"🎯 Starting adversarial attack generation")
@@ -341,74 +529,180 @@ class AdversarialComparatorApp:
             logger.info(f"🖼️ Current image: {st.session_state.current_image.size} {st.session_state.current_image.mode}")
             
             # Ensure model is loaded
+            if self.model is None and self.warmup is not None and not self.warmup.is_ready():
+                logger.info("🔥 Waiting for model warm-up...")
+                with st.spinner("Warming up model..."):
+                    self.warmup.wait(timeout=self.config.performance.model_loading_timeout)
+            
             if self.model is None:
                 logger.info("🤖 Model not loaded, loading now...")
                 with st.spinner("Loading model..."):
-                    self.model = self.model_factory.get_model()
+                    self.model = self.model_registry.get_model()
                     st.session_state.model_loaded = True
                     logger.info("✅ Model loaded for attack generation")
             else:
                 logger.info("🤖 Model already loaded")
             
-            logger.info("🚀 Starting adversarial example generation...")
-            with st.spinner("Generating adversarial example..."):
-                # Get current image tensor
-                logger.info("🔮 Preprocessing image for attack...")
-                image_tensor = self.model.preprocess(st.session_state.current_image)
-                logger.info(f"🔮 Image tensor shape: {image_tensor.shape}")
-                
-                # Create attack
-                logger.info(f"⚔️ Creating {attack_type} attack with epsilon={epsilon}")
-                attack = self.attack_factory.get_attack(attack_type, epsilon=epsilon)
-                logger.info(f"⚔️ Attack created: {type(attack).__name__}")
-                
-                # Generate adversarial example
-                logger.info("🎯 Generating adversarial example...")
-                adversarial_tensor = attack(image_tensor, self.model.model)
-                logger.info(f"🎯 Adversarial tensor generated: {adversarial_tensor.shape}")
-                
-                # Convert back to PIL image
-                logger.info("🖼️ Converting adversarial tensor to PIL image...")
-                adversarial_image = self.image_processor.tensor_to_pil(adversarial_tensor)
-                logger.info(f"🖼️ Adversarial image created: {adversarial_image.size} {adversarial_image.mode}")
-                
-                # Store in session state
-                logger.info("💾 Storing adversarial image in session state...")
-                st.session_state.adversarial_image = adversarial_image
-                logger.info("✅ Adversarial image stored in session state")
-                
-                # Get adversarial predictions
-                logger.info("🔮 Getting adversarial predictions...")
-                st.session_state.adversarial_predictions = self.model.get_predictions(adversarial_tensor)
-                logger.info(f"🔮 Adversarial predictions obtained: {len(st.session_state.adversarial_predictions)} predictions")
-                
-                # Log adversarial predictions
-                if st.session_state.adversarial_predictions:
-                    adv_top_pred = st.session_state.adversarial_predictions[0]
-                    logger.info(f"🎯 Adversarial top prediction: {adv_top_pred['class_name']} ({adv_top_pred['confidence']:.3f})")
-                    
-                    # Compare with original
-                    if st.session_state.current_predictions:
-                        orig_top_pred = st.session_state.current_predictions[0]
-                        logger.info(f"🔄 Original vs Adversarial:")
-                        logger.info(f"   Original: {orig_top_pred['class_name']} ({orig_top_pred['confidence']:.3f})")
-                        logger.info(f"   Adversarial: {adv_top_pred['class_name']} ({adv_top_pred['confidence']:.3f})")
-                        
-                        if orig_top_pred['class_id'] != adv_top_pred['class_id']:
-                            logger.info("🎯 SUCCESS: Attack changed the prediction!")
-                        else:
-                            logger.info("🛡️ Attack did not change the prediction")
-                
-                st.success("🎯 Adversarial example generated successfully!")
-                st.balloons()
-                logger.info("🎉 Adversarial attack generation completed successfully")
-                
+            # Create attack
+            logger.info(f"⚔️ Creating {attack_type} attack with epsilon={epsilon}")
+            # The app re-runs FGSM on the same image as the epsilon slider moves, so it reuses the gradient
+            attack_options = {'cache_gradients': True} if attack_type == 'fgsm' else {}
+            attack = self.attack_factory.get_attack(attack_type, epsilon=epsilon, **attack_options)
+            logger.info(f"⚔️ Attack created: {type(attack).__name__}")
+            
+            # Same image, model and parameters as an earlier run: reuse its result
+            cache_key = self.result_key(attack_type, **attack.get_parameters())
+            cached = self.lookup_result(cache_key, persistent=True)
+            if cached is not None:
+                logger.info("⚡ Attack result served from result cache")
+                self.apply_attack_result(cached)
+                st.success("🎯 Adversarial example loaded from cache!")
+                return
+            
+            # Get current image tensor
+            logger.info("🔮 Preprocessing image for attack...")
+            image_tensor = self.model.preprocess(st.session_state.current_image)
+            logger.info(f"🔮 Image tensor shape: {image_tensor.shape}")
+            
+            # Run the attack in the background; the page polls the job across reruns
+            logger.info("🚀 Submitting adversarial attack job...")
+            model = self.model
+            run_info = {
+                'image_hash': st.session_state.image_hash,
+                'model_type': model.config.model_type,
+                'operation': attack_type,
+                'params': attack.get_parameters()
+            }
+            job = self.attack_jobs.submit(
+                attack,
+                image_tensor,
+                model.get_attack_model(),
+                finalize=lambda adversarial_tensor, job: self.finalize_attack(
+                    attack_type, attack, model, image_tensor, adversarial_tensor, job, cache_key, run_info
+                ),
+                description=f"{attack_type} (ε={epsilon:.2f})",
+                timeout=self.config.performance.attack_generation_timeout
+            )
+            st.session_state.attack_job_id = job.job_id
+            st.session_state.attack_job_image_hash = st.session_state.image_hash
+            logger.info(f"🎯 Attack job submitted: {job.job_id}")
+            
         except Exception as e:
             logger.error(f"❌ Error generating adversarial example: {str(e)}")
             logger.error(f"🔍 Technical details: {traceback.format_exc()}")
             st.error(f"Error generating adversarial example: {str(e)}")
             st.error(f"Technical details: {traceback.format_exc()}")
     
+    def finalize_attack(self, attack_type: str, attack, model, image_tensor: torch.Tensor,
+                        adversarial_tensor: torch.Tensor, job, cache_key: Optional[str] = None,
+                        run_info: Optional[dict] = None) -> dict:
+        """Post-process a finished attack on the worker thread (no Streamlit calls here)."""
+        # Convert back to PIL image
+        adversarial_image = self.image_processor.tensor_to_pil(adversarial_tensor)
+        
+        # Get adversarial predictions
+        job.update(message="Classifying adversarial image...")
+        adversarial_predictions = self.compute_predictions(model, adversarial_tensor)
+        
+        # FGSM gradients do not depend on epsilon: reuse the cached gradient for the whole curve
+        epsilon_sweep = None
+        if attack_type == "fgsm":
+            job.check_cancelled()
+            job.update(0.95, "Computing epsilon sweep from cached gradient...")
+            epsilon_sweep = self.compute_epsilon_sweep(attack, model, image_tensor)
+        
+        result = {
+            'adversarial_tensor': adversarial_tensor.detach(),
+            'adversarial_image': adversarial_image,
+            'adversarial_predictions': adversarial_predictions,
+            'epsilon_sweep': epsilon_sweep
+        }
+        job.update(message="Saving result...")
+        self.save_result(cache_key, result, run_info)
+        return result
+    
+    def render_attack_job(self):
+        """Show progress of the session's attack job and collect its results when it finishes."""
+        job = self.attack_jobs.get(st.session_state.attack_job_id)
+        if job is None:
+            st.session_state.attack_job_id = None
+            return
+        
+        # Fail jobs that have been queued or running for too long
+        job.enforce_timeout()
+        
+        status = job.get_status()
+        if not job.is_finished():
+            st.progress(status['progress'], text=f"{status['description']}: {status['message']}")
+            if st.button("⏹️ Cancel Attack"):
+                logger.info(f"⏹️ Cancelling attack job {job.job_id}")
+                job.cancel()
+            # Poll again after the rest of the page has rendered
+            self.poll_attack_job = True
+            return
+        
+        job_image_hash = st.session_state.attack_job_image_hash
+        st.session_state.attack_job_id = None
+        st.session_state.attack_job_image_hash = None
+        logger.info(f"🏁 Attack job {job.job_id} finished: {status['state']} in {status['elapsed_s']:.2f}s")
+        
+        if status['state'] == 'cancelled':
+            st.warning("⏹️ Attack cancelled")
+        elif status['state'] == 'failed':
+            logger.error(f"❌ Error generating adversarial example: {status['error']}")
+            st.error(f"Error generating adversarial example: {status['error']}")
+        elif st.session_state.current_image is None or st.session_state.image_hash != job_image_hash:
+            logger.info(f"🗑️ Discarding result of attack job {job.job_id}: the image has changed")
+        else:
+            self.apply_attack_result(job.result)
+            st.success(f"🎯 Adversarial example generated in {status['elapsed_s']:.1f}s!")
+            st.balloons()
+    
+    def apply_attack_result(self, result: dict):
+        """Show an attack result in the current session."""
+        st.session_state.adversarial_image = result['adversarial_image']
+        st.session_state.adversarial_predictions = result['adversarial_predictions']
+        st.session_state.epsilon_sweep = result['epsilon_sweep']
+        self.log_attack_outcome()
+    
+    def log_attack_outcome(self):
+        """Log the adversarial prediction against the original one."""
+        if not st.session_state.adversarial_predictions:
+            return
+        
+        adv_top_pred = st.session_state.adversarial_predictions[0]
+        logger.info(f"🎯 Adversarial top prediction: {adv_top_pred['class_name']} ({adv_top_pred['confidence']:.3f})")
+        
+        # Compare with original
+        if st.session_state.current_predictions:
+            orig_top_pred = st.session_state.current_predictions[0]
+            logger.info(f"🔄 Original vs Adversarial:")
+            logger.info(f"   Original: {orig_top_pred['class_name']} ({orig_top_pred['confidence']:.3f})")
+            logger.info(f"   Adversarial: {adv_top_pred['class_name']} ({adv_top_pred['confidence']:.3f})")
+            
+            if orig_top_pred['class_id'] != adv_top_pred['class_id']:
+                logger.info("🎯 SUCCESS: Attack changed the prediction!")
+            else:
+                logger.info("🛡️ Attack did not change the prediction")
+    
+    def compute_epsilon_sweep(self, attack, model, image_tensor: torch.Tensor) -> dict:
+        """Compute the FGSM success/confidence curve over the epsilon range."""
+        epsilons = torch.linspace(
+            self.config.attack.min_epsilon,
+            self.config.attack.max_epsilon,
+            self.config.attack.sweep_points
+        )
+        sweep = attack.sweep(image_tensor, model.get_attack_model(), epsilons)
+        logger.info(f"📈 Epsilon sweep computed for {len(epsilons)} values")
+        
+        return {
+            'epsilons': sweep['epsilons'].tolist(),
+            'confidence': sweep['confidence'][:, 0].tolist(),
+            'original_confidence': sweep['original_confidence'][:, 0].tolist(),
+            'success': sweep['success'][:, 0].tolist(),
+            'selected_epsilon': attack.epsilon
+        }
+    
     def display_results(self):
         """Display comparison results."""
         st.header("📊 Results")
@@ -440,6 +734,9 @@ class AdversarialComparatorApp:
         if (st.session_state.current_predictions and 
             st.session_state.adversarial_predictions):
             self.display_comparison_analysis()
+        
+        if st.session_state.epsilon_sweep is not None:
+            self.display_epsilon_sweep(st.session_state.epsilon_sweep)
     
     def display_predictions(self, predictions: list):
         """Display prediction results."""
@@ -516,6 +813,46 @@ class AdversarialComparatorApp:
         st.write(f"**Original**: {original_pred['class_name']} ({original_pred['confidence']:.3f})")
         st.write(f"**Adversarial**: {adversarial_pred['class_name']} ({adversarial_pred['confidence']:.3f})")
     
+    def display_epsilon_sweep(self, sweep: dict):
+        """Display FGSM confidence and success across epsilon values."""
+        st.header("📈 Epsilon Sweep")
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=sweep['epsilons'],
+            y=sweep['original_confidence'],
+            mode='lines+markers',
+            name='Original class confidence'
+        ))
+        fig.add_trace(go.Scatter(
+            x=sweep['epsilons'],
+            y=sweep['confidence'],
+            mode='lines+markers',
+            name='Top prediction confidence'
+        ))
+        fig.add_trace(go.Scatter(
+            x=sweep['epsilons'],
+            y=[1.0 if success else 0.0 for success in sweep['success']],
+            mode='markers',
+            name='Attack successful'
+        ))
+        fig.add_vline(x=sweep['selected_epsilon'], line_dash='dash')
+        
+        fig.update_layout(
+            title="FGSM Attack Strength vs. Epsilon",
+            xaxis_title="Epsilon (ε)",
+            yaxis_title="Confidence",
+            height=350
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        successful = [eps for eps, success in zip(sweep['epsilons'], sweep['success']) if success]
+        if successful:
+            st.write(f"**Smallest successful epsilon**: {min(successful):.3f}")
+        else:
+            st.write("**No epsilon in the range changed the prediction.**")
+    
     def run(self):
         """Run the application."""
         logger.info("🚀 Starting AdversarialComparatorApp")
@@ -532,6 +869,11 @@ class AdversarialComparatorApp:
         self.render_main_content()
         logger.info("🎨 Main content rendered")
         
+        # Keep polling a running attack job; the page stays interactive between reruns
+        if self.poll_attack_job:
+            time.sleep(self.config.ui.job_poll_interval)
+            st.rerun()
+        
         logger.info("✅ AdversarialComparatorApp run complete")
 
 
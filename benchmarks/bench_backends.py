@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the execution backends: eager vs. TorchScript vs. torch.compile
+
+Reports the one-off compile cost (first call) and steady-state latency of
+predict and of a PGD step (forward + backward) for each backend. Each
+backend runs in a fresh process so compile caches do not leak between them.
+
+Usage:
+    python benchmarks/bench_backends.py --model resnet18 --batch-size 1
+    python benchmarks/bench_backends.py --backends eager torchscript  # skip torch.compile
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+BACKENDS = ("eager", "torchscript", "compile")
+
+
+def time_calls(function, iterations):
+    """Return the first-call latency and the mean steady-state latency in milliseconds."""
+    start = time.perf_counter()
+    function()
+    first = (time.perf_counter() - start) * 1000
+
+    for _ in range(2):
+        function()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return first, (time.perf_counter() - start) / iterations * 1000
+
+
+def run_backend(backend, args, queue):
+    """Measure one backend and report its latencies."""
+    import torch
+    import torch.nn.functional as F
+
+    from config.settings import ModelConfig
+    from models.resnet_model import ResNet18Model, ResNet50Model
+
+    torch.manual_seed(0)
+    torch.set_num_threads(args.threads)
+
+    model_class = {"resnet18": ResNet18Model, "resnet50": ResNet50Model}[args.model]
+    config = ModelConfig(model_type=args.model, pretrained=False, input_size=(args.size, args.size), execution_backend=backend)
+    model = model_class(config)
+    image = torch.rand(args.batch_size, 3, args.size, args.size)
+    labels = torch.zeros(args.batch_size, dtype=torch.long)
+    attack_model = model.get_attack_model()
+
+    def pgd_step():
+        x = image.clone().requires_grad_(True)
+        F.cross_entropy(attack_model(x), labels, reduction="sum").backward()
+
+    try:
+        predict_first, predict_ms = time_calls(lambda: model.predict(image), args.iterations)
+        step_first, step_ms = time_calls(pgd_step, args.iterations)
+    except Exception as e:
+        queue.put((backend, None, str(e).splitlines()[0]))
+        return
+
+    queue.put((backend, (predict_first, predict_ms, step_first, step_ms), None))
+
+
+def main():
+    """Run the backend benchmark."""
+    parser = argparse.ArgumentParser(description="Compare model execution backends")
+    parser.add_argument("--model", choices=("resnet18", "resnet50"), default="resnet18")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--size", type=int, default=224)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print(f"📊 Backend benchmark: model={args.model}, batch={args.batch_size}, size={args.size}, threads={args.threads}")
+    print("=" * 84)
+    print(f"{'backend':<14}{'predict 1st':>14}{'predict (ms)':>14}{'step 1st':>14}{'step (ms)':>14}{'vs eager':>12}")
+
+    context = mp.get_context("spawn")
+    eager_step = None
+    for backend in args.backends:
+        queue = context.Queue()
+        process = context.Process(target=run_backend, args=(backend, args, queue))
+        process.start()
+        name, timings, error = queue.get()
+        process.join()
+
+        if timings is None:
+            print(f"{name:<14}unavailable: {error}")
+            continue
+
+        predict_first, predict_ms, step_first, step_ms = timings
+        if name == "eager":
+            eager_step = step_ms
+        speedup = f"{eager_step / step_ms:>11.2f}x" if eager_step else f"{'-':>12}"
+        print(f"{name:<14}{predict_first:>14.1f}{predict_ms:>14.1f}{step_first:>14.1f}{step_ms:>14.1f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark of PIL <-> tensor pixel conversions
+
+Compares the original numpy-based conversions (float astype / transpose /
+clip round trips) with the uint8 paths that scale once into their output,
+for one image and for a batch as in bulk export. Neither direction is
+zero-copy: PIL always exports the pixels to a uint8 array first, so the
+gain comes from skipping the float intermediates. For a single small
+image (--size 64) the fixed per-call overhead dominates and the new path
+is no faster than the original one.
+
+Usage:
+    python benchmarks/bench_convert.py --size 224 --batch-size 32
+    python benchmarks/bench_convert.py --size 1024 --batch-size 8
+    python benchmarks/bench_convert.py --size 64 --batch-size 32
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from utils.image_processing import images_to_pixels, pil_to_pixels, pixels_to_images
+
+
+def legacy_pil_to_tensor(image):
+    """The original pil_to_tensor: float array, scale and transpose."""
+    array = np.array(image).astype(np.float32) / 255.0
+    return torch.from_numpy(np.transpose(array, (2, 0, 1)).copy())
+
+
+def legacy_tensor_to_pil(tensor):
+    """The original tensor_to_pil: transpose, clip and * 255 in float."""
+    array = np.transpose(tensor.detach().cpu().numpy(), (1, 2, 0))
+    array = np.clip(array, 0, 1)
+    return Image.fromarray((array * 255).astype(np.uint8))
+
+
+def time_call(function, iterations):
+    """Return the mean latency of a call in milliseconds."""
+    for _ in range(3):
+        function()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    """Run the conversion benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark PIL <-> tensor conversions")
+    parser.add_argument("--size", type=int, default=224)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    rng = np.random.default_rng(0)
+    images = [Image.fromarray(rng.integers(0, 256, (args.size, args.size, 3), dtype=np.uint8)) for _ in range(args.batch_size)]
+    batch = images_to_pixels(images)
+
+    results = {
+        "pil -> tensor (1)": (
+            time_call(lambda: legacy_pil_to_tensor(images[0]), args.iterations),
+            time_call(lambda: pil_to_pixels(images[0]), args.iterations),
+        ),
+        "tensor -> pil (1)": (
+            time_call(lambda: legacy_tensor_to_pil(batch[0]), args.iterations),
+            time_call(lambda: pixels_to_images(batch[0]), args.iterations),
+        ),
+        f"pil -> tensor ({args.batch_size})": (
+            time_call(lambda: torch.stack([legacy_pil_to_tensor(image) for image in images]), args.iterations),
+            time_call(lambda: images_to_pixels(images), args.iterations),
+        ),
+        f"tensor -> pil ({args.batch_size})": (
+            time_call(lambda: [legacy_tensor_to_pil(pixels) for pixels in batch], args.iterations),
+            time_call(lambda: pixels_to_images(batch), args.iterations),
+        ),
+    }
+
+    print(f"📊 conversion benchmark: size={args.size}, batch={args.batch_size}, threads={args.threads}")
+    print("=" * 60)
+    print(f"{'':<24}{'legacy':>10}{'current':>10}{'speedup':>10}")
+    for name, (legacy, current) in results.items():
+        print(f"{name:<24}{legacy:>8.2f}ms{current:>8.2f}ms{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark of upload decoding: full-resolution vs. reduced-scale JPEG decode
+
+Encodes a synthetic photo-sized JPEG, then times decoding it (plus the
+224x224 model preprocessing) at full resolution and with the reduced-scale
+draft decode. Decoded pixel bytes stand in for peak decode memory.
+
+Usage:
+    python benchmarks/bench_decode.py --width 4032 --height 3024
+    python benchmarks/bench_decode.py --min-size 256
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config.settings import UIConfig
+from utils.image_processing import ImageProcessor, pil_to_pixels
+
+
+def make_jpeg(width, height, quality):
+    """Encode a smooth synthetic photo as JPEG bytes."""
+    rng = np.random.default_rng(0)
+    noise = torch.from_numpy(rng.random((1, 3, height // 16, width // 16), dtype=np.float32))
+    pixels = F.interpolate(noise, size=(height, width), mode="bilinear", align_corners=False)[0]
+    array = (pixels.permute(1, 2, 0) * 255).to(torch.uint8).numpy()
+
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def decode(processor, data, min_size):
+    """Decode an upload and preprocess it for a 224x224 model."""
+    image = processor.load_image_from_bytes(data, min_size)
+    image.load()
+    pixels = pil_to_pixels(image.convert("RGB").resize((224, 224), Image.Resampling.BILINEAR))
+    return image, pixels
+
+
+def time_decode(processor, data, min_size, iterations):
+    """Return the mean decode latency in milliseconds, the decoded image and the model input."""
+    decode(processor, data, min_size)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        image, pixels = decode(processor, data, min_size)
+    return (time.perf_counter() - start) / iterations * 1000, image, pixels
+
+
+def main():
+    """Run the decode benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark full vs. reduced-scale JPEG decoding")
+    parser.add_argument("--width", type=int, default=4032)
+    parser.add_argument("--height", type=int, default=3024)
+    parser.add_argument("--quality", type=int, default=90)
+    parser.add_argument("--min-size", type=int, default=UIConfig().decode_min_size)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    processor = ImageProcessor(UIConfig())
+    data = make_jpeg(args.width, args.height, args.quality)
+
+    full_ms, full_image, full_pixels = time_decode(processor, data, None, args.iterations)
+    reduced_ms, reduced_image, reduced_pixels = time_decode(processor, data, args.min_size, args.iterations)
+
+    print(f"📊 decode benchmark: {args.width}x{args.height} JPEG, {len(data) / 1e6:.1f} MB, min_size={args.min_size}")
+    print("=" * 60)
+    for name, ms, image in (("full", full_ms, full_image), ("reduced", reduced_ms, reduced_image)):
+        decoded_mb = image.width * image.height * len(image.getbands()) / 1e6
+        print(f"{name:<10}{ms:>10.1f} ms  {image.width}x{image.height}  {decoded_mb:>8.1f} MB decoded")
+
+    print(f"{'speedup':<10}{full_ms / reduced_ms:>10.1f}x")
+    print(f"{'max |Δ|':<10}{(full_pixels - reduced_pixels).abs().max().item():>10.4f} (model input, [0, 1] scale)")
+
+
+if __name__ == "__main__":
+    main()
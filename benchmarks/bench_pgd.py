@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the PGD inner loop: out-of-place reference vs. in-place engine
+
+Each variant runs in a fresh process so peak RSS is measured independently.
+
+Usage:
+    python benchmarks/bench_pgd.py --batch-size 8 --steps 40
+    python benchmarks/bench_pgd.py --model tiny  # isolate the update step from model compute
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+def reference_pgd(x, model, labels, epsilon, alpha, steps):
+    """Out-of-place PGD loop (the implementation before the in-place engine)."""
+    import torch
+    import torch.nn.functional as F
+
+    x_adv = x.clone()
+    for _ in range(steps):
+        x_adv.requires_grad_(True)
+        loss = F.cross_entropy(model(x_adv), labels, reduction="sum")
+        loss.backward()
+
+        with torch.no_grad():
+            x_adv = x_adv + alpha * x_adv.grad.sign()
+            delta = torch.clamp(x_adv - x, -epsilon, epsilon)
+            x_adv = torch.clamp(x + delta, 0, 1)
+
+    return x_adv.detach()
+
+
+def inplace_pgd(x, model, labels, epsilon, alpha, steps):
+    """In-place PGD engine from PGDAttack."""
+    from attacks.pgd_attack import PGDAttack
+
+    attack = PGDAttack(epsilon=epsilon, alpha=alpha, steps=steps, random_start=False)
+    expand = attack.expand_parameter
+    return attack._run(x, x.clone(), labels, expand(epsilon, "epsilon", x), expand(alpha, "alpha", x), model)
+
+
+VARIANTS = {"reference": reference_pgd, "inplace": inplace_pgd}
+
+
+def build_model(name):
+    """Build the benchmark model without downloading weights."""
+    import torch.nn as nn
+    import torchvision.models as models
+
+    if name == "tiny":
+        # Negligible compute, so the per-step update cost dominates
+        return nn.Sequential(nn.AdaptiveAvgPool2d(4), nn.Flatten(), nn.Linear(48, 1000)).eval()
+
+    return getattr(models, name)(weights=None).eval()
+
+
+def run_variant(name, args, queue):
+    """Run one variant and report latency and peak memory."""
+    import torch
+
+    torch.manual_seed(0)
+    torch.set_num_threads(args.threads)
+    model = build_model(args.model)
+    x = torch.rand(args.batch_size, 3, args.size, args.size)
+    with torch.no_grad():
+        labels = model(x).argmax(dim=1)
+
+    run = VARIANTS[name]
+
+    # Warm-up (allocator and kernel setup)
+    run(x, model, labels, args.epsilon, args.alpha, 2)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    run(x, model, labels, args.epsilon, args.alpha, args.steps)
+    elapsed = time.perf_counter() - start
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put(
+        {
+            "variant": name,
+            "step_ms": elapsed / args.steps * 1000,
+            "peak_rss_mb": rss_after / 1024,
+            "peak_growth_mb": (rss_after - rss_before) / 1024,
+        }
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the PGD inner loop")
+    parser.add_argument("--model", default="resnet18", help="torchvision model name or 'tiny'")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--size", type=int, default=224)
+    parser.add_argument("--steps", type=int, default=40)
+    parser.add_argument("--epsilon", type=float, default=0.03)
+    parser.add_argument("--alpha", type=float, default=0.005)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print(
+        f"⏱️ PGD benchmark: model={args.model}, batch={args.batch_size}, size={args.size}, steps={args.steps}, threads={args.threads}"
+    )
+    print("=" * 70)
+    print(f"{'variant':<12}{'step latency (ms)':>20}{'peak RSS (MB)':>18}{'peak growth (MB)':>20}")
+
+    context = mp.get_context("spawn")
+    for name in VARIANTS:
+        queue = context.Queue()
+        process = context.Process(target=run_variant, args=(name, args, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+        print(
+            f"{result['variant']:<12}{result['step_ms']:>20.2f}{result['peak_rss_mb']:>18.1f}{result['peak_growth_mb']:>20.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for BaseModel.predict: per-call setup vs. load-time setup
+
+The legacy path switched to eval mode, built a torch.device and moved the
+model on every call, under no_grad. The current path fixes placement and
+mode at load time and runs the forward under inference_mode.
+
+Usage:
+    python benchmarks/bench_predict.py --model resnet18 --iterations 200
+    python benchmarks/bench_predict.py --model tiny  # isolate the per-call overhead
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import torch
+import torch.nn as nn
+
+from config.settings import ModelConfig
+from models.resnet_model import ResNet18Model, ResNet50Model
+
+
+class TinyModel(ResNet18Model):
+    """Model with negligible compute, so the per-call overhead dominates."""
+
+    def _load_model(self):
+        self.model = nn.Sequential(nn.AdaptiveAvgPool2d(4), nn.Flatten(), nn.Linear(48, 1000))
+
+
+MODELS = {"resnet18": ResNet18Model, "resnet50": ResNet50Model, "tiny": TinyModel}
+
+
+def legacy_predict(model, image):
+    """BaseModel.predict before placement and mode were fixed at load time."""
+    model.model.eval()
+
+    device = torch.device(model.config.device)
+    image = image.to(device)
+    model.model = model.model.to(device)
+
+    with torch.no_grad():
+        return model.get_inference_model()(image)
+
+
+def legacy_overhead(model, image):
+    """Only the per-call setup of the legacy path, without the forward pass."""
+    model.model.eval()
+    device = torch.device(model.config.device)
+    image.to(device)
+    model.model = model.model.to(device)
+
+
+def time_calls(function, model, image, iterations):
+    """Return the mean latency of a call in microseconds."""
+    for _ in range(5):
+        function(model, image)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(model, image)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Run the predict benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark BaseModel.predict per-call overhead")
+    parser.add_argument("--model", choices=sorted(MODELS), default="resnet18")
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--size", type=int, default=224)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    torch.set_num_threads(args.threads)
+
+    config = ModelConfig(model_type=args.model, pretrained=False, input_size=(args.size, args.size), device="cpu")
+    model = MODELS[args.model](config)
+    image = torch.rand(args.batch_size, 3, args.size, args.size)
+
+    results = {
+        "legacy predict": time_calls(legacy_predict, model, image, args.iterations),
+        "current predict": time_calls(lambda m, x: m.predict(x), model, image, args.iterations),
+        "legacy setup only": time_calls(legacy_overhead, model, image, args.iterations),
+    }
+
+    print(f"📊 predict benchmark: model={args.model}, batch={args.batch_size}, size={args.size}, threads={args.threads}")
+    print("=" * 60)
+    for name, micros in results.items():
+        print(f"{name:<20}{micros:>12.1f} µs/call")
+
+    saved = results["legacy predict"] - results["current predict"]
+    print(f"{'saved per call':<20}{saved:>12.1f} µs ({saved / results['legacy predict']:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Report comparing quantized and fp32 inference: top-1 agreement and latency
+
+Usage:
+    python benchmarks/quantization_report.py --calibration-dir tests/ --model resnet18
+    python benchmarks/quantization_report.py --calibration-dir tests/ --no-pretrained  # offline
+"""
+
+import argparse
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import torch
+
+from config.settings import ModelConfig
+from models.model_factory import ModelFactory
+from models.quantization import compare_models, load_calibration_images, quantize_model
+
+
+def main():
+    """Run the quantization report."""
+    parser = argparse.ArgumentParser(description="Compare quantized and fp32 inference")
+    parser.add_argument("--model", default="resnet18")
+    parser.add_argument("--calibration-dir", required=True, help="Local image folder used for static calibration")
+    parser.add_argument("--eval-dir", help="Image folder used for the comparison (defaults to the calibration folder)")
+    parser.add_argument("--samples", type=int, default=32, help="Maximum number of images per folder")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    parser.add_argument("--no-pretrained", action="store_true", help="Use random weights (no download)")
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+
+    config = ModelConfig(model_type=args.model, pretrained=not args.no_pretrained, quantization_mode="none")
+    model = ModelFactory(config).get_model()
+
+    calibration = load_calibration_images(args.calibration_dir, model.preprocess, args.samples)
+    evaluation = load_calibration_images(args.eval_dir or args.calibration_dir, model.preprocess, args.samples)
+
+    print(f"📊 Quantization report: model={args.model}, eval images={evaluation.size(0)}, threads={args.threads}")
+    print("=" * 80)
+    print(f"{'mode':<10}{'top-1 agree':>14}{'top-5 overlap':>16}{'fp32 (ms)':>12}{'int8 (ms)':>12}{'speedup':>10}")
+
+    for mode in ("dynamic", "static"):
+        quantized = quantize_model(model.model, mode, calibration)
+        report = compare_models(model.model, quantized, evaluation, repeats=args.repeats)
+        print(
+            f"{mode:<10}{report['top1_agreement']:>14.3f}{report['topk_overlap']:>16.3f}"
+            f"{report['reference_latency_ms']:>12.1f}{report['candidate_latency_ms']:>12.1f}{report['speedup']:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
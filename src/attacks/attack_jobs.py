@@ -0,0 +1,312 @@
+"""
+Background attack jobs with progress reporting and cancellation
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+import torch
+import torch.nn as nn
+
+from utils.singleton import ProcessSingleton
+from utils.worker_pool import submit_work
+
+from .base_attack import AttackCancelledError, BaseAttack
+
+JOB_STATES = ("queued", "running", "done", "failed", "cancelled")
+FINISHED_STATES = ("done", "failed", "cancelled")
+
+
+class AttackJob:
+    """State of one attack running in the background."""
+
+    def __init__(self, job_id: str, description: str = "", timeout: Optional[float] = None):
+        """
+        Initialize the attack job.
+
+        Args:
+            job_id: Unique job identifier
+            description: Short label shown while the job runs
+            timeout: Seconds from submission after which the job fails (None for no limit)
+        """
+        self.job_id = job_id
+        self.description = description
+        self.timeout = timeout
+        self.timed_out = False
+        self.state = "queued"
+        self.progress = 0.0
+        self.message = "Waiting for a free worker..."
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    def update(self, progress: Optional[float] = None, message: Optional[str] = None):
+        """
+        Update the job's progress.
+
+        Args:
+            progress: Completed fraction in [0, 1]
+            message: Description of the current step or phase
+        """
+        with self._lock:
+            if progress is not None:
+                self.progress = min(max(progress, 0.0), 1.0)
+            if message is not None:
+                self.message = message
+
+    def check_cancelled(self):
+        """
+        Stop the job if cancellation was requested or its time limit has passed.
+
+        Raises:
+            AttackCancelledError: If the job has been cancelled or has timed out
+        """
+        self.enforce_timeout()
+        if self.cancel_event.is_set():
+            raise AttackCancelledError("Attack cancelled")
+
+    def enforce_timeout(self) -> bool:
+        """
+        Fail the job once it has run past its time limit.
+
+        A queued job fails immediately; a running one stops at its next step.
+
+        Returns:
+            True if the job has timed out
+        """
+        if self.timed_out:
+            return True
+        if self.timeout is None or self.is_finished() or time.time() - self.created_at <= self.timeout:
+            return False
+
+        self.timed_out = True
+        self.cancel_event.set()
+        if self.future is not None and self.future.cancel():
+            self._finish("failed", error=self.timeout_error(), message="Attack timed out")
+        return True
+
+    def timeout_error(self) -> str:
+        """
+        Get the error message of a timed-out job.
+
+        Returns:
+            Error message
+        """
+        return f"Attack timed out after {self.timeout:g}s"
+
+    def cancel(self):
+        """Request cancellation; a queued job never starts, a running one stops at its next step."""
+        self.cancel_event.set()
+        if self.future is not None and self.future.cancel():
+            self._finish("cancelled", message="Attack cancelled")
+
+    def is_finished(self) -> bool:
+        """
+        Check whether the job has stopped.
+
+        Returns:
+            True if the job is done, failed or cancelled
+        """
+        return self.state in FINISHED_STATES
+
+    def get_status(self) -> dict:
+        """
+        Get a snapshot of the job state for rendering.
+
+        Returns:
+            Dictionary with state, progress, message, error and elapsed time
+        """
+        with self._lock:
+            end = self.finished_at if self.finished_at is not None else time.time()
+            return {
+                "job_id": self.job_id,
+                "description": self.description,
+                "state": self.state,
+                "progress": self.progress,
+                "message": self.message,
+                "error": self.error,
+                "elapsed_s": end - self.created_at,
+            }
+
+    def _start(self):
+        """Mark the job as running."""
+        with self._lock:
+            self.state = "running"
+            self.message = "Running attack..."
+
+    def _finish(self, state: str, result: Any = None, error: Optional[str] = None, message: Optional[str] = None):
+        """
+        Record the final state of the job.
+
+        Args:
+            state: Final state
+            result: Job result
+            error: Error message
+            message: Final message
+        """
+        with self._lock:
+            if self.state in FINISHED_STATES:
+                return
+            self.state = state
+            self.result = result
+            self.error = error
+            if state == "done":
+                self.progress = 1.0
+            if message is not None:
+                self.message = message
+            self.finished_at = time.time()
+
+
+class AttackJobManager:
+    """Runs attacks on the shared worker pool and keeps their state across reruns."""
+
+    def __init__(self, max_finished_jobs: int = 64):
+        """
+        Initialize the job manager.
+
+        Args:
+            max_finished_jobs: Number of finished jobs kept for polling before the oldest are dropped
+        """
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: "OrderedDict[str, AttackJob]" = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        attack: BaseAttack,
+        image: torch.Tensor,
+        model: nn.Module,
+        finalize: Optional[Callable[[torch.Tensor, AttackJob], Any]] = None,
+        description: str = "",
+        timeout: Optional[float] = None,
+    ) -> AttackJob:
+        """
+        Submit an attack as a background job.
+
+        Args:
+            attack: Attack to run; its progress callback and cancel event are wired to the job
+            image: Input image tensor (B, C, H, W)
+            model: Target model
+            finalize: Optional post-processing run on the worker as finalize(adversarial, job);
+                its return value becomes the job result (default: the adversarial tensor)
+            description: Short label shown while the job runs
+            timeout: Seconds from submission after which the job fails (None for no limit)
+
+        Returns:
+            The queued job
+        """
+        with self._lock:
+            job = AttackJob(f"attack-{next(self._ids)}", description, timeout)
+            self._jobs[job.job_id] = job
+            self._prune()
+
+        job.future = submit_work(self._run, job, attack, image, model, finalize)
+        return job
+
+    def get(self, job_id: Optional[str]) -> Optional[AttackJob]:
+        """
+        Get a job by identifier.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job, or None if it is unknown or has been dropped
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: Optional[str]) -> bool:
+        """
+        Request cancellation of a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if the job exists
+        """
+        job = self.get(job_id)
+        if job is None:
+            return False
+        job.cancel()
+        return True
+
+    def _run(
+        self,
+        job: AttackJob,
+        attack: BaseAttack,
+        image: torch.Tensor,
+        model: nn.Module,
+        finalize: Optional[Callable[[torch.Tensor, AttackJob], Any]],
+    ):
+        """
+        Worker-side body of a job.
+
+        Args:
+            job: Job being run
+            attack: Attack to run
+            image: Input image tensor
+            model: Target model
+            finalize: Optional post-processing
+        """
+        try:
+            job.check_cancelled()
+            job._start()
+
+            # Attack steps fill the first 90%, post-processing the rest
+            def on_progress(completed: int, total: int):
+                job.update(0.9 * completed / total, f"Step {completed}/{total}")
+                job.enforce_timeout()
+
+            attack.set_progress_callback(on_progress)
+            attack.set_cancel_event(job.cancel_event)
+            try:
+                adversarial = attack(image, model)
+            finally:
+                attack.set_progress_callback(None)
+                attack.set_cancel_event(None)
+
+            job.check_cancelled()
+            job.update(0.9, "Analyzing adversarial image...")
+            result = finalize(adversarial, job) if finalize is not None else adversarial
+            job._finish("done", result=result, message="Attack complete")
+
+        except AttackCancelledError:
+            if job.timed_out:
+                job._finish("failed", error=job.timeout_error(), message="Attack timed out")
+            else:
+                job._finish("cancelled", message="Attack cancelled")
+        except Exception as e:
+            job._finish("failed", error=str(e), message="Attack failed")
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond the retention limit. Must be called with the lock held."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished()]
+        for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+
+_manager: ProcessSingleton[AttackJobManager] = ProcessSingleton()
+
+
+def get_attack_job_manager() -> AttackJobManager:
+    """
+    Get the process-wide attack job manager, creating it on first use.
+
+    Jobs outlive the Streamlit rerun that submitted them, so later reruns
+    look them up here by id to poll progress or cancel.
+
+    Returns:
+        Shared job manager
+    """
+    return _manager.get(AttackJobManager)
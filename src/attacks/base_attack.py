@@ -2,9 +2,10 @@
 Base attack class for Adversarial Comparator
 """
 
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
 import torch
 import torch.nn as nn
@@ -22,6 +23,8 @@ class BaseAttack(ABC):
         """
         self.parameters = kwargs
         self.attack_time: Optional[float] = None
+        self.progress_callback: Optional[Callable[[int, int], None]] = None
+        self.cancel_event: Optional[threading.Event] = None
 
     @abstractmethod
     def __call__(self, image: torch.Tensor, model: nn.Module) -> torch.Tensor:
@@ -74,6 +77,43 @@ class BaseAttack(ABC):
 
         return wrapper
 
+    def set_progress_callback(self, callback: Optional[Callable[[int, int], None]]):
+        """
+        Set the function called as callback(completed_steps, total_steps) while the attack runs.
+
+        Args:
+            callback: Progress callback, or None to disable
+        """
+        self.progress_callback = callback
+
+    def set_cancel_event(self, event: Optional[threading.Event]):
+        """
+        Set the event that cancels the attack when set.
+
+        Iterative attacks check it after every step.
+
+        Args:
+            event: Cancellation event, or None to disable
+        """
+        self.cancel_event = event
+
+    def report_progress(self, completed: int, total: int):
+        """
+        Report progress and stop the attack if cancellation was requested.
+
+        Args:
+            completed: Number of completed steps
+            total: Total number of steps
+
+        Raises:
+            AttackCancelledError: If the cancel event is set
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(completed, total)
+
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise AttackCancelledError(f"Attack cancelled after {completed}/{total} steps")
+
     def validate_inputs(self, image: torch.Tensor, model: nn.Module) -> bool:
         """
         Validate input parameters.
@@ -95,8 +135,8 @@ class BaseAttack(ABC):
         if image.dim() != 4:
             raise ValueError("Image must be 4-dimensional (B, C, H, W)")
 
-        if image.size(0) != 1:
-            raise ValueError("Currently only supports batch size of 1")
+        if image.size(0) < 1:
+            raise ValueError("Image batch must contain at least one sample")
 
         # Check model
         if not isinstance(model, nn.Module):
@@ -104,6 +144,65 @@ class BaseAttack(ABC):
 
         return True
 
+    def expand_parameter(self, value: Union[float, int, torch.Tensor], name: str, reference: torch.Tensor) -> torch.Tensor:
+        """
+        Broadcast a scalar or per-sample parameter to the batch.
+
+        Args:
+            value: Scalar value or tensor with one entry per sample (B,)
+            name: Parameter name used in error messages
+            reference: Image batch (B, C, H, W) the parameter applies to
+
+        Returns:
+            Tensor of shape (B, 1, 1, 1) on the device and dtype of ``reference``
+
+        Raises:
+            InvalidAttackParametersError: If a tensor does not have one value per sample
+        """
+        batch_size = reference.size(0)
+        if not isinstance(value, torch.Tensor):
+            return torch.full((batch_size, 1, 1, 1), float(value), device=reference.device, dtype=reference.dtype)
+
+        value = value.detach().to(device=reference.device, dtype=reference.dtype)
+        if value.dim() == 0:
+            value = value.expand(batch_size)
+        value = value.reshape(-1)
+        if value.numel() != batch_size:
+            raise InvalidAttackParametersError(
+                f"{name} must have one value per sample: got {value.numel()}, batch size {batch_size}"
+            )
+
+        return value.view(batch_size, 1, 1, 1)
+
+    def expand_target(self, target: Union[int, torch.Tensor], reference: torch.Tensor) -> torch.Tensor:
+        """
+        Broadcast a scalar or per-sample target class to the batch.
+
+        Args:
+            target: Class index or tensor of class indices (B,)
+            reference: Image batch (B, C, H, W) the targets apply to
+
+        Returns:
+            Long tensor of shape (B,) on the device of ``reference``
+
+        Raises:
+            InvalidAttackParametersError: If a tensor does not have one target per sample
+        """
+        batch_size = reference.size(0)
+        if not isinstance(target, torch.Tensor):
+            return torch.full((batch_size,), int(target), device=reference.device, dtype=torch.long)
+
+        target = target.detach().to(device=reference.device, dtype=torch.long)
+        if target.dim() == 0:
+            target = target.expand(batch_size)
+        target = target.reshape(-1)
+        if target.numel() != batch_size:
+            raise InvalidAttackParametersError(
+                f"target_class must have one value per sample: got {target.numel()}, batch size {batch_size}"
+            )
+
+        return target
+
     def clip_to_valid_range(self, image: torch.Tensor) -> torch.Tensor:
         """
         Clip image to valid range [0, 1].
@@ -116,34 +215,61 @@ class BaseAttack(ABC):
         """
         return torch.clamp(image, 0, 1)
 
-    def compute_perturbation_norm(self, original: torch.Tensor, adversarial: torch.Tensor) -> float:
+    def compute_perturbation_norm(
+        self, original: torch.Tensor, adversarial: torch.Tensor, per_sample: bool = False
+    ) -> Union[float, torch.Tensor]:
         """
         Compute L2 norm of perturbation.
 
         Args:
             original: Original image tensor
             adversarial: Adversarial image tensor
+            per_sample: Return one norm per batch entry instead of a single value
 
         Returns:
-            L2 norm of perturbation
+            L2 norm of perturbation, or tensor of shape (B,) if ``per_sample``
         """
         perturbation = adversarial - original
+        if per_sample:
+            return perturbation.flatten(1).norm(p=2, dim=1)
         return torch.norm(perturbation, p=2).item()
 
-    def compute_perturbation_linf(self, original: torch.Tensor, adversarial: torch.Tensor) -> float:
+    def compute_perturbation_linf(
+        self, original: torch.Tensor, adversarial: torch.Tensor, per_sample: bool = False
+    ) -> Union[float, torch.Tensor]:
         """
         Compute L-infinity norm of perturbation.
 
         Args:
             original: Original image tensor
             adversarial: Adversarial image tensor
+            per_sample: Return one norm per batch entry instead of a single value
 
         Returns:
-            L-infinity norm of perturbation
+            L-infinity norm of perturbation, or tensor of shape (B,) if ``per_sample``
         """
         perturbation = adversarial - original
+        if per_sample:
+            return perturbation.flatten(1).abs().amax(dim=1)
         return torch.norm(perturbation, p=float("inf")).item()
 
+    def compute_success(self, model: nn.Module, original: torch.Tensor, adversarial: torch.Tensor) -> torch.Tensor:
+        """
+        Check which samples had their top-1 prediction changed.
+
+        Args:
+            model: Target model
+            original: Original image batch (B, C, H, W)
+            adversarial: Adversarial image batch (B, C, H, W)
+
+        Returns:
+            Boolean tensor of shape (B,)
+        """
+        with torch.no_grad():
+            original_class = model(original).argmax(dim=1)
+            adversarial_class = model(adversarial).argmax(dim=1)
+        return original_class != adversarial_class
+
 
 class AttackGenerationError(Exception):
     """Exception raised when attack generation fails."""
@@ -155,3 +281,9 @@ class InvalidAttackParametersError(Exception):
     """Exception raised when attack parameters are invalid."""
 
     pass
+
+
+class AttackCancelledError(Exception):
+    """Exception raised when a running attack is cancelled."""
+
+    pass
@@ -2,7 +2,12 @@
 FGSM (Fast Gradient Sign Method) attack implementation
 """
 
-from typing import Optional
+import hashlib
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 import torch
 import torch.nn as nn
@@ -14,16 +19,27 @@ from .base_attack import AttackGenerationError, BaseAttack
 class FGSMAttack(BaseAttack):
     """Fast Gradient Sign Method attack."""
 
-    def __init__(self, epsilon: float = 0.1, **kwargs):
+    # The FGSM gradient does not depend on epsilon, so instances created with
+    # cache_gradients=True share gradient signs per (model, weights, input).
+    # Signs are stored as int8; the cache is bounded by bytes.
+    gradient_cache_bytes: int = 64 * 1024 * 1024
+    _gradient_cache: "OrderedDict[Tuple, _GradientEntry]" = OrderedDict()
+    _gradient_cache_used: int = 0
+    _gradient_cache_lock = threading.RLock()
+
+    def __init__(self, epsilon: Union[float, torch.Tensor] = 0.1, cache_gradients: bool = False, **kwargs):
         """
         Initialize FGSM attack.
 
         Args:
-            epsilon: Attack strength parameter (maximum perturbation)
+            epsilon: Attack strength parameter (maximum perturbation), scalar or one value per sample (B,)
+            cache_gradients: Reuse gradient signs across epsilons for the same model and input
+                (for interactive epsilon changes; one-off and large batched attacks should leave it off)
             **kwargs: Additional parameters
         """
         super().__init__(epsilon=epsilon, **kwargs)
         self.epsilon = epsilon
+        self.cache_gradients = cache_gradients
 
     def __call__(self, image: torch.Tensor, model: nn.Module) -> torch.Tensor:
         """
@@ -43,35 +59,188 @@ class FGSMAttack(BaseAttack):
             # Validate inputs
             self.validate_inputs(image, model)
 
-            # Ensure image requires gradients
-            image = image.clone().detach().requires_grad_(True)
-
-            # Forward pass
-            output = model(image)
-
-            # Get predicted class
-            predicted_class = output.argmax(dim=1)
-
-            # Compute loss
-            loss = F.cross_entropy(output, predicted_class)
+            epsilon = self.expand_parameter(self.epsilon, "epsilon", image)
 
-            # Backward pass to compute gradients
-            loss.backward()
+            # Gradient sign of the loss w.r.t. the input (cached across epsilons)
+            grad_sign, _ = self.compute_gradient_sign(image, model)
 
             # Generate perturbation using gradient sign
-            perturbation = self.epsilon * image.grad.sign()
+            perturbation = epsilon * grad_sign.to(image.dtype)
 
             # Apply perturbation
-            adversarial_image = image + perturbation
+            adversarial_image = image.detach() + perturbation
 
             # Clip to valid range [0, 1]
             adversarial_image = self.clip_to_valid_range(adversarial_image)
 
-            return adversarial_image.detach()
+            return adversarial_image
 
         except Exception as e:
             raise AttackGenerationError(f"FGSM attack failed: {str(e)}")
 
+    def compute_gradient_sign(self, image: torch.Tensor, model: nn.Module) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Compute the sign of the input gradient, reusing a cached result when caching is enabled.
+
+        Cached entries hold a weak reference to the model and a version of its
+        weights, so a new model that reuses a freed model's id, or weights
+        reloaded into the same module, never see stale signs. The input is
+        keyed by a digest of its values, so re-preprocessing the same image on
+        a later rerun still hits the cache.
+
+        Args:
+            image: Input image tensor (B, C, H, W)
+            model: Target model to attack
+
+        Returns:
+            Tuple of (gradient sign as int8 (B, C, H, W), predicted class (B,))
+        """
+        key = None
+        if self.cache_gradients:
+            key = (id(model), tuple(image.shape), str(image.dtype), _tensor_digest(image))
+            version = _weights_version(model)
+            with self._gradient_cache_lock:
+                entry = self._gradient_cache.get(key)
+                if entry is not None and entry.model() is model and entry.version == version:
+                    self._gradient_cache.move_to_end(key)
+                    return entry.result
+
+        # Ensure image requires gradients
+        image = image.clone().detach().requires_grad_(True)
+
+        # Forward pass
+        output = model(image)
+
+        # Get predicted class
+        predicted_class = output.argmax(dim=1)
+
+        # Compute loss (summed so each sample's gradient is independent of batch size)
+        loss = F.cross_entropy(output, predicted_class, reduction="sum")
+
+        # Backward pass to compute gradients
+        loss.backward()
+
+        result = (image.grad.sign().to(torch.int8), predicted_class.detach())
+
+        if key is not None:
+            self._cache_gradient(key, model, version, result)
+
+        return result
+
+    @classmethod
+    def _cache_gradient(cls, key: Tuple, model: nn.Module, version: Tuple, result: Tuple[torch.Tensor, torch.Tensor]):
+        """
+        Store a gradient sign, evicting the least recently used entries over the byte budget.
+
+        Args:
+            key: Cache key
+            model: Model the gradient was computed for
+            version: Weights version of the model
+            result: Gradient sign and predicted class
+        """
+        size = sum(tensor.element_size() * tensor.nelement() for tensor in result)
+        if size > cls.gradient_cache_bytes:
+            return
+
+        # Entries of a model are dropped as soon as the model is freed
+        model_ref = weakref.ref(model, lambda _, model_id=id(model): cls._forget_model(model_id))
+
+        with cls._gradient_cache_lock:
+            previous = cls._gradient_cache.pop(key, None)
+            if previous is not None:
+                cls._gradient_cache_used -= previous.size
+            cls._gradient_cache[key] = _GradientEntry(model_ref, version, result, size)
+            cls._gradient_cache_used += size
+
+            while cls._gradient_cache_used > cls.gradient_cache_bytes:
+                _, evicted = cls._gradient_cache.popitem(last=False)
+                cls._gradient_cache_used -= evicted.size
+
+    @classmethod
+    def _forget_model(cls, model_id: int):
+        """
+        Drop the cached gradients of a freed model.
+
+        Args:
+            model_id: id() of the freed model
+        """
+        with cls._gradient_cache_lock:
+            for key in [key for key, entry in cls._gradient_cache.items() if key[0] == model_id and entry.model() is None]:
+                cls._gradient_cache_used -= cls._gradient_cache.pop(key).size
+
+    def sweep(
+        self, image: torch.Tensor, model: nn.Module, epsilons: Union[Sequence[float], torch.Tensor]
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Evaluate FGSM over a range of epsilons with a single gradient computation.
+
+        All adversarial examples are classified in one batched forward pass.
+
+        Args:
+            image: Input image tensor (B, C, H, W)
+            model: Target model to attack
+            epsilons: Epsilon values to evaluate (E,)
+
+        Returns:
+            Dictionary with tensors indexed by (epsilon, sample):
+                - epsilons: (E,)
+                - adversarial: (E, B, C, H, W)
+                - predicted_class: (E, B)
+                - confidence: top-1 probability of the adversarial example (E, B)
+                - original_confidence: probability of the clean prediction (E, B)
+                - success: whether the prediction changed (E, B)
+
+        Raises:
+            AttackGenerationError: If the sweep fails
+        """
+        try:
+            self.validate_inputs(image, model)
+
+            epsilons = torch.as_tensor(epsilons, dtype=image.dtype, device=image.device).reshape(-1)
+            grad_sign, original_class = self.compute_gradient_sign(image, model)
+
+            # (E, 1, 1, 1, 1) * (1, B, C, H, W) -> (E, B, C, H, W)
+            perturbation = epsilons.view(-1, 1, 1, 1, 1) * grad_sign.to(image.dtype).unsqueeze(0)
+            adversarial = self.clip_to_valid_range(image.detach().unsqueeze(0) + perturbation)
+
+            num_epsilons, batch_size = adversarial.shape[:2]
+            with torch.no_grad():
+                logits = model(adversarial.flatten(0, 1))
+                probabilities = torch.softmax(logits, dim=1).view(num_epsilons, batch_size, -1)
+
+            confidence, predicted_class = probabilities.max(dim=2)
+            original_index = original_class.view(1, batch_size, 1).expand(num_epsilons, batch_size, 1)
+            original_confidence = probabilities.gather(2, original_index).squeeze(2)
+
+            return {
+                "epsilons": epsilons,
+                "adversarial": adversarial,
+                "predicted_class": predicted_class,
+                "confidence": confidence,
+                "original_confidence": original_confidence,
+                "success": predicted_class != original_class.unsqueeze(0),
+            }
+
+        except Exception as e:
+            raise AttackGenerationError(f"FGSM sweep failed: {str(e)}")
+
+    @classmethod
+    def clear_gradient_cache(cls):
+        """Clear the cached input gradients."""
+        with cls._gradient_cache_lock:
+            cls._gradient_cache.clear()
+            cls._gradient_cache_used = 0
+
+    @classmethod
+    def get_gradient_cache_bytes(cls) -> int:
+        """
+        Get the memory held by cached gradient signs.
+
+        Returns:
+            Size in bytes
+        """
+        return cls._gradient_cache_used
+
     def get_attack_info(self) -> dict:
         """
         Get information about the FGSM attack.
@@ -90,13 +259,18 @@ class FGSMAttack(BaseAttack):
 class FGSMWithTargetAttack(BaseAttack):
     """FGSM attack with target class."""
 
-    def __init__(self, epsilon: float = 0.1, target_class: Optional[int] = None, **kwargs):
+    def __init__(
+        self,
+        epsilon: Union[float, torch.Tensor] = 0.1,
+        target_class: Optional[Union[int, torch.Tensor]] = None,
+        **kwargs,
+    ):
         """
         Initialize targeted FGSM attack.
 
         Args:
-            epsilon: Attack strength parameter
-            target_class: Target class to fool the model into predicting
+            epsilon: Attack strength parameter, scalar or one value per sample (B,)
+            target_class: Target class to fool the model into predicting, scalar or one class per sample (B,)
             **kwargs: Additional parameters
         """
         super().__init__(epsilon=epsilon, target_class=target_class, **kwargs)
@@ -118,6 +292,8 @@ class FGSMWithTargetAttack(BaseAttack):
             # Validate inputs
             self.validate_inputs(image, model)
 
+            epsilon = self.expand_parameter(self.epsilon, "epsilon", image)
+
             # Ensure image requires gradients
             image = image.clone().detach().requires_grad_(True)
 
@@ -129,16 +305,16 @@ class FGSMWithTargetAttack(BaseAttack):
                 # Use least likely class as target
                 target_class = output.argmin(dim=1)
             else:
-                target_class = torch.tensor([self.target_class], device=image.device)
+                target_class = self.expand_target(self.target_class, image)
 
             # Compute loss (negative because we want to maximize loss for target class)
-            loss = -F.cross_entropy(output, target_class)
+            loss = -F.cross_entropy(output, target_class, reduction="sum")
 
             # Backward pass to compute gradients
             loss.backward()
 
             # Generate perturbation using gradient sign
-            perturbation = self.epsilon * image.grad.sign()
+            perturbation = epsilon * image.grad.sign()
 
             # Apply perturbation
             adversarial_image = image + perturbation
@@ -165,3 +341,46 @@ class FGSMWithTargetAttack(BaseAttack):
             "description": "Fast Gradient Sign Method with target class",
             "parameters": self.get_parameters(),
         }
+
+
+class _GradientEntry:
+    """Cached gradient sign of one (model, weights, input)."""
+
+    __slots__ = ("model", "version", "result", "size")
+
+    def __init__(self, model: "weakref.ref", version: Tuple, result: Tuple[torch.Tensor, torch.Tensor], size: int):
+        self.model = model
+        self.version = version
+        self.result = result
+        self.size = size
+
+
+def _weights_version(model: nn.Module) -> Tuple:
+    """
+    Get a cheap version of a model's weights.
+
+    Parameters and buffers are identified by their storage and in-place
+    version counter, so replacing or updating any of them (e.g. through
+    load_state_dict) changes the version.
+
+    Args:
+        model: Model
+
+    Returns:
+        Hashable weights version
+    """
+    return tuple((tensor.data_ptr(), tensor._version) for tensor in itertools.chain(model.parameters(), model.buffers()))
+
+
+def _tensor_digest(tensor: torch.Tensor) -> str:
+    """
+    Compute a content digest of a tensor's values.
+
+    Args:
+        tensor: Tensor to hash
+
+    Returns:
+        Hex digest of the tensor data
+    """
+    array = tensor.detach().cpu().contiguous().numpy()
+    return hashlib.blake2b(array.data, digest_size=16).hexdigest()
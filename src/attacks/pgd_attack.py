@@ -2,12 +2,12 @@
 PGD (Projected Gradient Descent) Attack Implementation
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 import torch
 import torch.nn.functional as F
 
-from .base_attack import BaseAttack
+from .base_attack import BaseAttack, InvalidAttackParametersError
 
 
 class PGDAttack(BaseAttack):
@@ -15,30 +15,57 @@ class PGDAttack(BaseAttack):
 
     def __init__(
         self,
-        epsilon: float = 0.3,
-        alpha: float = 0.01,
+        epsilon: Union[float, torch.Tensor] = 0.3,
+        alpha: Union[float, torch.Tensor] = 0.01,
         steps: int = 40,
         random_start: bool = True,
         targeted: bool = False,
+        target_class: Optional[Union[int, torch.Tensor]] = None,
+        early_stop: bool = False,
+        n_restarts: int = 1,
         **kwargs,
     ):
         """
         Initialize PGD Attack.
 
         Args:
-            epsilon: Maximum perturbation size
-            alpha: Step size for each iteration
+            epsilon: Maximum perturbation size, scalar or one value per sample (B,)
+            alpha: Step size for each iteration, scalar or one value per sample (B,)
             steps: Number of iterations
-            random_start: Whether to start from random perturbation
+            random_start: Whether to start from a random point inside the epsilon ball
             targeted: Whether to perform targeted attack
+            target_class: Target class for targeted attacks, scalar or one class per sample (B,)
+            early_stop: Stop iterating on each sample as soon as the attack succeeds
+            n_restarts: Number of random restarts per sample, run together as one stacked batch
             **kwargs: Additional arguments for base class
         """
-        super().__init__(epsilon=epsilon, alpha=alpha, steps=steps, random_start=random_start, targeted=targeted, **kwargs)
+        super().__init__(
+            epsilon=epsilon,
+            alpha=alpha,
+            steps=steps,
+            random_start=random_start,
+            targeted=targeted,
+            target_class=target_class,
+            early_stop=early_stop,
+            n_restarts=n_restarts,
+            **kwargs,
+        )
         self.epsilon = epsilon
         self.alpha = alpha
         self.steps = steps
         self.random_start = random_start
         self.targeted = targeted
+        self.target_class = target_class
+        self.early_stop = early_stop
+        self.n_restarts = n_restarts
+        self.steps_taken: Optional[torch.Tensor] = None
+        self.best_restart: Optional[torch.Tensor] = None
+
+        if self.n_restarts < 1:
+            raise InvalidAttackParametersError("n_restarts must be at least 1")
+
+        if self.targeted and self.target_class is None:
+            raise InvalidAttackParametersError("Targeted PGD requires target_class")
 
     def __call__(self, x: torch.Tensor, model: torch.nn.Module) -> torch.Tensor:
         """
@@ -51,49 +78,194 @@ class PGDAttack(BaseAttack):
         Returns:
             Adversarial tensor
         """
+        self.validate_inputs(x, model)
         model.eval()
 
+        epsilon = self.expand_parameter(self.epsilon, "epsilon", x)
+        alpha = self.expand_parameter(self.alpha, "alpha", x)
+        labels = self._get_labels(x, model)
+
         # Clone input to avoid modifying original
-        x_adv = x.clone().detach()
+        x = x.detach()
+        batch_size = x.size(0)
 
-        # Random start
-        if self.random_start:
-            x_adv = x_adv + torch.randn_like(x_adv) * 0.001
+        # Stack restarts along the batch dimension (restart-major)
+        if self.n_restarts > 1:
+            x, labels, epsilon, alpha = (
+                t.repeat(self.n_restarts, *([1] * (t.dim() - 1))) for t in (x, labels, epsilon, alpha)
+            )
 
-        # PGD iterations
-        for _ in range(self.steps):
-            x_adv.requires_grad_(True)
+        # Random start (always used with restarts, which would otherwise be identical)
+        if self.random_start or self.n_restarts > 1:
+            x_adv = x + (torch.rand_like(x) * 2 - 1) * epsilon
+            x_adv = torch.clamp(x_adv, 0, 1)
+        else:
+            x_adv = x.clone()
 
-            # Forward pass
-            outputs = model(x_adv)
+        x_adv = self._run(x, x_adv, labels, epsilon, alpha, model)
+
+        if self.n_restarts > 1:
+            x_adv = self._select_best_restart(x_adv, labels, model, batch_size)
+
+        return x_adv
 
-            # Calculate loss
+    def _select_best_restart(
+        self, x_adv: torch.Tensor, labels: torch.Tensor, model: torch.nn.Module, batch_size: int
+    ) -> torch.Tensor:
+        """
+        Pick the best restart for each sample.
+
+        A successful restart always beats an unsuccessful one; ties are broken
+        by the attack objective (highest loss, or lowest target loss).
+
+        Args:
+            x_adv: Adversarial tensors for all restarts (R * B, C, H, W)
+            labels: Labels the loss is computed against (R * B,)
+            model: Target model
+            batch_size: Number of original samples B
+
+        Returns:
+            Best adversarial tensor per sample (B, C, H, W)
+        """
+        with torch.no_grad():
+            outputs = model(x_adv)
+            objective = F.cross_entropy(outputs, labels, reduction="none")
             if self.targeted:
-                # For targeted attack, we would need target labels
-                # For now, we'll use untargeted attack
-                loss = F.cross_entropy(outputs, outputs.argmax(dim=1))
-            else:
-                # Untargeted attack: maximize loss
-                loss = -F.cross_entropy(outputs, outputs.argmax(dim=1))
+                objective = -objective
+            success = self._is_successful(outputs, labels)
+
+        objective = objective.view(self.n_restarts, batch_size)
+        success = success.view(self.n_restarts, batch_size)
+
+        best_successful = torch.where(success, objective, torch.full_like(objective, float("-inf"))).argmax(dim=0)
+        best = torch.where(success.any(dim=0), best_successful, objective.argmax(dim=0))
+        self.best_restart = best
+
+        samples = torch.arange(batch_size, device=x_adv.device)
+        self.steps_taken = self.steps_taken.view(self.n_restarts, batch_size)[best, samples]
+        return x_adv.view(self.n_restarts, batch_size, *x_adv.shape[1:])[best, samples]
+
+    def _run(
+        self,
+        x: torch.Tensor,
+        x_adv: torch.Tensor,
+        labels: torch.Tensor,
+        epsilon: torch.Tensor,
+        alpha: torch.Tensor,
+        model: torch.nn.Module,
+    ) -> torch.Tensor:
+        """
+        Run the PGD iterations.
+
+        The step, projection and clipping are done in place on a single leaf
+        tensor with a preallocated step buffer, so the loop itself does not
+        allocate image-sized tensors. With ``early_stop`` the working batch only
+        holds samples that have not succeeded yet: finished samples are written
+        to the output and dropped, so later forward/backward passes only cover
+        the remaining ones (buffers are only reallocated when the batch shrinks).
+
+        Args:
+            x: Clean input tensor (B, C, H, W)
+            x_adv: Starting point of the attack (B, C, H, W), updated in place
+            labels: Labels the loss is computed against (B,)
+            epsilon: Per-sample maximum perturbation (B, 1, 1, 1)
+            alpha: Per-sample step size (B, 1, 1, 1)
+            model: Target model
+
+        Returns:
+            Adversarial tensor
+        """
+        output = torch.empty_like(x) if self.early_stop else None
+        active = torch.arange(x.size(0), device=x.device)
+        self.steps_taken = torch.full((x.size(0),), self.steps, dtype=torch.long, device=x.device)
+
+        # Untargeted attack: ascend the loss of the original class
+        # Targeted attack: descend the loss of the target class
+        step_size = -alpha if self.targeted else alpha
+        lower, upper = -epsilon, epsilon
+        step_buffer = torch.empty_like(x)
+
+        x_adv = x_adv.detach().requires_grad_(True)
+
+        # PGD iterations
+        for step in range(self.steps):
+            # Forward pass
+            outputs = model(x_adv)
+            loss = F.cross_entropy(outputs, labels, reduction="sum")
 
             # Backward pass
             loss.backward()
 
             # Update perturbation
             with torch.no_grad():
-                grad = x_adv.grad.sign()
-                x_adv = x_adv + self.alpha * grad
+                # Keep successful samples at the point where they succeeded
+                if self.early_stop:
+                    done = self._is_successful(outputs, labels)
+                    if done.any():
+                        finished = active[done]
+                        output[finished] = x_adv[done]
+                        self.steps_taken[finished] = step
+
+                        keep = ~done
+                        if not keep.any():
+                            return output
+
+                        active, x, labels, lower, upper, step_size, step_buffer = (
+                            t[keep] for t in (active, x, labels, lower, upper, step_size, step_buffer)
+                        )
+                        grad = x_adv.grad[keep]
+                        x_adv = x_adv.detach()[keep].requires_grad_(True)
+                        x_adv.grad = grad
+
+                torch.sign(x_adv.grad, out=step_buffer)
+                step_buffer.mul_(step_size)
+                x_adv.add_(step_buffer)
 
                 # Project to epsilon ball
-                delta = x_adv - x
-                delta = torch.clamp(delta, -self.epsilon, self.epsilon)
-                x_adv = x + delta
+                x_adv.sub_(x).clamp_(min=lower, max=upper).add_(x)
 
                 # Clamp to valid range [0, 1]
-                x_adv = torch.clamp(x_adv, 0, 1)
+                x_adv.clamp_(0, 1)
 
-            # Clear gradient (check if it exists)
-            if x_adv.grad is not None:
                 x_adv.grad.zero_()
 
-        return x_adv.detach()
+            self.report_progress(step + 1, self.steps)
+
+        if output is None:
+            return x_adv.detach()
+
+        output[active] = x_adv.detach()
+        return output
+
+    def _is_successful(self, outputs: torch.Tensor, labels: torch.Tensor) -> torch.Tensor:
+        """
+        Check which samples are already adversarial.
+
+        Args:
+            outputs: Model logits (B, num_classes)
+            labels: Labels the loss is computed against (B,)
+
+        Returns:
+            Boolean tensor of shape (B,)
+        """
+        predicted = outputs.argmax(dim=1)
+        if self.targeted:
+            return predicted == labels
+        return predicted != labels
+
+    def _get_labels(self, x: torch.Tensor, model: torch.nn.Module) -> torch.Tensor:
+        """
+        Get the labels the loss is computed against.
+
+        Args:
+            x: Input tensor [batch_size, channels, height, width]
+            model: Target model
+
+        Returns:
+            Target classes for targeted attacks, otherwise the clean predictions (B,)
+        """
+        if self.targeted:
+            return self.expand_target(self.target_class, x)
+
+        with torch.no_grad():
+            return model(x).argmax(dim=1)
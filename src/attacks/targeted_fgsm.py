@@ -2,7 +2,7 @@
 Targeted FGSM Attack Implementation
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 import torch
 import torch.nn.functional as F
@@ -13,13 +13,23 @@ from .base_attack import BaseAttack
 class TargetedFGSMAttack(BaseAttack):
     """Targeted FGSM Attack that aims for specific target classes."""
 
-    def __init__(self, epsilon: float = 0.3, target_class: Optional[int] = None, **kwargs):
+    # Targets that are likely to be confused with street signs
+    # Common confusions for traffic signs: traffic light, mailbox, birdhouse, etc.
+    PREFERRED_TARGETS = (920, 919, 918, 917, 916)  # Some ImageNet classes
+
+    def __init__(
+        self,
+        epsilon: Union[float, torch.Tensor] = 0.3,
+        target_class: Optional[Union[int, torch.Tensor]] = None,
+        **kwargs,
+    ):
         """
         Initialize Targeted FGSM Attack.
 
         Args:
-            epsilon: Maximum perturbation size
-            target_class: Target class to aim for (if None, will choose automatically)
+            epsilon: Maximum perturbation size, scalar or one value per sample (B,)
+            target_class: Target class to aim for, scalar or one class per sample (B,)
+                (if None, will choose automatically for each sample)
             **kwargs: Additional arguments for base class
         """
         super().__init__(epsilon=epsilon, target_class=target_class, **kwargs)
@@ -37,36 +47,16 @@ class TargetedFGSMAttack(BaseAttack):
         Returns:
             Adversarial tensor
         """
+        self.validate_inputs(x, model)
         model.eval()
 
-        # Get current prediction
-        with torch.no_grad():
-            outputs = model(x)
-            current_class = outputs.argmax(dim=1)
+        epsilon = self.expand_parameter(self.epsilon, "epsilon", x)
 
         # Choose target class if not specified
         if self.target_class is None:
-            # Choose a different class (avoid current class)
-            num_classes = outputs.shape[1]
-            possible_targets = list(range(num_classes))
-            if current_class.item() in possible_targets:
-                possible_targets.remove(current_class.item())
-
-            # Choose a target that's likely to be confused with street sign
-            # Common confusions for traffic signs: traffic light, mailbox, birdhouse, etc.
-            preferred_targets = [920, 919, 918, 917, 916]  # Some ImageNet classes
-            for target in preferred_targets:
-                if target in possible_targets:
-                    self.target_class = target
-                    break
-            else:
-                # Fallback to random target
-                import random
-
-                self.target_class = random.choice(possible_targets)
-
-        # Create target tensor
-        target = torch.tensor([self.target_class], device=x.device)
+            target = self.choose_targets(x, model)
+        else:
+            target = self.expand_target(self.target_class, x)
 
         # Clone input
         x_adv = x.clone().detach()
@@ -76,7 +66,7 @@ class TargetedFGSMAttack(BaseAttack):
         outputs = model(x_adv)
 
         # Calculate loss (minimize loss for target class)
-        loss = F.cross_entropy(outputs, target)
+        loss = F.cross_entropy(outputs, target, reduction="sum")
 
         # Backward pass
         loss.backward()
@@ -84,9 +74,32 @@ class TargetedFGSMAttack(BaseAttack):
         # Update perturbation (opposite direction for targeted attack)
         with torch.no_grad():
             grad = x_adv.grad.sign()
-            x_adv = x_adv - self.epsilon * grad  # Note the minus sign for targeted attack
+            x_adv = x_adv - epsilon * grad  # Note the minus sign for targeted attack
 
             # Clamp to valid range [0, 1]
             x_adv = torch.clamp(x_adv, 0, 1)
 
         return x_adv.detach()
+
+    def choose_targets(self, x: torch.Tensor, model: torch.nn.Module) -> torch.Tensor:
+        """
+        Pick the first preferred target that differs from each sample's current prediction.
+
+        Args:
+            x: Input tensor [batch_size, channels, height, width]
+            model: Target model
+
+        Returns:
+            Target classes (B,)
+        """
+        # Get current prediction
+        with torch.no_grad():
+            current_class = model(x).argmax(dim=1)
+
+        # A sample can only collide with one preferred target, so the second one is always a valid fallback
+        first, second = self.PREFERRED_TARGETS[:2]
+        return torch.where(
+            current_class == first,
+            torch.full_like(current_class, second),
+            torch.full_like(current_class, first),
+        )
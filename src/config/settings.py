@@ -4,7 +4,7 @@ Configuration settings for Adversarial Comparator - Phase 1 (Ultra-Lightweight)
 
 import os
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -17,6 +17,12 @@ class ModelConfig:
     num_classes: int = 1000
     input_size: Tuple[int, int] = (224, 224)
 
+    # Local directory of memory-mappable checkpoints (<model_type>.pt); None uses torchvision weights
+    weight_store_dir: Optional[str] = None
+
+    # Class names file (one name per line); None uses the bundled ImageNet labels
+    class_names_path: Optional[str] = None
+
     # Preprocessing parameters (ImageNet normalization)
     mean: Tuple[float, float, float] = (0.485, 0.456, 0.406)
     std: Tuple[float, float, float] = (0.229, 0.224, 0.225)
@@ -24,6 +30,22 @@ class ModelConfig:
     # Performance settings
     device: str = "cpu"  # Phase 1: CPU only for ultra-lightweight
     model_cache_size: int = 1
+    # channels_last memory format for models and inputs, with conv/BN folding on the prediction path.
+    # Both copy the conv weights, so with a weight store only the remaining tensors stay memory-mapped.
+    channels_last: bool = False
+    execution_backend: str = "eager"  # "eager", "torchscript" (traced) or "compile" (torch.compile)
+
+    # Quantized inference (prediction path only, used when PerformanceConfig.enable_quantization is set).
+    # "dynamic" only quantizes the final linear layer (about 1.01x on ResNet18); "static" quantizes the
+    # convolutions too and is the mode that speeds up CPU inference, but needs a calibration folder.
+    quantization_mode: Optional[str] = None  # None (dynamic), "none", "dynamic" or "static"
+    quantization_calibration_dir: Optional[str] = None  # Local image folder for static calibration
+    quantization_calibration_samples: int = 32
+
+    # Prediction path backend; the torch model is always kept for attack gradients
+    inference_backend: str = "torch"  # "torch" or "onnxruntime" (optional dependency)
+    onnx_cache_dir: Optional[str] = None  # Exported models; None uses ~/.cache/adversarial_comparator/onnx
+    onnx_intra_op_threads: int = 0  # 0 lets ONNX Runtime decide
 
 
 @dataclass
@@ -35,6 +57,9 @@ class AttackConfig:
     max_epsilon: float = 0.50  # Increased from 0.30 to 0.50
     default_epsilon: float = 0.30  # Increased from 0.10 to 0.30
 
+    # Number of epsilon values evaluated by the FGSM epsilon sweep
+    sweep_points: int = 20
+
     # PGD specific parameters
     default_iterations: int = 50
     max_iterations: int = 100
@@ -54,13 +79,21 @@ class UIConfig:
 
     # Image settings
     max_image_size: int = 50 * 1024 * 1024  # 50MB (increased from 10MB)
+    max_image_pixels: int = 80_000_000  # Decompression-bomb limit, checked from the header before decoding
+    max_image_frames: int = 100  # Animated PNG/WebP uploads with more frames are rejected
     supported_formats: List[str] = field(default_factory=lambda: [".jpg", ".jpeg", ".png", ".webp"])
+    # JPEG uploads are decoded at a reduced scale that keeps both sides at least this large
+    # (enough for the preview and the model input); 0 decodes at full resolution
+    decode_min_size: int = 512
 
     # Layout settings
     page_title: str = "Adversarial Comparator"
     page_icon: str = "🎯"
     layout: str = "wide"
 
+    # Seconds between reruns while an attack job is running
+    job_poll_interval: float = 0.5
+
 
 @dataclass
 class PerformanceConfig:
@@ -69,15 +102,40 @@ class PerformanceConfig:
     # Memory settings
     max_memory_usage: int = 2 * 1024 * 1024 * 1024  # 2GB
     enable_caching: bool = True
+    result_cache_bytes: int = 256 * 1024 * 1024  # 256MB of cached predictions and attack results
+
+    # Persistent attack results shared by all worker processes (None uses ~/.cache/adversarial_comparator/results)
+    enable_result_store: bool = True
+    result_store_dir: Optional[str] = None
 
     # Timeout settings
     model_loading_timeout: int = 30  # seconds
     attack_generation_timeout: int = 60  # seconds
 
     # Optimization settings
-    enable_quantization: bool = True  # Phase 1: Use quantized models
+    enable_quantization: bool = False  # Quantize the prediction path with ModelConfig.quantization_mode
     batch_size: int = 1  # Phase 1: Single image processing
 
+    # Inference batching across sessions
+    enable_inference_batching: bool = True
+    inference_max_batch_size: int = 8
+    inference_max_wait_ms: float = 5.0
+
+    # CPU threading: intra-op threads per job (0 splits the cores between attack workers),
+    # inter-op pool size (0 keeps the torch default) and concurrent attack/prediction jobs
+    intra_op_threads: int = 0
+    inter_op_threads: int = 0
+    attack_workers: int = 2
+
+    # Background warm-up, started when the first browser session creates the app
+    enable_warmup: bool = True
+    warmup_models: Tuple[str, ...] = ()  # Empty warms up ModelConfig.model_type only
+    warmup_iterations: int = 3  # Dummy forward/backward passes per model
+    # Read by status.sh; None disables the file
+    warmup_status_path: Optional[str] = os.path.join(
+        os.path.expanduser("~"), ".cache", "adversarial_comparator", "warmup_status.json"
+    )
+
 
 @dataclass
 class AppConfig:
@@ -103,6 +161,13 @@ class AppConfig:
 
     def _validate_config(self):
         """Validate configuration parameters."""
+        self._validate_attack_config()
+        self._validate_ui_config()
+        self._validate_model_config()
+        self._validate_performance_config()
+
+    def _validate_attack_config(self):
+        """Validate the attack settings."""
         # Validate epsilon range
         if self.attack.default_epsilon > self.attack.max_epsilon:
             raise ValueError("Default epsilon cannot exceed max epsilon")
@@ -114,10 +179,72 @@ class AppConfig:
         if self.attack.default_iterations > self.attack.max_iterations:
             raise ValueError("Default iterations cannot exceed max iterations")
 
+    def _validate_ui_config(self):
+        """Validate the UI and image settings."""
         # Validate image size
         if self.ui.max_image_size <= 0:
             raise ValueError("Max image size must be positive")
 
+        if self.ui.max_image_pixels <= 0:
+            raise ValueError("Max image pixels must be positive")
+
+        if self.ui.max_image_frames <= 0:
+            raise ValueError("Max image frames must be positive")
+
+        if self.ui.decode_min_size < 0:
+            raise ValueError("Decode min size cannot be negative")
+
+        if self.ui.job_poll_interval <= 0:
+            raise ValueError("Job poll interval must be positive")
+
+    def _validate_model_config(self):
+        """Validate the model and backend settings."""
+        # Validate execution backend
+        if self.model.execution_backend not in ("eager", "torchscript", "compile"):
+            raise ValueError("Execution backend must be 'eager', 'torchscript' or 'compile'")
+
+        # Validate quantization
+        if self.model.quantization_mode not in (None, "none", "dynamic", "static"):
+            raise ValueError("Quantization mode must be 'none', 'dynamic' or 'static'")
+
+        # Validate inference backend
+        if self.model.inference_backend not in ("torch", "onnxruntime"):
+            raise ValueError("Inference backend must be 'torch' or 'onnxruntime'")
+
+        if self.model.onnx_intra_op_threads < 0:
+            raise ValueError("ONNX intra-op threads cannot be negative")
+
+        # Validate model cache limits
+        if self.model.model_cache_size < 1:
+            raise ValueError("Model cache size must be at least 1")
+
+    def _validate_performance_config(self):
+        """Validate the performance settings."""
+        if self.performance.max_memory_usage <= 0:
+            raise ValueError("Max memory usage must be positive")
+
+        # Validate result cache
+        if self.performance.result_cache_bytes <= 0:
+            raise ValueError("Result cache size must be positive")
+
+        # Validate inference batching
+        if self.performance.inference_max_batch_size < 1:
+            raise ValueError("Inference max batch size must be at least 1")
+
+        if self.performance.inference_max_wait_ms < 0:
+            raise ValueError("Inference max wait cannot be negative")
+
+        # Validate threading
+        if self.performance.intra_op_threads < 0 or self.performance.inter_op_threads < 0:
+            raise ValueError("Thread counts cannot be negative")
+
+        if self.performance.attack_workers < 1:
+            raise ValueError("Attack workers must be at least 1")
+
+        # Validate warm-up
+        if self.performance.warmup_iterations < 0:
+            raise ValueError("Warm-up iterations cannot be negative")
+
 
 # Global configuration instance
 config = AppConfig()
@@ -126,13 +253,49 @@ config = AppConfig()
 # Environment-specific overrides
 def load_environment_config():
     """Load environment-specific configuration overrides."""
-    # Check for environment variables
+    _load_model_environment()
+    _load_performance_environment()
+    _load_attack_environment()
+
+
+def _load_model_environment():
+    """Apply the model and backend overrides."""
     if os.getenv("ADVERSARIAL_COMPARATOR_DEVICE"):
         config.model.device = os.getenv("ADVERSARIAL_COMPARATOR_DEVICE")
 
     if os.getenv("ADVERSARIAL_COMPARATOR_MODEL"):
         config.model.model_type = os.getenv("ADVERSARIAL_COMPARATOR_MODEL")
 
+    if os.getenv("ADVERSARIAL_COMPARATOR_BACKEND"):
+        config.model.execution_backend = os.getenv("ADVERSARIAL_COMPARATOR_BACKEND")
+
+    if os.getenv("ADVERSARIAL_COMPARATOR_INFERENCE_BACKEND"):
+        config.model.inference_backend = os.getenv("ADVERSARIAL_COMPARATOR_INFERENCE_BACKEND")
+
+    if os.getenv("ADVERSARIAL_COMPARATOR_WEIGHT_STORE"):
+        config.model.weight_store_dir = os.getenv("ADVERSARIAL_COMPARATOR_WEIGHT_STORE")
+
+    if os.getenv("ADVERSARIAL_COMPARATOR_CLASS_NAMES"):
+        config.model.class_names_path = os.getenv("ADVERSARIAL_COMPARATOR_CLASS_NAMES")
+
+
+def _load_performance_environment():
+    """Apply the storage and threading overrides."""
+    if os.getenv("ADVERSARIAL_COMPARATOR_RESULT_STORE"):
+        config.performance.result_store_dir = os.getenv("ADVERSARIAL_COMPARATOR_RESULT_STORE")
+
+    if os.getenv("ADVERSARIAL_COMPARATOR_WARMUP_STATUS"):
+        config.performance.warmup_status_path = os.getenv("ADVERSARIAL_COMPARATOR_WARMUP_STATUS")
+
+    if os.getenv("ADVERSARIAL_COMPARATOR_THREADS"):
+        try:
+            config.performance.intra_op_threads = int(os.getenv("ADVERSARIAL_COMPARATOR_THREADS"))
+        except ValueError:
+            pass  # Keep default if invalid
+
+
+def _load_attack_environment():
+    """Apply the attack overrides."""
     if os.getenv("ADVERSARIAL_COMPARATOR_EPSILON"):
         try:
             config.attack.default_epsilon = float(os.getenv("ADVERSARIAL_COMPARATOR_EPSILON"))
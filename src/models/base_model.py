@@ -5,12 +5,20 @@ Base model class for all ML models
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import torch
 import torch.nn as nn
 import torchvision.transforms as transforms
 from PIL import Image
+from torch.fx.experimental.optimization import fuse
 
 from config.settings import ModelConfig
+from utils.image_processing import ToPixelTensor
+
+from .execution_backend import build_execution_model
+from .normalized_model import NormalizedModel
+from .onnx_backend import create_onnx_model, weights_hash
+from .quantization import quantize_model
 
 
 class BaseModel(ABC):
@@ -24,13 +32,29 @@ class BaseModel(ABC):
             config: Model configuration
         """
         self.config = config
+        self.device = torch.device(config.device)
         self.model: Optional[nn.Module] = None
+        # Forward-only model for predictions (e.g. int8); attacks always use self.model
+        self.inference_model: Optional[nn.Module] = None
+        # self.model run through the configured execution backend (eager, TorchScript or torch.compile)
+        self.execution_model: Optional[nn.Module] = None
+        # Conv/BN-folded copy of self.model for predictions (channels_last mode)
+        self.fused_model: Optional[nn.Module] = None
+        self.memory_format = torch.channels_last if config.channels_last else torch.contiguous_format
+        self.quantization_mode = "none"
+        self.inference_backend = "torch"
+        # Digest of the fp32 weights, computed on first use
+        self._weights_hash: Optional[str] = None
         self.transform = self._create_transform()
         self.class_names: List[str] = []
+        self.class_name_array: np.ndarray = np.empty(0, dtype=object)
 
         # Load the model
         self._load_model()
+        self._wrap_normalization()
+        self._prepare_for_inference()
         self._load_class_names()
+        self._build_class_name_array()
 
     @abstractmethod
     def _load_model(self):
@@ -42,13 +66,44 @@ class BaseModel(ABC):
         """Load class names for the model."""
         pass
 
+    def _wrap_normalization(self):
+        """
+        Fold input normalization into the model.
+
+        The model then takes [0, 1] pixel tensors, so attacks, clipping and
+        image conversion all work in pixel space.
+        """
+        if self.model is None or isinstance(self.model, NormalizedModel):
+            return
+
+        device = next(self.model.parameters()).device
+        self.model = NormalizedModel(self.model, self.config.mean, self.config.std).to(device).eval()
+
+    def _prepare_for_inference(self):
+        """
+        Fix device placement and evaluation mode once, at load time.
+
+        ``predict`` relies on this instead of switching mode and moving the
+        model on every call.
+        """
+        if self.model is None:
+            return
+
+        self.model.to(self.device, memory_format=self.memory_format)
+        self.model.eval()
+        self.execution_model = build_execution_model(self.model, self.config.execution_backend)
+
+        if self.config.channels_last:
+            # Predictions don't need autograd or BN statistics, so fold BN into the convs
+            fused = fuse(self.model).to(memory_format=self.memory_format).eval()
+            self.fused_model = build_execution_model(fused, self.config.execution_backend)
+
     def _create_transform(self) -> transforms.Compose:
-        """Create image transformation pipeline."""
+        """Create image transformation pipeline (normalization happens inside the model)."""
         return transforms.Compose(
             [
                 transforms.Resize(self.config.input_size),
-                transforms.ToTensor(),
-                transforms.Normalize(mean=self.config.mean, std=self.config.std),
+                ToPixelTensor(channels_last=self.config.channels_last),
             ]
         )
 
@@ -60,7 +115,7 @@ class BaseModel(ABC):
             image: PIL Image
 
         Returns:
-            Preprocessed tensor
+            Pixel tensor in [0, 1] (1, C, H, W)
         """
         # Convert to RGB if necessary
         if image.mode != "RGB":
@@ -79,27 +134,115 @@ class BaseModel(ABC):
         Make prediction on input image.
 
         Args:
-            image: Input image tensor (B, C, H, W)
+            image: Pixel tensor in [0, 1] (B, C, H, W)
 
         Returns:
-            Prediction logits (B, num_classes)
+            Prediction logits (B, num_classes), created under inference mode (not tracked by autograd)
         """
         if self.model is None:
             raise RuntimeError("Model not loaded")
 
-        # Set model to evaluation mode
-        self.model.eval()
+        # Placement and eval mode are fixed at load time; only the input may need moving
+        if image.device != self.device:
+            image = image.to(self.device)
+        if self.config.channels_last:
+            image = image.contiguous(memory_format=torch.channels_last)  # No-op for preprocessed images
+
+        with torch.inference_mode():
+            return self.get_inference_model()(image)
+
+    def get_inference_model(self) -> nn.Module:
+        """
+        Get the module used for forward-only predictions.
+
+        Returns:
+            ONNX Runtime or quantized model if enabled, otherwise the (conv/BN-folded) fp32
+            model on the execution backend
+        """
+        if self.inference_model is not None:
+            return self.inference_model
+        if self.fused_model is not None:
+            return self.fused_model
+        return self.execution_model if self.execution_model is not None else self.model
+
+    def get_attack_model(self) -> nn.Module:
+        """
+        Get the differentiable model used by gradient-based attacks.
+
+        Returns:
+            fp32 model on the configured execution backend
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        return self.execution_model if self.execution_model is not None else self.model
 
-        # Move to device
-        device = torch.device(self.config.device)
-        image = image.to(device)
-        self.model = self.model.to(device)
+    def get_weights_hash(self) -> str:
+        """
+        Get a digest of the fp32 weights, which keys stored results and ONNX exports.
+
+        The weights do not change after loading, so the digest is computed once per model.
 
-        # Make prediction
-        with torch.no_grad():
-            output = self.model(image)
+        Returns:
+            Hex digest of the weights
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+
+        if self._weights_hash is None:
+            self._weights_hash = weights_hash(self.model)
+        return self._weights_hash
+
+    def enable_quantized_inference(self, mode: str, calibration_images: Optional[torch.Tensor] = None):
+        """
+        Switch the prediction path to an int8 quantized copy of the model.
 
-        return output
+        The fp32 model stays in ``self.model`` for gradient-based attacks.
+
+        Args:
+            mode: Quantization mode ("none", "dynamic" or "static")
+            calibration_images: Calibration batch in pixel space, required for static quantization
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+
+        if mode != "none" and self.device.type != "cpu":
+            raise ValueError("Quantized inference is only supported on CPU")
+
+        self.inference_model = quantize_model(self.model, mode, calibration_images)
+        self.quantization_mode = mode
+        self.inference_backend = "torch"
+
+    def enable_onnx_inference(
+        self, model_type: Optional[str] = None, cache_dir: Optional[str] = None, intra_op_threads: int = 0
+    ):
+        """
+        Switch the prediction path to an ONNX Runtime session.
+
+        The model is exported once per weights hash and input size and reused
+        from the on-disk cache afterwards. The fp32 model stays in ``self.model``
+        for gradient-based attacks.
+
+        Args:
+            model_type: Name used for the cached export (defaults to config.model_type)
+            cache_dir: Directory holding exported models (None for the default)
+            intra_op_threads: ONNX Runtime threads per operator (0 lets it decide)
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+
+        if self.device.type != "cpu":
+            raise ValueError("ONNX Runtime inference is only supported on CPU")
+
+        self.inference_model = create_onnx_model(
+            self.model,
+            model_type or self.config.model_type,
+            self.config.input_size,
+            cache_dir,
+            intra_op_threads,
+            digest=self.get_weights_hash(),
+        )
+        self.quantization_mode = "none"
+        self.inference_backend = "onnxruntime"
 
     def get_predictions(self, image: torch.Tensor, top_k: int = 5) -> List[dict]:
         """
@@ -115,24 +258,81 @@ class BaseModel(ABC):
         # Get raw predictions
         logits = self.predict(image)
 
+        return self.format_predictions(logits, top_k)
+
+    def get_batch_predictions(self, image: torch.Tensor, top_k: int = 5) -> Dict[str, np.ndarray]:
+        """
+        Get top-k predictions for every image in a batch.
+
+        Args:
+            image: Input image tensor (B, C, H, W)
+            top_k: Number of top predictions to return
+
+        Returns:
+            Dictionary of contiguous (B, top_k) arrays: class_ids, confidences and class_names
+        """
+        return self.format_batch_predictions(self.predict(image), top_k)
+
+    def format_batch_predictions(self, logits: torch.Tensor, top_k: int = 5) -> Dict[str, np.ndarray]:
+        """
+        Convert logits into top-k arrays for every row.
+
+        Args:
+            logits: Prediction logits (B, num_classes)
+            top_k: Number of top predictions to return
+
+        Returns:
+            Dictionary of contiguous (B, top_k) arrays: class_ids, confidences and class_names
+        """
         # Apply softmax to get probabilities
         probabilities = torch.softmax(logits, dim=1)
 
-        # Get top-k predictions
+        # Get top-k predictions (single transfer per array)
         top_probs, top_indices = torch.topk(probabilities, top_k, dim=1)
+        class_ids = top_indices.cpu().numpy()
+        confidences = top_probs.cpu().numpy()
 
-        # Convert to list of dictionaries
-        predictions = []
-        for i in range(top_k):
-            class_id = top_indices[0, i].item()
-            confidence = top_probs[0, i].item()
+        if logits.size(1) > len(self.class_name_array):
+            self._build_class_name_array(logits.size(1))
 
-            # Get class name (handle index out of range)
-            class_name = self.class_names[class_id] if class_id < len(self.class_names) else f"Class_{class_id}"
+        return {
+            "class_ids": class_ids,
+            "confidences": confidences,
+            "class_names": self.class_name_array[class_ids],
+        }
 
-            predictions.append({"class_id": class_id, "class_name": class_name, "confidence": confidence})
+    def format_predictions(self, logits: torch.Tensor, top_k: int = 5) -> List[dict]:
+        """
+        Convert logits for the first image into top-k prediction dictionaries.
+
+        Args:
+            logits: Prediction logits (B, num_classes)
+            top_k: Number of top predictions to return
+
+        Returns:
+            List of prediction dictionaries
+        """
+        batch = self.format_batch_predictions(logits[:1], top_k)
+
+        return [
+            {"class_id": class_id, "class_name": class_name, "confidence": confidence}
+            for class_id, class_name, confidence in zip(
+                batch["class_ids"][0].tolist(), batch["class_names"][0].tolist(), batch["confidences"][0].tolist()
+            )
+        ]
+
+    def _build_class_name_array(self, size: Optional[int] = None):
+        """
+        Precompute the class-name lookup array.
+
+        Ids without a loaded name map to generic ``Class_i`` names.
 
-        return predictions
+        Args:
+            size: Number of class ids to cover (defaults to config.num_classes)
+        """
+        size = max(size or self.config.num_classes, len(self.class_names))
+        names = list(self.class_names) + [f"Class_{i}" for i in range(len(self.class_names), size)]
+        self.class_name_array = np.array(names, dtype=object)
 
     def get_class_names(self) -> List[str]:
         """
@@ -143,6 +343,21 @@ class BaseModel(ABC):
         """
         return self.class_names
 
+    def get_memory_usage(self) -> int:
+        """
+        Get the memory held by the model's parameters and buffers.
+
+        Includes forward-only copies (conv/BN-folded, int8 packed weights) when enabled.
+
+        Returns:
+            Size in bytes
+        """
+        if self.model is None:
+            return 0
+
+        # Forward-only copies may share submodules with the fp32 model, which count once
+        return _module_bytes(self.model, self.fused_model, self.inference_model)
+
     def get_model_info(self) -> dict:
         """
         Get model information.
@@ -163,9 +378,47 @@ class BaseModel(ABC):
             "input_size": self.config.input_size,
             "num_classes": self.config.num_classes,
             "device": self.config.device,
+            "quantization": self.quantization_mode,
+            "inference_backend": self.inference_backend,
+            "execution_backend": self.config.execution_backend,
+            "channels_last": self.config.channels_last,
+            "memory_bytes": self.get_memory_usage(),
         }
 
 
+def _module_bytes(*modules: Optional[nn.Module]) -> int:
+    """
+    Count the bytes of the parameters and buffers of one or more modules.
+
+    Walks the state dict so packed quantized weights, which are not
+    registered as parameters, are included. Shared tensors count once.
+
+    Args:
+        *modules: Modules to measure (None entries are skipped)
+
+    Returns:
+        Size in bytes
+    """
+    seen = set()
+    total = 0
+    pending = []
+    for module in modules:
+        if module is not None:
+            pending.extend(module.state_dict(keep_vars=True).values())
+            pending.extend(module.parameters())
+            pending.extend(module.buffers())
+
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (tuple, list)):
+            pending.extend(value)
+        elif isinstance(value, torch.Tensor) and id(value) not in seen:
+            seen.add(id(value))
+            total += value.numel() * value.element_size()
+
+    return total
+
+
 class ModelLoadError(Exception):
     """Exception raised when model loading fails."""
 
@@ -0,0 +1,59 @@
+"""
+Offline class-name loading for bundled and local label files
+"""
+
+import os
+from functools import lru_cache
+from typing import List, Tuple
+
+from config.settings import ModelConfig
+
+# ImageNet class names bundled with the package (one name per line)
+IMAGENET_CLASSES_PATH = os.path.join(os.path.dirname(__file__), "assets", "imagenet_classes.txt")
+
+
+@lru_cache(maxsize=None)
+def load_class_names(path: str) -> Tuple[str, ...]:
+    """
+    Load class names from a text file, once per process and path.
+
+    Args:
+        path: Path to a file with one class name per line
+
+    Returns:
+        Tuple of class names
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return tuple(line.strip() for line in f if line.strip())
+
+
+def get_imagenet_class_names(config: ModelConfig) -> List[str]:
+    """
+    Get ImageNet class names without touching the network.
+
+    Uses ``config.class_names_path`` when set, otherwise the bundled asset.
+
+    Args:
+        config: Model configuration
+
+    Returns:
+        List of class names (generic ``Class_i`` names if the file cannot be read)
+    """
+    path = config.class_names_path or IMAGENET_CLASSES_PATH
+
+    try:
+        class_names = list(load_class_names(os.path.abspath(path)))
+
+        # Ensure we have the right number of classes
+        if len(class_names) != config.num_classes:
+            print(f"Warning: Expected {config.num_classes} classes, got {len(class_names)}")
+
+        return class_names
+
+    except Exception as e:
+        print(f"Warning: Failed to load ImageNet class names from {path}: {str(e)}")
+        # Fallback: create generic class names
+        return [f"Class_{i}" for i in range(config.num_classes)]
@@ -0,0 +1,130 @@
+"""
+Selectable execution backends (eager, TorchScript, torch.compile) for model forward passes
+"""
+
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import torch
+import torch.nn as nn
+
+EXECUTION_BACKENDS = ("eager", "torchscript", "compile")
+
+
+class CompiledModule(nn.Module):
+    """Runs a module through compiled forms cached per input signature, with autograd support."""
+
+    def __init__(self, module: nn.Module, backend: str, max_compiled: int = 8):
+        """
+        Initialize the compiled module.
+
+        Args:
+            module: Eager module (shared, not copied)
+            backend: "torchscript" or "compile"
+            max_compiled: Number of compiled forms kept
+        """
+        super().__init__()
+        if backend not in EXECUTION_BACKENDS or backend == "eager":
+            raise ValueError(f"Unsupported compiled backend: {backend}. Available backends: {list(EXECUTION_BACKENDS[1:])}")
+
+        self.module = module
+        self.backend = backend
+        self.max_compiled = max_compiled
+        # Signature -> (compiled form, traced batch size or None if any batch size is supported)
+        self._compiled: "OrderedDict[Tuple, Tuple[nn.Module, Optional[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.get_compiled(x)(x)
+
+    def get_compiled(self, example: torch.Tensor) -> nn.Module:
+        """
+        Get the compiled form for an input, building it on first use.
+
+        Args:
+            example: Input tensor whose signature selects the compiled form
+
+        Returns:
+            Compiled module, or the eager module if the compiled form does not support the batch size
+        """
+        key = self.signature(example)
+        with self._lock:
+            entry = self._compiled.get(key)
+            if entry is None:
+                entry = self._compile(example)
+                self._compiled[key] = entry
+                while len(self._compiled) > self.max_compiled:
+                    self._compiled.popitem(last=False)
+            else:
+                self._compiled.move_to_end(key)
+
+        compiled, batch_size = entry
+        if batch_size is not None and batch_size != example.size(0):
+            return self.module
+        return compiled
+
+    def cache_size(self) -> int:
+        """
+        Get the number of compiled forms built so far.
+
+        Returns:
+            Number of cached compiled forms
+        """
+        return len(self._compiled)
+
+    @staticmethod
+    def signature(x: torch.Tensor) -> Tuple:
+        """
+        Get the cache key of an input.
+
+        Args:
+            x: Input tensor
+
+        Returns:
+            Tuple of per-sample shape, dtype, device and whether autograd is recording
+        """
+        return (tuple(x.shape[1:]), x.dtype, x.device, torch.is_grad_enabled())
+
+    def _compile(self, example: torch.Tensor) -> Tuple[nn.Module, Optional[int]]:
+        """
+        Build the compiled form for one input signature.
+
+        Args:
+            example: Example input
+
+        Returns:
+            Tuple of compiled module and the batch size it is limited to (None for any)
+        """
+        if self.backend == "torchscript":
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", torch.jit.TracerWarning)
+                warnings.simplefilter("ignore", FutureWarning)  # torch.jit is deprecated in recent releases
+                return torch.jit.trace(self.module, example.detach(), check_trace=False), example.size(0)
+
+        # Dynamic batch dimension: one compiled form serves every batch size
+        return torch.compile(self.module, dynamic=True), None
+
+
+def build_execution_model(model: nn.Module, backend: str) -> nn.Module:
+    """
+    Wrap a model for the selected execution backend.
+
+    Args:
+        model: Eager model
+        backend: Execution backend ("eager", "torchscript" or "compile")
+
+    Returns:
+        The model itself for eager execution, otherwise a CompiledModule
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(f"Unknown execution backend: {backend}. Available backends: {list(EXECUTION_BACKENDS)}")
+
+    if backend == "eager":
+        return model
+
+    return CompiledModule(model, backend)
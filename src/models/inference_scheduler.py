@@ -0,0 +1,231 @@
+"""
+Micro-batching inference scheduler shared by concurrent sessions
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from .base_model import BaseModel, PredictionError
+
+
+class _InferenceRequest:
+    """A queued prediction request."""
+
+    def __init__(self, image: torch.Tensor):
+        self.image = image
+        self.future: Future = Future()
+
+
+class InferenceScheduler:
+    """Queues prediction requests from all sessions and runs them in batches."""
+
+    def __init__(self, model: BaseModel, max_batch_size: int = 8, max_wait_ms: float = 5.0):
+        """
+        Initialize the inference scheduler.
+
+        Args:
+            model: Model used for predictions
+            max_batch_size: Maximum number of images per forward pass
+            max_wait_ms: Maximum time to wait for more requests after the first one arrives
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative")
+
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._queue: "queue.Queue[Optional[_InferenceRequest]]" = queue.Queue()
+        self._pending: Optional[_InferenceRequest] = None
+        self._running = True
+        # Orders submissions against the shutdown sentinel
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="inference-scheduler", daemon=True)
+        self._worker.start()
+
+    def submit(self, image: torch.Tensor) -> Future:
+        """
+        Queue an image batch for prediction.
+
+        Args:
+            image: Input image tensor (B, C, H, W)
+
+        Returns:
+            Future resolving to the logits for this request (B, num_classes)
+
+        Raises:
+            RuntimeError: If the scheduler has been shut down
+        """
+        request = _InferenceRequest(image.detach())
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("Inference scheduler has been shut down")
+            self._queue.put(request)
+        return request.future
+
+    def predict(self, image: torch.Tensor, timeout: Optional[float] = None) -> torch.Tensor:
+        """
+        Make a prediction through the scheduler and wait for the result.
+
+        Args:
+            image: Input image tensor (B, C, H, W)
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            Prediction logits (B, num_classes)
+        """
+        return self.submit(image).result(timeout=timeout)
+
+    def get_predictions(self, image: torch.Tensor, top_k: int = 5, timeout: Optional[float] = None) -> List[dict]:
+        """
+        Get top-k predictions through the scheduler.
+
+        Args:
+            image: Input image tensor
+            top_k: Number of top predictions to return
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            List of prediction dictionaries
+        """
+        return self.model.format_predictions(self.predict(image, timeout=timeout), top_k)
+
+    def get_batch_predictions(
+        self, image: torch.Tensor, top_k: int = 5, timeout: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get top-k predictions for every image in a batch through the scheduler.
+
+        Args:
+            image: Input image tensor (B, C, H, W)
+            top_k: Number of top predictions to return
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            Dictionary of (B, top_k) arrays: class_ids, confidences and class_names
+        """
+        return self.model.format_batch_predictions(self.predict(image, timeout=timeout), top_k)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the worker thread after the queued requests have been served.
+
+        Args:
+            wait: Whether to wait for the worker thread to finish
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._queue.put(None)
+
+        if wait:
+            self._worker.join()
+
+    def _run(self):
+        """Worker loop: collect a batch, run it, repeat."""
+        try:
+            while True:
+                batch = self._collect_batch()
+                if batch is None:
+                    return
+                self._execute(batch)
+        finally:
+            self._fail_remaining()
+
+    def _fail_remaining(self):
+        """Fail every request left behind when the worker stops, so no caller waits forever."""
+        remaining = [self._pending] if self._pending is not None else []
+        self._pending = None
+        while True:
+            try:
+                remaining.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        error = PredictionError("Inference scheduler has been shut down")
+        for request in remaining:
+            if request is not None and not request.future.done():
+                request.future.set_exception(error)
+
+    def _collect_batch(self) -> Optional[List[_InferenceRequest]]:
+        """
+        Block for the first request, then gather more until the batch is full or the wait expires.
+
+        Only requests with the same image shape and dtype are batched together;
+        a mismatching request is held back for the next batch.
+
+        Returns:
+            List of requests, or None when the scheduler is shutting down
+        """
+        first = self._pending if self._pending is not None else self._queue.get()
+        self._pending = None
+        if first is None:
+            return None
+
+        batch = [first]
+        batch_key = self._batch_key(first)
+        rows = first.image.size(0)
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+
+        while rows < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if request is None:
+                # Serve what we have, then stop on the next call
+                self._queue.put(None)
+                break
+
+            if self._batch_key(request) != batch_key or rows + request.image.size(0) > self.max_batch_size:
+                self._pending = request
+                break
+
+            batch.append(request)
+            rows += request.image.size(0)
+
+        return batch
+
+    def _execute(self, batch: List[_InferenceRequest]):
+        """
+        Run one forward pass for a batch of requests and resolve their futures.
+
+        Args:
+            batch: Requests to serve
+        """
+        try:
+            images = batch[0].image if len(batch) == 1 else torch.cat([request.image for request in batch])
+            logits = self.model.predict(images)
+        except Exception as e:
+            error = PredictionError(f"Batched prediction failed: {str(e)}")
+            for request in batch:
+                request.future.set_exception(error)
+            return
+
+        for request, request_logits in zip(batch, torch.split(logits, [r.image.size(0) for r in batch])):
+            request.future.set_result(request_logits)
+
+    @staticmethod
+    def _batch_key(request: _InferenceRequest) -> Tuple:
+        """
+        Get the key that decides whether two requests can share a batch.
+
+        Args:
+            request: Queued request
+
+        Returns:
+            Tuple of per-sample shape, dtype and device
+        """
+        image = request.image
+        return (tuple(image.shape[1:]), image.dtype, image.device)
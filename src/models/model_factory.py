@@ -2,26 +2,46 @@
 Model factory for creating and managing models
 """
 
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from config.settings import ModelConfig
 
 from .base_model import BaseModel, ModelLoadError
+from .onnx_backend import ONNX_RUNTIME_AVAILABLE
+from .quantization import QUANTIZATION_MODES, load_calibration_images
 from .resnet_model import ResNet18Model, ResNet50Model
 
+# Called as listener(model_type, model, reason) when a model is evicted from the cache
+EvictionListener = Callable[[str, BaseModel, str], None]
+
 
 class ModelFactory:
     """Factory for creating and managing ML models."""
 
-    def __init__(self, config: ModelConfig):
+    def __init__(self, config: ModelConfig, enable_quantization: bool = False, max_memory_usage: Optional[int] = None):
         """
         Initialize the model factory.
 
+        The cache holds at most config.model_cache_size models and, when
+        max_memory_usage is set, at most that many bytes of parameters and
+        buffers; the least recently used models are evicted first.
+
         Args:
             config: Model configuration
+            enable_quantization: Quantize models without an explicit mode with config.quantization_mode
+                (dynamic if unset)
+            max_memory_usage: Memory budget for cached models in bytes (None for no budget)
         """
         self.config = config
-        self.model_cache: Dict[str, BaseModel] = {}
+        self.enable_quantization = enable_quantization
+        self.max_memory_usage = max_memory_usage
+        self.model_cache: "OrderedDict[str, BaseModel]" = OrderedDict()
+        self.model_memory: Dict[str, int] = {}
+        self.quantization_modes: Dict[str, str] = {}
+        self._lock = threading.RLock()
+        self._eviction_listeners: List[EvictionListener] = []
         self._model_registry = {
             "resnet18": ResNet18Model,
             "resnet50": ResNet50Model,
@@ -46,17 +66,150 @@ class ModelFactory:
             model_type = self.config.model_type
 
         # Check if model is already cached
-        if model_type in self.model_cache:
-            return self.model_cache[model_type]
+        model = self.get_cached_model(model_type)
+        if model is not None:
+            return model
 
         # Create new model instance
         model = self._create_model(model_type)
 
         # Cache the model
-        self.model_cache[model_type] = model
+        self._cache_model(model_type, model)
 
         return model
 
+    def get_cached_model(self, model_type: Optional[str] = None) -> Optional[BaseModel]:
+        """
+        Get a model only if it is cached, marking it as recently used.
+
+        Args:
+            model_type: Type of model (defaults to config.model_type)
+
+        Returns:
+            Model instance, or None if the model is not cached
+        """
+        if model_type is None:
+            model_type = self.config.model_type
+
+        with self._lock:
+            model = self.model_cache.get(model_type)
+            if model is not None:
+                self.model_cache.move_to_end(model_type)
+            return model
+
+    def add_eviction_listener(self, listener: EvictionListener):
+        """
+        Register a callback for cache evictions.
+
+        Args:
+            listener: Called as listener(model_type, model, reason) with reason "size" or "memory"
+        """
+        with self._lock:
+            self._eviction_listeners.append(listener)
+
+    def remove_eviction_listener(self, listener: EvictionListener):
+        """
+        Unregister an eviction callback.
+
+        Args:
+            listener: Previously registered callback
+        """
+        with self._lock:
+            if listener in self._eviction_listeners:
+                self._eviction_listeners.remove(listener)
+
+    def get_cache_memory_usage(self) -> int:
+        """
+        Get the memory held by cached models.
+
+        Returns:
+            Total parameter and buffer bytes of cached models
+        """
+        with self._lock:
+            return sum(self.model_memory.values())
+
+    def _cache_model(self, model_type: str, model: BaseModel):
+        """
+        Insert a model into the cache and enforce the cache limits.
+
+        Args:
+            model_type: Type of model
+            model: Model instance
+        """
+        with self._lock:
+            self.model_cache[model_type] = model
+            self.model_cache.move_to_end(model_type)
+            self.model_memory[model_type] = self._measure_model(model)
+            evicted = self._enforce_limits(model_type)
+
+        self._notify_evicted(evicted)
+
+    def _enforce_limits(self, keep: str) -> List[Tuple[str, BaseModel, str]]:
+        """
+        Evict least recently used models until the cache fits its limits.
+
+        The model being kept is never evicted, even if it alone exceeds the budget.
+        Must be called with the lock held.
+
+        Args:
+            keep: Type of the model that triggered the check
+
+        Returns:
+            List of (model_type, model, reason) for evicted models
+        """
+        evicted = []
+        max_entries = max(1, self.config.model_cache_size)
+
+        while len(self.model_cache) > 1:
+            if len(self.model_cache) > max_entries:
+                reason = "size"
+            elif self.max_memory_usage is not None and sum(self.model_memory.values()) > self.max_memory_usage:
+                reason = "memory"
+            else:
+                break
+
+            victim = next(model_type for model_type in self.model_cache if model_type != keep)
+            evicted.append((victim, self.model_cache.pop(victim), reason))
+            self.model_memory.pop(victim, None)
+
+        if self.max_memory_usage is not None and self.model_memory.get(keep, 0) > self.max_memory_usage:
+            print(f"Warning: {keep} alone exceeds the model memory budget of {self.max_memory_usage} bytes")
+
+        return evicted
+
+    def _notify_evicted(self, evicted: List[Tuple[str, BaseModel, str]]):
+        """
+        Call the eviction listeners outside the lock.
+
+        Args:
+            evicted: List of (model_type, model, reason)
+        """
+        if not evicted:
+            return
+
+        with self._lock:
+            listeners = list(self._eviction_listeners)
+
+        for model_type, model, reason in evicted:
+            for listener in listeners:
+                try:
+                    listener(model_type, model, reason)
+                except Exception as e:
+                    print(f"Warning: Eviction listener failed for {model_type}: {str(e)}")
+
+    @staticmethod
+    def _measure_model(model: BaseModel) -> int:
+        """
+        Measure the parameter and buffer bytes of a model.
+
+        Args:
+            model: Model instance
+
+        Returns:
+            Size in bytes
+        """
+        return model.get_memory_usage() if isinstance(model, BaseModel) else 0
+
     def _create_model(self, model_type: str) -> BaseModel:
         """
         Create model instance.
@@ -77,10 +230,113 @@ class ModelFactory:
 
         try:
             model_class = self._model_registry[model_type]
-            return model_class(self.config)
+            model = model_class(self.config)
         except Exception as e:
             raise ModelLoadError(f"Failed to create model {model_type}: {str(e)}")
 
+        self._apply_inference_backend(model_type, model)
+        return model
+
+    def set_quantization_mode(self, model_type: str, mode: str):
+        """
+        Select the quantized inference mode for a model type.
+
+        Applies immediately to a cached model and to models created later.
+
+        Args:
+            model_type: Type of model
+            mode: Quantization mode ("none", "dynamic" or "static")
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in QUANTIZATION_MODES:
+            raise ValueError(f"Unknown quantization mode: {mode}. Available modes: {list(QUANTIZATION_MODES)}")
+
+        self.quantization_modes[model_type] = mode
+        model = self.get_cached_model(model_type)
+        if model is None:
+            return
+
+        self._apply_inference_backend(model_type, model)
+
+        # The quantized copy changes the model's footprint
+        with self._lock:
+            if self.model_cache.get(model_type) is not model:
+                return
+            self.model_memory[model_type] = self._measure_model(model)
+            evicted = self._enforce_limits(model_type)
+
+        self._notify_evicted(evicted)
+
+    def get_quantization_mode(self, model_type: str) -> str:
+        """
+        Get the quantized inference mode for a model type.
+
+        Args:
+            model_type: Type of model
+
+        Returns:
+            Quantization mode
+        """
+        if model_type in self.quantization_modes:
+            return self.quantization_modes[model_type]
+        if not self.enable_quantization:
+            return "none"
+        return self.config.quantization_mode or "dynamic"
+
+    def _apply_inference_backend(self, model_type: str, model: BaseModel):
+        """
+        Set up the prediction path of a model.
+
+        ONNX Runtime, when selected, takes precedence over torch quantization;
+        if it is unavailable or fails, the torch path (quantized if enabled) is used.
+
+        Args:
+            model_type: Type of model
+            model: Model instance
+        """
+        if self.config.inference_backend == "onnxruntime":
+            if not ONNX_RUNTIME_AVAILABLE:
+                print("Warning: onnxruntime is not installed, using torch inference")
+            else:
+                try:
+                    model.enable_onnx_inference(model_type, self.config.onnx_cache_dir, self.config.onnx_intra_op_threads)
+                    return
+                except Exception as e:
+                    print(f"Warning: Failed to set up ONNX Runtime for {model_type}, using torch inference: {str(e)}")
+
+        self._apply_quantization(model_type, model)
+
+    def _apply_quantization(self, model_type: str, model: BaseModel):
+        """
+        Enable quantized inference on a model, falling back to fp32 on failure.
+
+        Args:
+            model_type: Type of model
+            model: Model instance
+        """
+        mode = self.get_quantization_mode(model_type)
+        calibration_images = None
+
+        try:
+            if mode == "static":
+                if self.config.quantization_calibration_dir:
+                    calibration_images = load_calibration_images(
+                        self.config.quantization_calibration_dir,
+                        model.preprocess,
+                        self.config.quantization_calibration_samples,
+                    )
+                else:
+                    print("Warning: Static quantization needs quantization_calibration_dir, using dynamic quantization")
+                    mode = "dynamic"
+
+            model.enable_quantized_inference(mode, calibration_images)
+
+        except Exception as e:
+            print(f"Warning: Failed to quantize {model_type} ({mode}), using fp32 inference: {str(e)}")
+            model.enable_quantized_inference("none")
+
     def list_available_models(self) -> list:
         """
         Get list of available model types.
@@ -92,7 +348,9 @@ class ModelFactory:
 
     def clear_cache(self):
         """Clear the model cache."""
-        self.model_cache.clear()
+        with self._lock:
+            self.model_cache.clear()
+            self.model_memory.clear()
 
     def get_cached_models(self) -> list:
         """
@@ -101,7 +359,8 @@ class ModelFactory:
         Returns:
             List of cached model types
         """
-        return list(self.model_cache.keys())
+        with self._lock:
+            return list(self.model_cache.keys())
 
     def remove_from_cache(self, model_type: str):
         """
@@ -110,8 +369,9 @@ class ModelFactory:
         Args:
             model_type: Type of model to remove
         """
-        if model_type in self.model_cache:
-            del self.model_cache[model_type]
+        with self._lock:
+            self.model_cache.pop(model_type, None)
+            self.model_memory.pop(model_type, None)
 
     def get_model_info(self, model_type: Optional[str] = None) -> dict:
         """
@@ -0,0 +1,177 @@
+"""
+Process-wide model registry shared across Streamlit reruns and sessions
+"""
+
+import threading
+from typing import Dict, Optional
+
+from config.settings import ModelConfig
+from utils.singleton import ProcessSingleton
+
+from .base_model import BaseModel
+from .inference_scheduler import InferenceScheduler
+from .model_factory import ModelFactory
+
+
+class ModelRegistry:
+    """Thread-safe registry that loads each model exactly once per process."""
+
+    def __init__(self, factory: ModelFactory):
+        """
+        Initialize the model registry.
+
+        Args:
+            factory: Model factory used to create and cache models
+        """
+        self.factory = factory
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._schedulers: Dict[str, InferenceScheduler] = {}
+        self.factory.add_eviction_listener(self._on_model_evicted)
+
+    def get_model(self, model_type: Optional[str] = None) -> BaseModel:
+        """
+        Get a model, loading it on first use.
+
+        Concurrent callers asking for the same model wait for a single load;
+        loads of different models do not block each other.
+
+        Args:
+            model_type: Type of model to load (defaults to config.model_type)
+
+        Returns:
+            Model instance
+
+        Raises:
+            ModelLoadError: If model loading fails
+            ValueError: If model type is not supported
+        """
+        if model_type is None:
+            model_type = self.factory.config.model_type
+
+        model = self.get_cached_model(model_type)
+        if model is not None:
+            return model
+
+        with self._get_load_lock(model_type):
+            return self.factory.get_model(model_type)
+
+    def get_cached_model(self, model_type: Optional[str] = None) -> Optional[BaseModel]:
+        """
+        Get a model only if it has already been loaded.
+
+        Args:
+            model_type: Type of model (defaults to config.model_type)
+
+        Returns:
+            Model instance, or None if the model is not loaded
+        """
+        return self.factory.get_cached_model(model_type)
+
+    def is_loaded(self, model_type: Optional[str] = None) -> bool:
+        """
+        Check whether a model has already been loaded.
+
+        Args:
+            model_type: Type of model (defaults to config.model_type)
+
+        Returns:
+            True if the model is cached
+        """
+        return self.get_cached_model(model_type) is not None
+
+    def get_scheduler(
+        self, model_type: Optional[str] = None, max_batch_size: int = 8, max_wait_ms: float = 5.0
+    ) -> InferenceScheduler:
+        """
+        Get the shared inference scheduler for a model, loading the model if needed.
+
+        The batching limits only apply when the scheduler is first created.
+
+        Args:
+            model_type: Type of model (defaults to config.model_type)
+            max_batch_size: Maximum number of images per forward pass
+            max_wait_ms: Maximum time to wait for more requests to batch
+
+        Returns:
+            Inference scheduler for the model
+        """
+        if model_type is None:
+            model_type = self.factory.config.model_type
+
+        model = self.get_model(model_type)
+
+        with self._lock:
+            scheduler = self._schedulers.get(model_type)
+            if scheduler is None or scheduler.model is not model:
+                if scheduler is not None:
+                    scheduler.shutdown(wait=False)
+                scheduler = InferenceScheduler(model, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+                self._schedulers[model_type] = scheduler
+            return scheduler
+
+    def list_available_models(self) -> list:
+        """
+        Get list of available model types.
+
+        Returns:
+            List of supported model types
+        """
+        return self.factory.list_available_models()
+
+    def _on_model_evicted(self, model_type: str, model: BaseModel, reason: str):
+        """
+        Stop the scheduler of an evicted model so it no longer keeps the model alive.
+
+        Args:
+            model_type: Type of the evicted model
+            model: Evicted model instance
+            reason: Why the model was evicted ("size" or "memory")
+        """
+        with self._lock:
+            scheduler = self._schedulers.get(model_type)
+            if scheduler is None or scheduler.model is not model:
+                return
+            del self._schedulers[model_type]
+
+        scheduler.shutdown(wait=False)
+
+    def _get_load_lock(self, model_type: str) -> threading.Lock:
+        """
+        Get the lock that serializes loading of a model type.
+
+        Args:
+            model_type: Type of model
+
+        Returns:
+            Lock for the model type
+        """
+        with self._lock:
+            if model_type not in self._load_locks:
+                self._load_locks[model_type] = threading.Lock()
+            return self._load_locks[model_type]
+
+
+_registry: ProcessSingleton[ModelRegistry] = ProcessSingleton()
+
+
+def get_model_registry(
+    config: ModelConfig, enable_quantization: bool = False, max_memory_usage: Optional[int] = None
+) -> ModelRegistry:
+    """
+    Get the process-wide model registry, creating it on first use.
+
+    Every browser session loads models through the same registry, so each
+    model is loaded once per process however many sessions use it.
+
+    Args:
+        config: Model configuration used when the registry is first created
+        enable_quantization: Enable quantized inference when the registry is first created
+        max_memory_usage: Memory budget for cached models in bytes when the registry is first created
+
+    Returns:
+        Shared model registry
+    """
+    return _registry.get(
+        lambda: ModelRegistry(ModelFactory(config, enable_quantization=enable_quantization, max_memory_usage=max_memory_usage))
+    )
@@ -0,0 +1,40 @@
+"""
+Model wrapper that applies input normalization inside the forward pass
+"""
+
+from typing import Tuple
+
+import torch
+import torch.nn as nn
+
+
+class NormalizedModel(nn.Module):
+    """Wraps a classifier so it takes [0, 1] pixel tensors as input."""
+
+    def __init__(self, model: nn.Module, mean: Tuple[float, float, float], std: Tuple[float, float, float]):
+        """
+        Initialize the normalized model.
+
+        Args:
+            model: Classifier expecting normalized input
+            mean: Mean values for each channel
+            std: Standard deviation values for each channel
+        """
+        super().__init__()
+        self.model = model
+
+        # Buffers follow the model across .to() calls and are allocated once
+        self.register_buffer("mean", torch.tensor(mean, dtype=torch.float32).view(1, -1, 1, 1))
+        self.register_buffer("std", torch.tensor(std, dtype=torch.float32).view(1, -1, 1, 1))
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """
+        Normalize pixel input and run the wrapped classifier.
+
+        Args:
+            x: Pixel tensor in [0, 1] (B, C, H, W)
+
+        Returns:
+            Logits (B, num_classes)
+        """
+        return self.model((x - self.mean) / self.std)
@@ -0,0 +1,162 @@
+"""
+ONNX Runtime backend for the forward-only prediction path
+
+Models are exported to ONNX once and cached on disk, keyed by model type,
+a hash of the weights and the input size. onnxruntime is optional: without
+it, ``ONNX_RUNTIME_AVAILABLE`` is False and predictions stay on torch.
+"""
+
+import hashlib
+import inspect
+import os
+import warnings
+from typing import Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from utils.atomic_file import atomic_write
+
+try:
+    import onnxruntime as ort
+except ImportError:  # pragma: no cover - optional dependency
+    ort = None
+
+ONNX_RUNTIME_AVAILABLE = ort is not None
+
+# Default location of exported models
+DEFAULT_ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "adversarial_comparator", "onnx")
+
+ONNX_OPSET = 17
+# torch>=2.5 can export through dynamo; older releases only have the TorchScript exporter used here
+EXPORT_OPTIONS = {"dynamo": False} if "dynamo" in inspect.signature(torch.onnx.export).parameters else {}
+INPUT_NAME = "pixels"
+OUTPUT_NAME = "logits"
+
+
+def weights_hash(module: nn.Module) -> str:
+    """
+    Hash a module's weights, so exports are invalidated when the weights change.
+
+    Args:
+        module: Module to hash
+
+    Returns:
+        Hex digest of parameter and buffer names, shapes, dtypes and values
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name, tensor in module.state_dict().items():
+        tensor = tensor.detach().cpu().contiguous()
+        digest.update(f"{name}:{tuple(tensor.shape)}:{tensor.dtype}".encode())
+        if tensor.numel():
+            # Hash the tensor memory in place (memory-mapped weights are not read into copies)
+            digest.update(memoryview(tensor.view(-1).view(torch.uint8).numpy()))
+    return digest.hexdigest()
+
+
+def export_onnx(module: nn.Module, path: str, input_size: Tuple[int, int]):
+    """
+    Export a model to ONNX with a dynamic batch dimension.
+
+    The file is written atomically, so concurrent processes never see a partial export.
+
+    Args:
+        module: Model taking (B, 3, H, W) inputs
+        path: Destination file
+        input_size: Input height and width
+    """
+    example = torch.zeros(1, 3, *input_size, device=next(module.parameters()).device)
+    with atomic_write(path, suffix=".onnx.tmp") as tmp_path:
+        with warnings.catch_warnings(), torch.no_grad():
+            warnings.simplefilter("ignore")
+            torch.onnx.export(
+                module,
+                example,
+                tmp_path,
+                input_names=[INPUT_NAME],
+                output_names=[OUTPUT_NAME],
+                dynamic_axes={INPUT_NAME: {0: "batch"}, OUTPUT_NAME: {0: "batch"}},
+                opset_version=ONNX_OPSET,
+                **EXPORT_OPTIONS,
+            )
+
+
+def get_onnx_model_path(
+    module: nn.Module, model_type: str, input_size: Tuple[int, int], cache_dir: str, digest: Optional[str] = None
+) -> str:
+    """
+    Get the cached ONNX export of a model, exporting it on first use.
+
+    Args:
+        module: Model to export
+        model_type: Type of model
+        input_size: Input height and width
+        cache_dir: Directory holding exported models
+        digest: weights_hash of the module, if already known
+
+    Returns:
+        Path of the ONNX file
+    """
+    height, width = input_size
+    path = os.path.join(cache_dir, f"{model_type}-{digest or weights_hash(module)}-{height}x{width}.onnx")
+    if not os.path.isfile(path):
+        export_onnx(module, path, input_size)
+    return path
+
+
+class OnnxRuntimeModel(nn.Module):
+    """Runs an exported model in an ONNX Runtime CPU session behind the torch module interface."""
+
+    def __init__(self, path: str, intra_op_threads: int = 0):
+        """
+        Initialize the ONNX Runtime model.
+
+        Args:
+            path: ONNX file
+            intra_op_threads: Threads per operator (0 lets ONNX Runtime decide)
+
+        Raises:
+            RuntimeError: If onnxruntime is not installed
+        """
+        super().__init__()
+        if not ONNX_RUNTIME_AVAILABLE:
+            raise RuntimeError("onnxruntime is not installed")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = intra_op_threads
+
+        self.path = path
+        self.session = ort.InferenceSession(path, sess_options=options, providers=["CPUExecutionProvider"])
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        pixels = np.ascontiguousarray(x.detach().cpu().numpy(), dtype=np.float32)
+        (logits,) = self.session.run([OUTPUT_NAME], {INPUT_NAME: pixels})
+        return torch.from_numpy(logits)
+
+
+def create_onnx_model(
+    module: nn.Module,
+    model_type: str,
+    input_size: Tuple[int, int],
+    cache_dir: Optional[str] = None,
+    intra_op_threads: int = 0,
+    digest: Optional[str] = None,
+) -> OnnxRuntimeModel:
+    """
+    Build an ONNX Runtime model from a torch model, reusing a cached export.
+
+    Args:
+        module: fp32 model (left untouched)
+        model_type: Type of model
+        input_size: Input height and width
+        cache_dir: Directory holding exported models (None for the default)
+        intra_op_threads: Threads per operator (0 lets ONNX Runtime decide)
+        digest: weights_hash of the module, if already known
+
+    Returns:
+        ONNX Runtime model
+    """
+    path = get_onnx_model_path(module, model_type, input_size, cache_dir or DEFAULT_ONNX_CACHE_DIR, digest)
+    return OnnxRuntimeModel(path, intra_op_threads)
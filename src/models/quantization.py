@@ -0,0 +1,230 @@
+"""
+Post-training int8 quantization for the prediction path
+"""
+
+import copy
+import os
+import time
+import warnings
+from typing import Callable, Dict, List, Optional
+
+import torch
+import torch.nn as nn
+from PIL import Image
+
+QUANTIZATION_MODES = ("none", "dynamic", "static")
+
+# Image extensions picked up from the calibration folder
+CALIBRATION_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+
+def select_quantized_engine() -> str:
+    """
+    Select the best available quantized kernel backend for this CPU.
+
+    Returns:
+        Name of the quantized engine
+    """
+    supported = torch.backends.quantized.supported_engines
+    for engine in ("x86", "fbgemm", "qnnpack"):
+        if engine in supported:
+            torch.backends.quantized.engine = engine
+            return engine
+
+    raise RuntimeError(f"No quantized engine available (supported: {supported})")
+
+
+def quantize_dynamic_model(model: nn.Module) -> nn.Module:
+    """
+    Apply dynamic int8 quantization to the linear layers of a model.
+
+    Only the linear layers are replaced; every other submodule (and its
+    weights, e.g. memory-mapped checkpoints) is shared with the fp32 model
+    instead of being copied.
+
+    Args:
+        model: fp32 model in eval mode (left untouched)
+
+    Returns:
+        Quantized view of the model
+    """
+    select_quantized_engine()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        warnings.simplefilter("ignore", UserWarning)
+        from torch.ao.nn.quantized.dynamic import Linear as DynamicLinear
+        from torch.ao.quantization import default_dynamic_qconfig
+
+        return _replace_linear_layers(model, DynamicLinear.from_float, default_dynamic_qconfig)
+
+
+def _replace_linear_layers(module: nn.Module, convert: Callable[[nn.Module], nn.Module], qconfig) -> nn.Module:
+    """
+    Copy the path from a module to its linear layers, replacing those layers.
+
+    Modules without linear layers below them are returned as is, so the
+    result shares them with the original.
+
+    Args:
+        module: Module to convert (left untouched)
+        convert: Function turning a float linear layer (with qconfig set) into its replacement
+        qconfig: Quantization config attached to each layer before conversion
+
+    Returns:
+        Converted module, or the module itself if it contains no linear layer
+    """
+    replaced = {}
+    for name, child in module.named_children():
+        if type(child) is nn.Linear:
+            # Shallow copy shares the fp32 weights but keeps the qconfig off the original layer
+            layer = copy.copy(child)
+            layer.qconfig = qconfig
+            replaced[name] = convert(layer)
+        else:
+            converted = _replace_linear_layers(child, convert, qconfig)
+            if converted is not child:
+                replaced[name] = converted
+
+    if not replaced:
+        return module
+
+    result = copy.copy(module)
+    result._modules = {**module._modules, **replaced}
+    return result
+
+
+def quantize_static_model(model: nn.Module, calibration_images: torch.Tensor, batch_size: int = 8) -> nn.Module:
+    """
+    Apply static post-training int8 quantization with FX graph mode.
+
+    Args:
+        model: fp32 model (left untouched)
+        calibration_images: Calibration batch in the model's input space (N, C, H, W)
+        batch_size: Number of images per calibration forward pass
+
+    Returns:
+        Quantized copy of the model
+    """
+    if calibration_images.size(0) == 0:
+        raise ValueError("Static quantization needs at least one calibration image")
+
+    engine = select_quantized_engine()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        warnings.simplefilter("ignore", UserWarning)
+        from torch.ao.quantization import get_default_qconfig_mapping
+        from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+
+        example_inputs = (calibration_images[:1],)
+        prepared = prepare_fx(copy.deepcopy(model).eval(), get_default_qconfig_mapping(engine), example_inputs)
+
+        # Calibrate observers
+        with torch.no_grad():
+            for batch in torch.split(calibration_images, batch_size):
+                prepared(batch)
+
+        return convert_fx(prepared)
+
+
+def quantize_model(model: nn.Module, mode: str, calibration_images: Optional[torch.Tensor] = None) -> Optional[nn.Module]:
+    """
+    Build a quantized copy of a model for inference.
+
+    Args:
+        model: fp32 model (left untouched)
+        mode: Quantization mode ("none", "dynamic" or "static")
+        calibration_images: Calibration batch, required for static quantization
+
+    Returns:
+        Quantized model, or None for mode "none"
+
+    Raises:
+        ValueError: If the mode is unknown or static quantization has no calibration data
+    """
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization mode: {mode}. Available modes: {list(QUANTIZATION_MODES)}")
+
+    if mode == "none":
+        return None
+
+    if mode == "dynamic":
+        return quantize_dynamic_model(model)
+
+    if calibration_images is None:
+        raise ValueError("Static quantization requires calibration images")
+
+    return quantize_static_model(model, calibration_images)
+
+
+def load_calibration_images(directory: str, transform: Callable[[Image.Image], torch.Tensor], limit: int = 32) -> torch.Tensor:
+    """
+    Load a calibration batch from a local image folder.
+
+    Args:
+        directory: Folder containing calibration images
+        transform: Function turning a PIL image into a (1, C, H, W) model input
+        limit: Maximum number of images to load
+
+    Returns:
+        Calibration batch (N, C, H, W)
+
+    Raises:
+        ValueError: If the folder contains no usable images
+    """
+    paths = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.lower().endswith(CALIBRATION_EXTENSIONS)
+    )
+
+    tensors: List[torch.Tensor] = []
+    for path in paths[:limit]:
+        with Image.open(path) as image:
+            tensors.append(transform(image))
+
+    if not tensors:
+        raise ValueError(f"No calibration images found in {directory}")
+
+    return torch.cat(tensors)
+
+
+def compare_models(
+    reference: nn.Module, candidate: nn.Module, images: torch.Tensor, repeats: int = 5, top_k: int = 5
+) -> Dict[str, float]:
+    """
+    Compare a quantized model against its fp32 reference.
+
+    Args:
+        reference: fp32 model
+        candidate: Quantized model
+        images: Evaluation batch (N, C, H, W)
+        repeats: Number of timed forward passes per model
+        top_k: Size of the top-k sets compared for overlap
+
+    Returns:
+        Dictionary with top-1 agreement, top-k overlap and per-batch latencies in milliseconds
+    """
+    latencies = {}
+    outputs = {}
+
+    with torch.inference_mode():
+        for name, model in (("reference", reference), ("candidate", candidate)):
+            outputs[name] = model(images)  # Warm-up
+            start = time.perf_counter()
+            for _ in range(repeats):
+                model(images)
+            latencies[name] = (time.perf_counter() - start) / repeats * 1000
+
+    reference_top = outputs["reference"].topk(top_k, dim=1).indices
+    candidate_top = outputs["candidate"].topk(top_k, dim=1).indices
+    top1_agreement = (reference_top[:, 0] == candidate_top[:, 0]).float().mean().item()
+    overlap = (reference_top.unsqueeze(2) == candidate_top.unsqueeze(1)).any(dim=2).float().mean().item()
+
+    return {
+        "samples": float(images.size(0)),
+        "top1_agreement": top1_agreement,
+        "topk_overlap": overlap,
+        "reference_latency_ms": latencies["reference"],
+        "candidate_latency_ms": latencies["candidate"],
+        "speedup": latencies["reference"] / latencies["candidate"] if latencies["candidate"] > 0 else float("inf"),
+    }
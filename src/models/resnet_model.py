@@ -2,7 +2,6 @@
 ResNet model implementations
 """
 
-import requests
 import torch
 import torch.nn as nn
 import torchvision.models as models
@@ -12,6 +11,8 @@ from PIL import Image
 from config.settings import ModelConfig
 
 from .base_model import BaseModel, ModelLoadError
+from .class_names import get_imagenet_class_names
+from .weight_store import checkpoint_path, load_weights
 
 
 class ResNet18Model(BaseModel):
@@ -30,7 +31,11 @@ class ResNet18Model(BaseModel):
         """Load ResNet18 model."""
         try:
             # Load pretrained ResNet18 with updated API
-            if self.config.pretrained:
+            if self.config.weight_store_dir:
+                # Memory-mapped local checkpoint (offline, shared page cache)
+                path = checkpoint_path(self.config.weight_store_dir, "resnet18")
+                self.model = load_weights(models.resnet18, path, self.config.device)
+            elif self.config.pretrained:
                 self.model = models.resnet18(weights=models.ResNet18_Weights.IMAGENET1K_V1)
             else:
                 self.model = models.resnet18(weights=None)
@@ -47,25 +52,7 @@ class ResNet18Model(BaseModel):
 
     def _load_class_names(self):
         """Load ImageNet class names."""
-        try:
-            # ImageNet class names URL
-            url = "https://raw.githubusercontent.com/pytorch/hub/master/imagenet_classes.txt"
-
-            # Download class names
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            # Parse class names
-            self.class_names = [line.strip() for line in response.text.split("\n") if line.strip()]
-
-            # Ensure we have the right number of classes
-            if len(self.class_names) != self.config.num_classes:
-                print(f"Warning: Expected {self.config.num_classes} classes, got {len(self.class_names)}")
-
-        except Exception as e:
-            print(f"Warning: Failed to load ImageNet class names: {str(e)}")
-            # Fallback: create generic class names
-            self.class_names = [f"Class_{i}" for i in range(self.config.num_classes)]
+        self.class_names = get_imagenet_class_names(self.config)
 
 
 class ResNet50Model(BaseModel):
@@ -84,7 +71,11 @@ class ResNet50Model(BaseModel):
         """Load ResNet50 model."""
         try:
             # Load pretrained ResNet50 with updated API
-            if self.config.pretrained:
+            if self.config.weight_store_dir:
+                # Memory-mapped local checkpoint (offline, shared page cache)
+                path = checkpoint_path(self.config.weight_store_dir, "resnet50")
+                self.model = load_weights(models.resnet50, path, self.config.device)
+            elif self.config.pretrained:
                 self.model = models.resnet50(weights=models.ResNet50_Weights.IMAGENET1K_V1)
             else:
                 self.model = models.resnet50(weights=None)
@@ -101,22 +92,4 @@ class ResNet50Model(BaseModel):
 
     def _load_class_names(self):
         """Load ImageNet class names."""
-        try:
-            # ImageNet class names URL
-            url = "https://raw.githubusercontent.com/pytorch/hub/master/imagenet_classes.txt"
-
-            # Download class names
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            # Parse class names
-            self.class_names = [line.strip() for line in response.text.split("\n") if line.strip()]
-
-            # Ensure we have the right number of classes
-            if len(self.class_names) != self.config.num_classes:
-                print(f"Warning: Expected {self.config.num_classes} classes, got {len(self.class_names)}")
-
-        except Exception as e:
-            print(f"Warning: Failed to load ImageNet class names: {str(e)}")
-            # Fallback: create generic class names
-            self.class_names = [f"Class_{i}" for i in range(self.config.num_classes)]
+        self.class_names = get_imagenet_class_names(self.config)
@@ -0,0 +1,196 @@
+"""
+Background model warm-up, started by the first session of a process
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import torch
+import torch.nn.functional as F
+
+from config.settings import AppConfig
+from utils.atomic_file import atomic_write
+from utils.singleton import ProcessSingleton
+
+from .base_model import BaseModel
+from .model_registry import ModelRegistry
+
+WARMUP_STATES = ("pending", "running", "ready", "failed")
+
+
+class ModelWarmup:
+    """Loads models through the registry and runs dummy passes in a background thread."""
+
+    def __init__(
+        self, registry: ModelRegistry, model_types: List[str], iterations: int = 3, status_path: Optional[str] = None
+    ):
+        """
+        Initialize the model warm-up.
+
+        Args:
+            registry: Model registry used to load (and keep) the models
+            model_types: Types of model to warm up, in order
+            iterations: Number of dummy forward and backward passes per model
+            status_path: JSON file mirroring the warm-up status for external tools (None to disable)
+        """
+        self.registry = registry
+        self.model_types = list(model_types)
+        self.iterations = iterations
+        self.status_path = status_path
+
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.durations: Dict[str, float] = {}
+        self._ready = threading.Event()
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the warm-up thread (no-op if already started)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+        self._set_state("running")
+        self._thread.start()
+
+    def is_ready(self) -> bool:
+        """
+        Check whether every model has been loaded and warmed up.
+
+        Returns:
+            True once warm-up has completed successfully
+        """
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for warm-up to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if the models are ready, False on timeout or failure
+        """
+        self._done.wait(timeout)
+        return self.is_ready()
+
+    def get_status(self) -> dict:
+        """
+        Get the warm-up status.
+
+        Returns:
+            Dictionary with state, readiness, per-model durations and error
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "ready": self._ready.is_set(),
+                "models": list(self.model_types),
+                "durations_s": dict(self.durations),
+                "error": self.error,
+                "pid": os.getpid(),
+                "updated_at": time.time(),
+            }
+
+    def _run(self):
+        """Warm-up thread: load and exercise each model, then publish readiness."""
+        try:
+            for model_type in self.model_types:
+                start = time.perf_counter()
+                warm_up_model(self.registry.get_model(model_type), self.iterations)
+                with self._lock:
+                    self.durations[model_type] = time.perf_counter() - start
+                self._write_status()
+        except Exception as e:
+            with self._lock:
+                self.error = str(e)
+            self._set_state("failed")
+        else:
+            self._ready.set()
+            self._set_state("ready")
+        finally:
+            self._done.set()
+
+    def _set_state(self, state: str):
+        """
+        Update the warm-up state and mirror it to the status file.
+
+        Args:
+            state: New state
+        """
+        with self._lock:
+            self.state = state
+        self._write_status()
+
+    def _write_status(self):
+        """Atomically write the status file, if configured."""
+        if not self.status_path:
+            return
+
+        try:
+            with atomic_write(self.status_path) as tmp_path, open(tmp_path, "w") as f:
+                json.dump(self.get_status(), f)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Failed to write warm-up status to {self.status_path}: {str(e)}")
+
+
+def warm_up_model(model: BaseModel, iterations: int = 3):
+    """
+    Run dummy passes so the first real request sees steady-state latency.
+
+    Exercises the prediction path (including any quantized copy) and a
+    forward and backward pass through the attack model, as attacks do, so
+    compiled execution backends are built here rather than on first use.
+    Only the input gradient is computed, so no parameter gradients are stored.
+
+    Args:
+        model: Model to warm up
+        iterations: Number of passes of each kind
+    """
+    height, width = model.config.input_size
+    image = torch.rand(1, 3, height, width, device=model.device)
+
+    for _ in range(iterations):
+        logits = model.predict(image)
+
+        x = image.clone().requires_grad_(True)
+        loss = F.cross_entropy(model.get_attack_model()(x), logits.argmax(dim=1))
+        torch.autograd.grad(loss, x)
+
+
+_warmup: ProcessSingleton[ModelWarmup] = ProcessSingleton()
+
+
+def get_model_warmup(registry: ModelRegistry, config: AppConfig) -> ModelWarmup:
+    """
+    Get the process-wide model warm-up, starting it on first use.
+
+    Later sessions get the warm-up already running (or finished) instead of
+    warming the models up again.
+
+    Args:
+        registry: Model registry to warm up
+        config: Application configuration used when the warm-up is first created
+
+    Returns:
+        Shared model warm-up
+    """
+
+    def start_warmup() -> ModelWarmup:
+        performance = config.performance
+        warmup = ModelWarmup(
+            registry,
+            list(performance.warmup_models) or [config.model.model_type],
+            iterations=performance.warmup_iterations,
+            status_path=performance.warmup_status_path,
+        )
+        warmup.start()
+        return warmup
+
+    return _warmup.get(start_warmup)
@@ -0,0 +1,145 @@
+"""
+Local, memory-mapped checkpoint store for offline weight loading
+
+Checkpoints are plain state dicts saved in torch's zip format, one file per
+model type (``<weight_store_dir>/<model_type>.pt``). Loading memory-maps the
+file and assigns the mapped tensors directly to a model built on the meta
+device, so no weights are copied and every process loading the same file
+shares its page cache.
+
+Convert torchvision weights once with:
+    python -m models.weight_store --output-dir weights resnet18 resnet50  # run from src/
+"""
+
+import argparse
+import os
+from typing import Callable, Dict, List, Optional
+
+import torch
+import torch.nn as nn
+import torchvision.models as models
+
+from utils.atomic_file import atomic_write
+
+from .normalized_model import NormalizedModel
+
+CHECKPOINT_EXTENSION = ".pt"
+
+# Torchvision builders and pretrained weights for the supported model types
+TORCHVISION_MODELS: Dict[str, Callable[..., nn.Module]] = {
+    "resnet18": models.resnet18,
+    "resnet50": models.resnet50,
+}
+TORCHVISION_WEIGHTS = {
+    "resnet18": models.ResNet18_Weights.IMAGENET1K_V1,
+    "resnet50": models.ResNet50_Weights.IMAGENET1K_V1,
+}
+
+
+def checkpoint_path(directory: str, model_type: str) -> str:
+    """
+    Get the checkpoint file for a model type in a weight store.
+
+    Args:
+        directory: Weight store directory
+        model_type: Type of model
+
+    Returns:
+        Path of the checkpoint file
+    """
+    return os.path.join(directory, model_type + CHECKPOINT_EXTENSION)
+
+
+def load_weights(builder: Callable[[], nn.Module], path: str, device: str = "cpu") -> nn.Module:
+    """
+    Build a model and load its weights from a memory-mapped checkpoint.
+
+    The model is constructed on the meta device (no allocation or random
+    init) and the checkpoint tensors are assigned in place of its parameters.
+    Later conversions that rewrite weights (another device, channels_last,
+    conv/BN folding) make private copies of the affected tensors.
+
+    Args:
+        builder: Function creating the model architecture
+        path: Checkpoint file
+        device: Target device; weights stay memory-mapped on CPU
+
+    Returns:
+        Model in evaluation mode
+
+    Raises:
+        FileNotFoundError: If the checkpoint does not exist
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(
+            f"Checkpoint not found: {path}. Convert weights with 'python -m models.weight_store --output-dir <dir>'"
+        )
+
+    with torch.device("meta"):
+        model = builder()
+
+    state_dict = torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+    model.load_state_dict(state_dict, assign=True)
+
+    if torch.device(device).type != "cpu":
+        model = model.to(device)
+
+    return model.eval()
+
+
+def export_weights(model: nn.Module, path: str):
+    """
+    Save a model's weights as a checkpoint that can be memory-mapped.
+
+    A NormalizedModel wrapper is stripped so the checkpoint matches the bare
+    architecture built by the model classes. The file is written atomically.
+
+    Args:
+        model: Model to export
+        path: Destination checkpoint file
+    """
+    if isinstance(model, NormalizedModel):
+        model = model.model
+
+    state_dict = {name: tensor.detach().cpu().contiguous() for name, tensor in model.state_dict().items()}
+
+    with atomic_write(path) as tmp_path:
+        torch.save(state_dict, tmp_path)
+
+
+def convert_torchvision_weights(model_type: str, directory: str) -> str:
+    """
+    Download pretrained torchvision weights and store them as a checkpoint.
+
+    Args:
+        model_type: Type of model
+        directory: Weight store directory
+
+    Returns:
+        Path of the written checkpoint
+
+    Raises:
+        ValueError: If the model type is not supported
+    """
+    if model_type not in TORCHVISION_MODELS:
+        raise ValueError(f"Unsupported model type: {model_type}. Available models: {list(TORCHVISION_MODELS)}")
+
+    model = TORCHVISION_MODELS[model_type](weights=TORCHVISION_WEIGHTS[model_type])
+    path = checkpoint_path(directory, model_type)
+    export_weights(model, path)
+    return path
+
+
+def main(argv: Optional[List[str]] = None):
+    """Convert torchvision weights into a local weight store."""
+    parser = argparse.ArgumentParser(description="Convert pretrained weights into a memory-mappable weight store")
+    parser.add_argument("model_types", nargs="*", default=list(TORCHVISION_MODELS))
+    parser.add_argument("--output-dir", required=True, help="Weight store directory (ModelConfig.weight_store_dir)")
+    args = parser.parse_args(argv)
+
+    for model_type in args.model_types:
+        print(f"✅ {model_type}: {convert_torchvision_weights(model_type, args.output_dir)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Atomic file writes shared by the on-disk caches
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def atomic_write(path: str, suffix: str = ".tmp") -> Iterator[str]:
+    """
+    Write a file atomically through a temporary file in the same directory.
+
+    The block writes to the yielded temporary path, which replaces ``path``
+    when the block succeeds and is removed when it fails, so concurrent
+    readers (and other processes) never see a partial file.
+
+    Args:
+        path: Destination file (its directory is created if needed)
+        suffix: Suffix of the temporary file
+
+    Yields:
+        Temporary file path to write to
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=suffix)
+    os.close(fd)
+
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -3,15 +3,20 @@ Image processing utilities for Adversarial Comparator
 """
 
 import io
-from typing import Optional, Tuple, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 import torchvision.transforms as transforms
-from PIL import Image, UnidentifiedImageError
+from PIL import Image, ImageMode, UnidentifiedImageError
 
 from config.settings import UIConfig
 
+_PIXEL_MAX = np.float32(255)
+_SCALE_BLOCK = 1 << 16  # Elements per block of the float -> uint8 conversion (256 KB of float32)
+_SPLIT_MIN_PIXELS = 160 * 160  # From this size, splitting into planes beats a strided transpose
+
 
 class ImageProcessor:
     """Utility class for image processing operations."""
@@ -44,12 +49,19 @@ class ImageProcessor:
         except Exception as e:
             raise ValueError(f"Failed to load image from {file_path}: {str(e)}")
 
-    def load_image_from_bytes(self, image_bytes: bytes) -> Image.Image:
+    def load_image_from_bytes(self, image_bytes: bytes, min_size: Optional[int] = None) -> Image.Image:
         """
         Load image from bytes.
 
+        Only the header is read here; pixels are decoded on first use. With
+        ``min_size``, JPEGs are decoded at the smallest DCT scale (1/2, 1/4
+        or 1/8) that keeps both sides at least ``min_size`` pixels, which
+        cuts decode time and memory for large photos. Other formats, and
+        calls without ``min_size``, decode at full resolution.
+
         Args:
             image_bytes: Image data as bytes
+            min_size: Smallest side length needed by the caller (None for full resolution)
 
         Returns:
             PIL Image object
@@ -59,14 +71,21 @@ class ImageProcessor:
         """
         try:
             image = Image.open(io.BytesIO(image_bytes))
-            return image
         except Exception as e:
             raise ValueError(f"Failed to load image from bytes: {str(e)}")
 
+        if min_size:
+            reduce_decode_size(image, min_size)
+        return image
+
     def validate_image(self, image: Image.Image) -> bool:
         """
         Validate image format and size.
 
+        Works from the header alone (dimensions, mode and frame count), so a
+        lazily opened image is checked before any pixels are decoded and
+        decompression bombs are rejected without being expanded.
+
         Args:
             image: PIL Image to validate
 
@@ -85,11 +104,24 @@ class ImageProcessor:
             raise ValueError(f"Unsupported image mode: {image.mode}. Supported modes: RGB, RGBA, L")
 
         # Check image size (basic validation)
-        if image.size[0] <= 0 or image.size[1] <= 0:
+        width, height = image.size
+        if width <= 0 or height <= 0:
             raise ValueError("Image has invalid dimensions")
 
-        # Check if image is too large (rough estimate)
-        image_size = len(image.tobytes())
+        # Reject decompression bombs before decoding
+        if width * height > self.config.max_image_pixels:
+            raise ValueError(
+                f"Image has too many pixels: {width}x{height} ({width * height} pixels, "
+                f"max: {self.config.max_image_pixels})"
+            )
+
+        # Only the first frame is decoded, but animations are still bounded
+        frames = getattr(image, "n_frames", 1)
+        if frames > self.config.max_image_frames:
+            raise ValueError(f"Image has too many frames: {frames} (max: {self.config.max_image_frames})")
+
+        # Check decoded size
+        image_size = decoded_size(image)
         if image_size > self.config.max_image_size:
             raise ValueError(f"Image too large: {image_size} bytes (max: {self.config.max_image_size})")
 
@@ -136,10 +168,7 @@ class ImageProcessor:
         Returns:
             Normalized image tensor
         """
-        mean_tensor = torch.tensor(mean).view(3, 1, 1)
-        std_tensor = torch.tensor(std).view(3, 1, 1)
-
-        return (image - mean_tensor) / std_tensor
+        return (image - _channel_tensor(tuple(mean))) / _channel_tensor(tuple(std))
 
     def denormalize_image(
         self, image: torch.Tensor, mean: Tuple[float, float, float], std: Tuple[float, float, float]
@@ -155,17 +184,14 @@ class ImageProcessor:
         Returns:
             Denormalized image tensor
         """
-        mean_tensor = torch.tensor(mean).view(3, 1, 1)
-        std_tensor = torch.tensor(std).view(3, 1, 1)
-
-        return image * std_tensor + mean_tensor
+        return image * _channel_tensor(tuple(std)) + _channel_tensor(tuple(mean))
 
     def tensor_to_pil(self, tensor: torch.Tensor) -> Image.Image:
         """
         Convert tensor to PIL Image.
 
         Args:
-            tensor: Image tensor (C, H, W) or (B, C, H, W)
+            tensor: Pixel tensor in [0, 1], (C, H, W) or (1, C, H, W)
 
         Returns:
             PIL Image
@@ -174,41 +200,23 @@ class ImageProcessor:
         if tensor.dim() == 4:
             tensor = tensor.squeeze(0)
 
-        # Convert to numpy and transpose
-        image_array = tensor.detach().cpu().numpy()
-        image_array = np.transpose(image_array, (1, 2, 0))
-
-        # Clip to valid range
-        image_array = np.clip(image_array, 0, 1)
-
-        # Convert to PIL Image
-        image = Image.fromarray((image_array * 255).astype(np.uint8))
+        return pixels_to_images(tensor)[0]
 
-        return image
-
-    def pil_to_tensor(self, image: Image.Image) -> torch.Tensor:
+    def pil_to_tensor(self, image: Image.Image, channels_last: bool = False) -> torch.Tensor:
         """
         Convert PIL Image to tensor.
 
         Args:
             image: PIL Image
+            channels_last: Keep the interleaved (H, W, C) memory layout of the image
 
         Returns:
-            Image tensor (C, H, W)
+            Pixel tensor in [0, 1] (C, H, W)
         """
         # Convert to RGB if necessary
         image = self.convert_to_rgb(image)
 
-        # Convert to numpy and normalize
-        image_array = np.array(image).astype(np.float32) / 255.0
-
-        # Transpose to (C, H, W)
-        image_array = np.transpose(image_array, (2, 0, 1))
-
-        # Convert to tensor
-        tensor = torch.from_numpy(image_array)
-
-        return tensor
+        return pil_to_pixels(image, channels_last)
 
     def get_image_info(self, image: Image.Image) -> dict:
         """
@@ -220,7 +228,210 @@ class ImageProcessor:
         Returns:
             Dictionary with image information
         """
-        return {"size": image.size, "mode": image.mode, "format": image.format, "memory_size": len(image.tobytes())}
+        return {
+            "size": image.size,
+            "mode": image.mode,
+            "format": image.format,
+            "frames": getattr(image, "n_frames", 1),
+            "memory_size": decoded_size(image),
+        }
+
+
+def decoded_size(image: Image.Image) -> int:
+    """
+    Compute the size of an image's decoded pixels from its header.
+
+    Only the current frame is counted, as only that frame is ever decoded.
+
+    Args:
+        image: PIL Image (may be lazily opened)
+
+    Returns:
+        Size of the decoded pixel buffer in bytes
+    """
+    width, height = image.size
+    return width * height * _bytes_per_pixel(image.mode)
+
+
+def reduce_decode_size(image: Image.Image, min_size: int) -> Image.Image:
+    """
+    Configure a lazily opened JPEG to decode at a reduced scale.
+
+    Must be called before the pixels are loaded; images in other formats,
+    or already loaded, are left unchanged.
+
+    Args:
+        image: Image returned by Image.open
+        min_size: Smallest side length to keep
+
+    Returns:
+        The same image, with its size updated to the decode size
+    """
+    if image.format == "JPEG":
+        image.draft(None, (min_size, min_size))
+    return image
+
+
+def pil_to_pixels(image: Image.Image, channels_last: bool = False) -> torch.Tensor:
+    """
+    Convert an RGB PIL Image to a float pixel tensor in [0, 1].
+
+    With ``channels_last`` the tensor keeps the interleaved layout of the
+    image (a batch dimension added with ``unsqueeze(0)`` is then
+    ``torch.channels_last`` contiguous); otherwise it is a standard
+    contiguous tensor.
+
+    Args:
+        image: RGB PIL Image
+        channels_last: Keep the interleaved memory layout
+
+    Returns:
+        Pixel tensor (C, H, W)
+    """
+    return images_to_pixels([image], channels_last)[0]
+
+
+def images_to_pixels(images: List[Image.Image], channels_last: bool = False) -> torch.Tensor:
+    """
+    Convert equally sized RGB PIL Images to a float pixel batch in [0, 1].
+
+    The uint8 pixels exported by PIL are divided by 255 straight into the
+    batch with no float intermediates. This is not zero-copy: PIL exports
+    each image (or each plane) to a uint8 array first. For the standard
+    layout, small images are transposed from the interleaved array while
+    the read happens, and larger ones are split into planes by PIL, which
+    keeps the reads contiguous.
+
+    Args:
+        images: RGB PIL Images of the same size
+        channels_last: Return a ``torch.channels_last`` batch
+
+    Returns:
+        Pixel tensor (B, C, H, W)
+
+    Raises:
+        ValueError: If the images differ in size
+    """
+    width, height = images[0].size
+    if channels_last:
+        batch = np.empty((len(images), height, width, 3), dtype=np.float32)
+    else:
+        batch = np.empty((len(images), 3, height, width), dtype=np.float32)
+
+    for index, image in enumerate(images):
+        if image.size != (width, height):
+            raise ValueError(f"Image {index} has size {image.size}, expected {(width, height)}")
+
+        if channels_last:
+            np.divide(np.asarray(image), _PIXEL_MAX, out=batch[index], dtype=np.float32)
+        elif width * height < _SPLIT_MIN_PIXELS:
+            np.divide(np.asarray(image).transpose(2, 0, 1), _PIXEL_MAX, out=batch[index], dtype=np.float32)
+        else:
+            for channel, band in enumerate(image.split()):
+                np.divide(np.asarray(band), _PIXEL_MAX, out=batch[index, channel], dtype=np.float32)
+
+    pixels = torch.from_numpy(batch)
+    return pixels.permute(0, 3, 1, 2) if channels_last else pixels
+
+
+def pixels_to_uint8(pixels: torch.Tensor) -> torch.Tensor:
+    """
+    Convert float pixels in [0, 1] to uint8, keeping the (C, H, W) layout.
+
+    Scaling, clamping and the cast run block by block through a small
+    scratch buffer, so no full-size float intermediate is allocated. Values
+    are truncated, as by the original numpy conversion. Tensors on other
+    devices are converted there and only the uint8 result is copied back.
+
+    Args:
+        pixels: Pixel tensor (..., C, H, W)
+
+    Returns:
+        Contiguous uint8 CPU tensor with the same shape
+    """
+    pixels = pixels.detach()
+    if pixels.device.type != "cpu":
+        return pixels.mul(255).clamp_(0, 255).to(torch.uint8).cpu()
+
+    source = pixels.contiguous().numpy().reshape(-1)
+    output = np.empty(source.size, dtype=np.uint8)
+    scratch = np.empty(min(_SCALE_BLOCK, source.size), dtype=np.float32)
+
+    for start in range(0, source.size, _SCALE_BLOCK):
+        block = scratch[: min(_SCALE_BLOCK, source.size - start)]
+        np.multiply(source[start : start + block.size], _PIXEL_MAX, out=block)
+        np.clip(block, 0, _PIXEL_MAX, out=block)
+        output[start : start + block.size] = block
+
+    return torch.from_numpy(output.reshape(pixels.shape))
+
+
+def pixels_to_images(pixels: torch.Tensor) -> List[Image.Image]:
+    """
+    Convert float pixels in [0, 1] to PIL Images.
+
+    PIL merges the uint8 planes into its interleaved format, so the pixels
+    are never transposed as arrays.
+
+    Args:
+        pixels: Pixel tensor (C, H, W) or (B, C, H, W)
+
+    Returns:
+        List of RGB PIL Images (one for a (C, H, W) tensor)
+    """
+    if pixels.dim() == 3:
+        pixels = pixels.unsqueeze(0)
+
+    planes = pixels_to_uint8(pixels).numpy()
+    return [Image.merge("RGB", [Image.fromarray(plane) for plane in image]) for image in planes]
+
+
+class ToPixelTensor:
+    """Transform converting an RGB PIL Image to a float pixel tensor, optionally channels-last."""
+
+    def __init__(self, channels_last: bool = False):
+        """
+        Initialize the transform.
+
+        Args:
+            channels_last: Keep the interleaved (H, W, C) memory layout of the image
+        """
+        self.channels_last = channels_last
+
+    def __call__(self, image: Image.Image) -> torch.Tensor:
+        return pil_to_pixels(image, self.channels_last)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(channels_last={self.channels_last})"
+
+
+@lru_cache(maxsize=None)
+def _bytes_per_pixel(mode: str) -> int:
+    """
+    Get the decoded bytes per pixel of an image mode.
+
+    Args:
+        mode: PIL image mode
+
+    Returns:
+        Bytes per pixel
+    """
+    image_mode = ImageMode.getmode(mode)
+    return np.dtype(image_mode.typestr).itemsize * len(image_mode.bands)
+
+
+@lru_cache(maxsize=None)
+def _channel_tensor(values: Tuple[float, ...]) -> torch.Tensor:
+    """
+    Get a cached (C, 1, 1) tensor for per-channel statistics.
+
+    Args:
+        values: Per-channel values
+
+    Returns:
+        Tensor of shape (C, 1, 1)
+    """
+    return torch.tensor(values).view(-1, 1, 1)
 
 
 class ImageValidator:
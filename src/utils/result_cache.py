@@ -0,0 +1,213 @@
+"""
+Content-addressed LRU cache for predictions and attack results
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import numpy as np
+import torch
+from PIL import Image
+
+from .singleton import ProcessSingleton
+
+
+def image_digest(image: Image.Image) -> str:
+    """
+    Hash the decoded pixels of an image.
+
+    The same picture uploaded twice, under any file name, gets the same digest.
+
+    Args:
+        image: PIL Image
+
+    Returns:
+        Hex digest of mode, size and pixel data
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}:{image.size}".encode())
+    digest.update(np.ascontiguousarray(np.asarray(image)))
+    return digest.hexdigest()
+
+
+def make_cache_key(image_hash: str, model_type: str, operation: str, **params) -> str:
+    """
+    Build a cache key from an image digest, the model and the operation parameters.
+
+    Args:
+        image_hash: Digest from image_digest
+        model_type: Type of model
+        operation: Operation name (e.g. "predict" or an attack type)
+        **params: Parameters that affect the result
+
+    Returns:
+        Cache key
+    """
+    canonical = json.dumps(params, sort_keys=True, default=_canonical_value)
+    return f"{image_hash}:{model_type}:{operation}:{hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()}"
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value.
+
+    Tensors, arrays and images count their pixel buffers; containers are
+    walked recursively.
+
+    Args:
+        value: Cached value
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, torch.Tensor):
+        return value.element_size() * value.nelement()
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, Image.Image):
+        return value.width * value.height * len(value.getbands())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """LRU cache of results bounded by an approximate byte budget."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the result cache.
+
+        Args:
+            max_bytes: Total size of cached values before the least recently used are evicted
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a result, marking it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store a result, evicting the least recently used entries over the budget.
+
+        Args:
+            key: Cache key
+            value: Result to cache (tensors should be detached)
+
+        Returns:
+            True if stored, False if the value alone exceeds the budget
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+        return True
+
+    def clear(self):
+        """Drop every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size, budget, hits, misses, hit rate and evictions
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+def _canonical_value(value: Any) -> Any:
+    """
+    Convert parameter values json cannot encode.
+
+    Args:
+        value: Parameter value
+
+    Returns:
+        JSON-encodable equivalent
+    """
+    if isinstance(value, torch.Tensor):
+        return value.tolist()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return repr(value)
+
+
+_cache: ProcessSingleton[ResultCache] = ProcessSingleton()
+
+
+def get_result_cache(max_bytes: int = 256 * 1024 * 1024) -> ResultCache:
+    """
+    Get the process-wide result cache, creating it on first use.
+
+    A result computed in one session is served to any other session that
+    uploads the same pixels. The budget only applies when the cache is
+    first created.
+
+    Args:
+        max_bytes: Byte budget of the cache
+
+    Returns:
+        Shared result cache
+    """
+    return _cache.get(lambda: ResultCache(max_bytes))
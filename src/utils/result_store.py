@@ -0,0 +1,331 @@
+"""
+Persistent, content-addressed store for attack results
+
+Each run is recorded in a SQLite index under its result key (see
+``result_cache.make_cache_key``), together with the input hash, model,
+operation and parameters. Tensors and images are written as blob files
+sharded by their own content hash; JSON-encodable fields are kept in the
+index. The index runs in WAL mode and blobs are written atomically, so every
+worker process on the machine can share one store.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import torch
+from PIL import Image
+
+from .atomic_file import atomic_write
+from .singleton import ProcessSingleton
+
+# Default location of the store
+DEFAULT_RESULT_STORE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "adversarial_comparator", "results")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    key TEXT PRIMARY KEY,
+    image_hash TEXT NOT NULL,
+    model_type TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    params TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    key TEXT NOT NULL REFERENCES runs(key) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    blob TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (key, name)
+);
+CREATE INDEX IF NOT EXISTS runs_by_image ON runs (image_hash);
+"""
+
+BLOB_EXTENSIONS = {"tensor": ".pt", "image": ".png"}
+
+
+class ResultStore:
+    """SQLite-indexed result store with sharded blob files."""
+
+    def __init__(self, root_dir: Optional[str] = None, timeout: float = 30.0):
+        """
+        Initialize the result store, creating it if needed.
+
+        Args:
+            root_dir: Store directory (None for the default)
+            timeout: Seconds to wait for another process holding the index lock
+        """
+        self.root_dir = root_dir or DEFAULT_RESULT_STORE_DIR
+        self.blob_dir = os.path.join(self.root_dir, "blobs")
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.path.join(self.root_dir, "index.sqlite3"), timeout=timeout, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def put(
+        self,
+        key: str,
+        result: Dict[str, Any],
+        image_hash: str = "",
+        model_type: str = "",
+        operation: str = "",
+        params: Optional[dict] = None,
+    ):
+        """
+        Record a run and its artifacts, replacing any previous record under the key.
+
+        Tensors and PIL images become blob files; the other fields must be JSON-encodable.
+
+        Args:
+            key: Result key
+            result: Field name to value mapping
+            image_hash: Digest of the input image
+            model_type: Type of model
+            operation: Operation name (e.g. the attack type)
+            params: Operation parameters
+        """
+        fields = {}
+        artifacts = []
+        for name, value in result.items():
+            kind = _artifact_kind(value)
+            if kind is None:
+                fields[name] = value
+            else:
+                blob, size = self._write_blob(kind, _encode_artifact(kind, value))
+                artifacts.append((key, name, kind, blob, size))
+
+        row = (
+            key,
+            image_hash,
+            model_type,
+            operation,
+            json.dumps(params or {}, sort_keys=True, default=_json_value),
+            json.dumps(fields, default=_json_value),
+            time.time(),
+        )
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM runs WHERE key = ?", (key,))
+            self._connection.execute("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+            self._connection.executemany("INSERT INTO artifacts VALUES (?, ?, ?, ?, ?)", artifacts)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a recorded result.
+
+        Args:
+            key: Result key
+
+        Returns:
+            Field name to value mapping, or None if the key is unknown or an artifact is missing
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT fields FROM runs WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            artifacts = self._connection.execute("SELECT name, kind, blob FROM artifacts WHERE key = ?", (key,)).fetchall()
+
+        result = json.loads(row[0])
+        try:
+            for name, kind, blob in artifacts:
+                with open(self._blob_path(blob), "rb") as f:
+                    result[name] = _decode_artifact(kind, f.read())
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"Warning: Dropping unreadable stored result {key}: {str(e)}")
+            self.remove(key)
+            return None
+        return result
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM runs WHERE key = ?", (key,)).fetchone() is not None
+
+    def remove(self, key: str):
+        """
+        Remove a run from the index. Blobs are content-addressed and may be shared, so they are kept.
+
+        Args:
+            key: Result key
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM runs WHERE key = ?", (key,))
+
+    def list_runs(self, image_hash: Optional[str] = None) -> list:
+        """
+        List recorded runs, newest first.
+
+        Args:
+            image_hash: Only list runs on this input image
+
+        Returns:
+            List of dictionaries with key, image hash, model type, operation, parameters and creation time
+        """
+        query = "SELECT key, image_hash, model_type, operation, params, created_at FROM runs"
+        args: tuple = ()
+        if image_hash is not None:
+            query += " WHERE image_hash = ?"
+            args = (image_hash,)
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY created_at DESC", args).fetchall()
+
+        return [
+            {
+                "key": key,
+                "image_hash": row_hash,
+                "model_type": model_type,
+                "operation": operation,
+                "params": json.loads(params),
+                "created_at": created_at,
+            }
+            for key, row_hash, model_type, operation, params, created_at in rows
+        ]
+
+    def get_stats(self) -> dict:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with run count, artifact count and total artifact bytes
+        """
+        with self._lock:
+            runs = self._connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+            artifacts, size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM artifacts").fetchone()
+        return {"runs": runs, "artifacts": artifacts, "bytes": size, "root_dir": self.root_dir}
+
+    def close(self):
+        """Close the index connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _blob_path(self, blob: str) -> str:
+        """
+        Get the file of a blob, sharded by the first two bytes of its name.
+
+        Args:
+            blob: Blob file name
+
+        Returns:
+            Path of the blob file
+        """
+        return os.path.join(self.blob_dir, blob[:2], blob[2:4], blob)
+
+    def _write_blob(self, kind: str, data: bytes) -> tuple:
+        """
+        Write blob data under its content hash, skipping data that is already stored.
+
+        The file is written atomically, so concurrent writers and readers never see a partial blob.
+
+        Args:
+            kind: Artifact kind
+            data: Encoded artifact
+
+        Returns:
+            Tuple of blob file name and size in bytes
+        """
+        blob = hashlib.sha256(data).hexdigest() + BLOB_EXTENSIONS[kind]
+        path = self._blob_path(blob)
+        if not os.path.isfile(path):
+            with atomic_write(path) as tmp_path, open(tmp_path, "wb") as f:
+                f.write(data)
+        return blob, len(data)
+
+
+def _artifact_kind(value: Any) -> Optional[str]:
+    """
+    Get the artifact kind of a result field.
+
+    Args:
+        value: Field value
+
+    Returns:
+        "tensor", "image", or None for fields stored as JSON
+    """
+    if isinstance(value, torch.Tensor):
+        return "tensor"
+    if isinstance(value, Image.Image):
+        return "image"
+    return None
+
+
+def _encode_artifact(kind: str, value: Any) -> bytes:
+    """
+    Serialize an artifact.
+
+    Args:
+        kind: Artifact kind
+        value: Tensor or PIL image
+
+    Returns:
+        Encoded bytes
+    """
+    buffer = io.BytesIO()
+    if kind == "tensor":
+        torch.save(value.detach().cpu().contiguous(), buffer)
+    else:
+        value.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _decode_artifact(kind: str, data: bytes) -> Any:
+    """
+    Deserialize an artifact.
+
+    Args:
+        kind: Artifact kind
+        data: Encoded bytes
+
+    Returns:
+        Tensor or PIL image
+    """
+    if kind == "tensor":
+        return torch.load(io.BytesIO(data), map_location="cpu", weights_only=True)
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def _json_value(value: Any) -> Any:
+    """
+    Convert values json cannot encode.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        JSON-encodable equivalent
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return repr(value)
+
+
+_store: ProcessSingleton[ResultStore] = ProcessSingleton()
+
+
+def get_result_store(root_dir: Optional[str] = None) -> ResultStore:
+    """
+    Get the process-wide result store, opening it on first use.
+
+    One index connection per process is enough: it is thread-safe and the
+    store itself is shared between processes through the file system.
+
+    Args:
+        root_dir: Store directory used when the store is first opened (None for the default)
+
+    Returns:
+        Shared result store
+    """
+    return _store.get(lambda: ResultStore(root_dir))
@@ -0,0 +1,47 @@
+"""
+Lazily created process-wide instances
+
+Streamlit re-executes the app script on every rerun but keeps imported
+modules, so an instance held at module level is shared by every rerun and
+browser session served by the process.
+"""
+
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ProcessSingleton(Generic[T]):
+    """Holds one instance per process, created on first use."""
+
+    def __init__(self):
+        """Initialize an empty holder."""
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self, factory: Callable[[], T]) -> T:
+        """
+        Get the instance, creating it with ``factory`` on first use.
+
+        Args:
+            factory: Function building the instance (only called once)
+
+        Returns:
+            Shared instance
+        """
+        with self._lock:
+            if self._instance is None:
+                self._instance = factory()
+            return self._instance
+
+    def reset(self) -> Optional[T]:
+        """
+        Forget the instance, so the next get creates a new one.
+
+        Returns:
+            The previous instance, or None if there was none
+        """
+        with self._lock:
+            instance, self._instance = self._instance, None
+        return instance
@@ -0,0 +1,138 @@
+"""
+Process-wide torch thread settings and a bounded worker pool for attack and prediction work
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+import torch
+
+from .singleton import ProcessSingleton
+
+_threads_lock = threading.Lock()
+_threads_configured: Optional[Tuple[int, int]] = None
+
+_pool: ProcessSingleton[ThreadPoolExecutor] = ProcessSingleton()
+
+
+def resolve_intra_op_threads(intra_op_threads: int, workers: int) -> int:
+    """
+    Resolve the intra-op thread count.
+
+    With ``0`` the cores are split between the pool workers, so concurrent
+    jobs do not oversubscribe the CPU.
+
+    Args:
+        intra_op_threads: Configured threads per operator (0 for automatic)
+        workers: Number of pool workers running torch work concurrently
+
+    Returns:
+        Threads per operator
+    """
+    if intra_op_threads > 0:
+        return intra_op_threads
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def configure_torch_threads(intra_op_threads: int, inter_op_threads: int = 0) -> Tuple[int, int]:
+    """
+    Apply torch thread settings once per process.
+
+    The inter-op pool size can only be set before torch starts inter-op work;
+    if that is too late it is left unchanged with a warning.
+
+    Args:
+        intra_op_threads: Threads per operator (must be positive)
+        inter_op_threads: Inter-op pool size (0 leaves the torch default)
+
+    Returns:
+        Effective (intra-op, inter-op) thread counts
+    """
+    global _threads_configured
+
+    with _threads_lock:
+        if _threads_configured is not None:
+            return _threads_configured
+
+        torch.set_num_threads(intra_op_threads)
+        if inter_op_threads > 0:
+            try:
+                torch.set_num_interop_threads(inter_op_threads)
+            except RuntimeError as e:
+                print(f"Warning: Could not set inter-op threads to {inter_op_threads}: {str(e)}")
+
+        _threads_configured = (torch.get_num_threads(), torch.get_num_interop_threads())
+        return _threads_configured
+
+
+def get_worker_pool(max_workers: int = 2, intra_op_threads: int = 0) -> ThreadPoolExecutor:
+    """
+    Get the process-wide worker pool, creating it on first use.
+
+    At most ``max_workers`` jobs run at once; further jobs from other
+    sessions queue instead of competing for the cores. The settings only
+    apply when the pool is first created.
+
+    Args:
+        max_workers: Number of concurrent jobs
+        intra_op_threads: Threads per operator in each worker (0 for automatic)
+
+    Returns:
+        Shared thread pool
+    """
+    return _pool.get(
+        lambda: ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="attack-worker",
+            initializer=torch.set_num_threads,
+            initargs=(resolve_intra_op_threads(intra_op_threads, max_workers),),
+        )
+    )
+
+
+def submit_work(fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Submit a job to the worker pool.
+
+    Args:
+        fn: Function to run
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Future resolving to the function's result
+    """
+    return get_worker_pool().submit(fn, *args, **kwargs)
+
+
+def run_work(fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+    """
+    Run a job on the worker pool and wait for its result.
+
+    Args:
+        fn: Function to run
+        *args: Positional arguments
+        timeout: Maximum time to wait in seconds (None waits forever)
+        **kwargs: Keyword arguments
+
+    Returns:
+        The function's result
+
+    Raises:
+        concurrent.futures.TimeoutError: If the job does not finish in time
+    """
+    return submit_work(fn, *args, **kwargs).result(timeout=timeout)
+
+
+def shutdown_worker_pool(wait: bool = True):
+    """
+    Shut down the worker pool; the next call to get_worker_pool creates a new one.
+
+    Args:
+        wait: Whether to wait for running jobs to finish
+    """
+    pool = _pool.reset()
+    if pool is not None:
+        pool.shutdown(wait=wait)
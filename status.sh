@@ -97,6 +97,43 @@ check_port() {
     fi
 }
 
+# Function to check model warm-up (status file written by the running app)
+check_warmup() {
+    print_header "🔥 Model Warm-up"
+    
+    WARMUP_STATUS_FILE="${ADVERSARIAL_COMPARATOR_WARMUP_STATUS:-$HOME/.cache/adversarial_comparator/warmup_status.json}"
+    if [ ! -f "$WARMUP_STATUS_FILE" ]; then
+        print_status "No warm-up status file ($WARMUP_STATUS_FILE)"
+        return 1
+    fi
+    
+    # The file outlives the process that wrote it: only trust it if that process is the running app
+    WARMUP_PID=$(python3 -c "import json, sys; print(json.load(open(sys.argv[1])).get('pid', ''))" "$WARMUP_STATUS_FILE" 2>/dev/null || echo "")
+    if [ -z "$WARMUP_PID" ] || ! pgrep -f "streamlit.*app.py" 2>/dev/null | grep -qx "$WARMUP_PID"; then
+        print_status "Stale warm-up status file from a stopped process (pid ${WARMUP_PID:-unknown}); models are not warmed up yet"
+        return 1
+    fi
+    
+    WARMUP_STATE=$(python3 -c "import json, sys; print(json.load(open(sys.argv[1])).get('state', 'unknown'))" "$WARMUP_STATUS_FILE" 2>/dev/null || echo "unknown")
+    case "$WARMUP_STATE" in
+        ready)
+            print_success "Models are warmed up and READY"
+            return 0
+            ;;
+        running|pending)
+            print_status "Models are warming up..."
+            ;;
+        failed)
+            WARMUP_ERROR=$(python3 -c "import json, sys; print(json.load(open(sys.argv[1])).get('error'))" "$WARMUP_STATUS_FILE" 2>/dev/null || echo "unknown")
+            print_warning "Warm-up failed: $WARMUP_ERROR"
+            ;;
+        *)
+            print_warning "Unreadable warm-up status file ($WARMUP_STATUS_FILE)"
+            ;;
+    esac
+    return 1
+}
+
 # Function to check virtual environment
 check_venv() {
     print_header "🐍 Virtual Environment"
@@ -274,6 +311,14 @@ main() {
     
     echo ""
     
+    # Check model warm-up
+    MODELS_READY=false
+    if check_warmup; then
+        MODELS_READY=true
+    fi
+    
+    echo ""
+    
     # Check virtual environment
     check_venv
     
@@ -309,6 +354,9 @@ main() {
     if [ "$APP_RUNNING" = true ]; then
         print_success "✅ Application is RUNNING and ready to use"
         print_status "🌐 Access at: http://localhost:8501"
+        if [ "$MODELS_READY" != true ]; then
+            print_status "🔥 Models are not warmed up yet (first request may be slow)"
+        fi
     else
         print_status "⏸️  Application is NOT RUNNING"
         print_status "🚀 To start: ./start.sh"
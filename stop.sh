@@ -137,6 +137,9 @@ cleanup_temp_files() {
         print_status "Cleared Streamlit cache"
     fi
     
+    # Remove the warm-up status of the stopped process, so status.sh does not report it as ready
+    rm -f "${ADVERSARIAL_COMPARATOR_WARMUP_STATUS:-$HOME/.cache/adversarial_comparator/warmup_status.json}"
+    
     # Remove any Python cache files
     find . -type f -name "*.pyc" -delete 2>/dev/null || true
     find . -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for atomic file writes
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.atomic_file import atomic_write
+
+
+def test_successful_write_replaces_the_file(tmp_path):
+    """The file appears complete, in a directory created on demand."""
+    path = tmp_path / "nested" / "status.json"
+
+    with atomic_write(str(path)) as tmp_path_str, open(tmp_path_str, "w") as f:
+        f.write("new")
+
+    assert path.read_text() == "new"
+    assert os.listdir(path.parent) == ["status.json"]
+
+
+def test_failed_write_keeps_the_old_file_and_removes_the_temporary(tmp_path):
+    """A failure inside the block leaves no partial or temporary file behind."""
+    path = tmp_path / "status.json"
+    path.write_text("old")
+
+    with pytest.raises(TypeError):
+        with atomic_write(str(path)) as tmp_path_str, open(tmp_path_str, "w") as f:
+            f.write("partial")
+            raise TypeError("not serializable")
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["status.json"]
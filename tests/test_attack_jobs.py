@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for background attack jobs with progress and cancellation
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+import torch
+import torch.nn as nn
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from attacks.attack_jobs import AttackJobManager
+from attacks.base_attack import AttackCancelledError
+from attacks.pgd_attack import PGDAttack
+from utils.worker_pool import shutdown_worker_pool
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    """Give each test its own worker pool."""
+    shutdown_worker_pool()
+    yield
+    shutdown_worker_pool()
+
+
+def make_model():
+    """Create a small classifier."""
+    torch.manual_seed(0)
+    return nn.Sequential(
+        nn.Conv2d(3, 8, 3, padding=1), nn.ReLU(), nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(8, 10)
+    ).eval()
+
+
+def make_image():
+    """Create an image in [0, 1]."""
+    torch.manual_seed(1)
+    return torch.rand(1, 3, 16, 16)
+
+
+def test_progress_reported_every_step():
+    """PGD reports each completed step to the progress callback."""
+    attack = PGDAttack(epsilon=0.03, alpha=0.01, steps=5)
+    reports = []
+    attack.set_progress_callback(lambda completed, total: reports.append((completed, total)))
+
+    attack(make_image(), make_model())
+
+    assert reports == [(step, 5) for step in range(1, 6)]
+
+
+def test_cancel_event_stops_attack():
+    """A set cancel event stops the attack at the next step."""
+    attack = PGDAttack(epsilon=0.03, alpha=0.01, steps=5)
+    event = threading.Event()
+    event.set()
+    attack.set_cancel_event(event)
+
+    with pytest.raises(AttackCancelledError):
+        attack(make_image(), make_model())
+
+
+def test_job_runs_finalize_and_completes():
+    """A finished job holds the finalize result and full progress."""
+    manager = AttackJobManager()
+    image = make_image()
+    job = manager.submit(
+        PGDAttack(epsilon=0.03, alpha=0.01, steps=3),
+        image,
+        make_model(),
+        finalize=lambda adversarial, job: (adversarial - image).abs().max().item(),
+        description="pgd",
+    )
+    job.future.result(timeout=30)
+
+    status = job.get_status()
+    assert status["state"] == "done"
+    assert status["progress"] == 1.0
+    assert job.result <= 0.03 + 1e-6
+    assert manager.get(job.job_id) is job
+
+
+class BlockingModel(nn.Module):
+    """Wraps a model and blocks its first forward pass until released."""
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def forward(self, x):
+        self.started.set()
+        self.release.wait(timeout=10)
+        return self.model(x)
+
+
+def test_running_job_can_be_cancelled():
+    """Cancelling a running job stops it at the next step and marks it cancelled."""
+    manager = AttackJobManager()
+    model = BlockingModel(make_model())
+    job = manager.submit(PGDAttack(epsilon=0.03, alpha=0.01, steps=50), make_image(), model)
+
+    assert model.started.wait(timeout=10)
+    assert job.get_status()["state"] == "running"
+    assert manager.cancel(job.job_id)
+    model.release.set()
+    job.future.result(timeout=30)
+
+    assert job.state == "cancelled"
+    assert job.result is None
+    assert job.progress < 0.9
+
+
+def test_running_job_fails_after_timeout():
+    """A job running past its time limit stops at the next step and fails."""
+    manager = AttackJobManager()
+    model = BlockingModel(make_model())
+    job = manager.submit(PGDAttack(epsilon=0.03, alpha=0.01, steps=50), make_image(), model, timeout=0.05)
+
+    assert model.started.wait(timeout=10)
+    time.sleep(0.1)
+    model.release.set()
+    job.future.result(timeout=30)
+
+    assert job.state == "failed"
+    assert job.timed_out
+    assert "timed out" in job.error
+
+
+def test_queued_job_fails_after_timeout():
+    """A job still waiting for a worker fails as soon as its timeout is enforced."""
+    manager = AttackJobManager()
+    blockers = [BlockingModel(make_model()) for _ in range(2)]
+    running = [manager.submit(PGDAttack(epsilon=0.03, alpha=0.01, steps=1), make_image(), m) for m in blockers]
+    queued = manager.submit(PGDAttack(epsilon=0.03, alpha=0.01, steps=1), make_image(), make_model(), timeout=0.01)
+
+    time.sleep(0.05)
+    assert queued.enforce_timeout()
+    assert queued.state == "failed"
+    assert "timed out" in queued.error
+
+    for blocker, job in zip(blockers, running):
+        blocker.release.set()
+        job.future.result(timeout=30)
+
+
+def test_failed_job_records_error():
+    """Errors raised by finalize are captured on the job."""
+    manager = AttackJobManager()
+
+    def finalize(adversarial, job):
+        raise ValueError("broken post-processing")
+
+    job = manager.submit(PGDAttack(epsilon=0.03, alpha=0.01, steps=1), make_image(), make_model(), finalize=finalize)
+    job.future.result(timeout=30)
+
+    assert job.state == "failed"
+    assert "broken post-processing" in job.error
+
+
+def test_finished_jobs_are_pruned():
+    """Only the most recent finished jobs are kept."""
+    manager = AttackJobManager(max_finished_jobs=2)
+    jobs = []
+    for _ in range(4):
+        job = manager.submit(PGDAttack(epsilon=0.03, alpha=0.01, steps=1), make_image(), make_model())
+        job.future.result(timeout=30)
+        jobs.append(job)
+
+    manager.submit(PGDAttack(epsilon=0.03, alpha=0.01, steps=1), make_image(), make_model()).future.result(timeout=30)
+
+    assert manager.get(jobs[0].job_id) is None
+    assert manager.get(jobs[-1].job_id) is jobs[-1]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for vectorized batched top-k predictions
+"""
+
+import os
+import sys
+
+import numpy as np
+import torch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig
+from models.resnet_model import ResNet18Model
+
+
+def make_model():
+    """Create a small randomly initialized model."""
+    return ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+
+
+def test_batch_predictions_match_per_row_topk():
+    """Every row gets its own top-k ids, confidences and names."""
+    model = make_model()
+    logits = torch.randn(4, 1000)
+
+    batch = model.format_batch_predictions(logits, top_k=3)
+
+    expected_probs, expected_ids = torch.softmax(logits, dim=1).topk(3, dim=1)
+    assert batch["class_ids"].shape == (4, 3)
+    assert batch["class_ids"].flags["C_CONTIGUOUS"]
+    assert np.array_equal(batch["class_ids"], expected_ids.numpy())
+    assert np.allclose(batch["confidences"], expected_probs.numpy())
+    assert batch["class_names"][2, 0] == model.class_names[int(expected_ids[2, 0])]
+
+
+def test_format_predictions_uses_first_row():
+    """The single-image formatter returns plain Python values for row 0."""
+    model = make_model()
+    logits = torch.randn(2, 1000)
+
+    predictions = model.format_predictions(logits, top_k=5)
+    batch = model.format_batch_predictions(logits, top_k=5)
+
+    assert [p["class_id"] for p in predictions] == batch["class_ids"][0].tolist()
+    assert all(type(p["class_id"]) is int and type(p["confidence"]) is float for p in predictions)
+    assert all(type(p["class_name"]) is str for p in predictions)
+
+
+def test_missing_class_names_fall_back_to_generic_labels():
+    """Ids beyond the loaded names map to Class_i."""
+    model = make_model()
+    model.class_names = ["only"]
+    model._build_class_name_array()
+
+    logits = torch.zeros(1, 1000)
+    logits[0, 7] = 10.0
+
+    assert model.format_predictions(logits, top_k=1)[0]["class_name"] == "Class_7"
+
+
+def test_get_batch_predictions_runs_the_model():
+    """The batched API predicts and formats a whole batch at once."""
+    model = make_model()
+
+    batch = model.get_batch_predictions(torch.rand(3, 3, 32, 32), top_k=2)
+
+    assert batch["confidences"].shape == (3, 2)
+    assert np.all(batch["confidences"][:, 0] >= batch["confidences"][:, 1])
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for batched attack execution
+"""
+
+import os
+import sys
+
+import pytest
+import torch
+import torch.nn as nn
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from attacks.base_attack import InvalidAttackParametersError
+from attacks.fgsm_attack import FGSMAttack, FGSMWithTargetAttack
+from attacks.pgd_attack import PGDAttack
+from attacks.targeted_fgsm import TargetedFGSMAttack
+
+
+def make_model(num_classes=1000):
+    """Create a small deterministic classifier."""
+    torch.manual_seed(0)
+    model = nn.Sequential(
+        nn.Conv2d(3, 4, kernel_size=3, padding=1),
+        nn.ReLU(),
+        nn.AdaptiveAvgPool2d(1),
+        nn.Flatten(),
+        nn.Linear(4, num_classes),
+    )
+    return model.eval()
+
+
+def make_batch(batch_size=4):
+    """Create a batch of images in [0, 1]."""
+    torch.manual_seed(1)
+    return torch.rand(batch_size, 3, 16, 16)
+
+
+@pytest.mark.parametrize(
+    "attack",
+    [
+        FGSMAttack(epsilon=0.1),
+        FGSMWithTargetAttack(epsilon=0.1, target_class=3),
+        TargetedFGSMAttack(epsilon=0.1),
+        PGDAttack(epsilon=0.1, alpha=0.02, steps=3),
+    ],
+)
+def test_attacks_accept_batches(attack):
+    """Every attack returns one adversarial example per input sample."""
+    model = make_model()
+    images = make_batch()
+
+    adversarial = attack(images, model)
+
+    assert adversarial.shape == images.shape
+    assert adversarial.min() >= 0 and adversarial.max() <= 1
+    linf = attack.compute_perturbation_linf(images, adversarial, per_sample=True)
+    assert linf.shape == (images.size(0),)
+    assert torch.all(linf <= 0.1 + 1e-6)
+
+
+def test_fgsm_batch_matches_single_sample_calls():
+    """Batching does not change the per-sample result."""
+    model = make_model()
+    images = make_batch()
+    attack = FGSMAttack(epsilon=0.05)
+
+    batched = attack(images, model)
+    single = torch.cat([attack(images[i : i + 1], model) for i in range(images.size(0))])
+
+    assert torch.allclose(batched, single, atol=1e-6)
+
+
+def test_per_sample_epsilon():
+    """A tensor epsilon bounds each sample's perturbation separately."""
+    model = make_model()
+    images = make_batch()
+    epsilon = torch.tensor([0.0, 0.01, 0.05, 0.1])
+
+    for attack in (FGSMAttack(epsilon=epsilon), PGDAttack(epsilon=epsilon, alpha=0.02, steps=3)):
+        adversarial = attack(images, model)
+        linf = attack.compute_perturbation_linf(images, adversarial, per_sample=True)
+        assert torch.all(linf <= epsilon + 1e-6)
+        assert linf[0] == 0
+
+
+def test_per_sample_targets():
+    """Targeted PGD accepts one target class per sample."""
+    model = make_model()
+    images = make_batch()
+    targets = torch.tensor([0, 1, 2, 3])
+
+    attack = PGDAttack(epsilon=0.5, alpha=0.05, steps=20, random_start=False, targeted=True, target_class=targets)
+    adversarial = attack(images, model)
+
+    with torch.no_grad():
+        clean_loss = nn.functional.cross_entropy(model(images), targets, reduction="none")
+        adversarial_loss = nn.functional.cross_entropy(model(adversarial), targets, reduction="none")
+    assert torch.all(adversarial_loss <= clean_loss)
+
+
+def test_untargeted_pgd_increases_loss():
+    """Untargeted PGD moves away from the clean prediction."""
+    model = make_model()
+    images = make_batch()
+    with torch.no_grad():
+        labels = model(images).argmax(dim=1)
+
+    attack = PGDAttack(epsilon=0.3, alpha=0.05, steps=10, random_start=False)
+    adversarial = attack(images, model)
+
+    with torch.no_grad():
+        clean_loss = nn.functional.cross_entropy(model(images), labels, reduction="none")
+        adversarial_loss = nn.functional.cross_entropy(model(adversarial), labels, reduction="none")
+    assert torch.all(adversarial_loss >= clean_loss)
+
+
+def test_parameter_shape_mismatch_is_rejected():
+    """Per-sample parameters must match the batch size."""
+    model = make_model()
+    images = make_batch()
+
+    with pytest.raises(InvalidAttackParametersError):
+        PGDAttack(epsilon=torch.tensor([0.1, 0.2]), steps=1)(images, model)
+
+    with pytest.raises(InvalidAttackParametersError):
+        TargetedFGSMAttack(target_class=torch.tensor([1, 2, 3]))(images, model)
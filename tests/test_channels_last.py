@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for channels-last inference with conv/BN folding
+"""
+
+import os
+import sys
+
+import numpy as np
+import torch
+import torchvision.transforms as transforms
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig, UIConfig
+from models.resnet_model import ResNet18Model
+from utils.image_processing import ImageProcessor, pil_to_pixels
+
+
+def make_image(size=(40, 30)):
+    """Create a random RGB image."""
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, size=(size[1], size[0], 3), dtype=np.uint8))
+
+
+def test_pil_to_pixels_matches_to_tensor():
+    """Both layouts hold the same values as torchvision's ToTensor."""
+    image = make_image()
+    expected = transforms.ToTensor()(image)
+
+    channels_last = pil_to_pixels(image, channels_last=True)
+    contiguous = ImageProcessor(UIConfig()).pil_to_tensor(image)
+
+    assert torch.equal(channels_last, expected)
+    assert torch.equal(contiguous, expected)
+    assert channels_last.unsqueeze(0).is_contiguous(memory_format=torch.channels_last)
+    assert contiguous.is_contiguous()
+
+
+def test_channels_last_model_matches_standard_model():
+    """Folded channels-last predictions match the standard layout."""
+    torch.manual_seed(0)
+    fast = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32), channels_last=True))
+    reference = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+    reference.model.load_state_dict(fast.model.state_dict())
+
+    image = fast.preprocess(make_image())
+
+    assert image.is_contiguous(memory_format=torch.channels_last)
+    assert fast.model.model.conv1.weight.is_contiguous(memory_format=torch.channels_last)
+    assert fast.get_inference_model() is fast.fused_model
+    assert not any(isinstance(m, torch.nn.BatchNorm2d) for m in fast.fused_model.modules())
+    assert torch.allclose(fast.predict(image), reference.predict(reference.preprocess(make_image())), atol=1e-4)
+
+
+def test_attacks_keep_the_unfolded_model():
+    """Gradient-based attacks still run on the original module."""
+    model = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32), channels_last=True))
+
+    assert model.get_attack_model() is model.model
+    assert any(isinstance(m, torch.nn.BatchNorm2d) for m in model.model.modules())
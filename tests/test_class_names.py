@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for offline class-name loading
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig
+from models.class_names import IMAGENET_CLASSES_PATH, get_imagenet_class_names, load_class_names
+from models.resnet_model import ResNet18Model
+
+
+def test_bundled_imagenet_classes():
+    """The bundled asset provides all ImageNet class names."""
+    class_names = get_imagenet_class_names(ModelConfig())
+
+    assert len(class_names) == 1000
+    assert class_names[0] == "tench"
+
+
+def test_class_names_are_loaded_once():
+    """Repeated loads of the same file hit the memoized result."""
+    assert load_class_names(IMAGENET_CLASSES_PATH) is load_class_names(IMAGENET_CLASSES_PATH)
+
+
+def test_local_override_path(tmp_path):
+    """ModelConfig.class_names_path overrides the bundled labels."""
+    labels = tmp_path / "labels.txt"
+    labels.write_text("cat\ndog\n\n", encoding="utf-8")
+
+    class_names = get_imagenet_class_names(ModelConfig(num_classes=2, class_names_path=str(labels)))
+
+    assert class_names == ["cat", "dog"]
+
+
+def test_missing_override_falls_back_to_generic_names(tmp_path):
+    """An unreadable label file falls back to generic names."""
+    config = ModelConfig(num_classes=3, class_names_path=str(tmp_path / "missing.txt"))
+
+    assert get_imagenet_class_names(config) == ["Class_0", "Class_1", "Class_2"]
+
+
+def test_model_construction_uses_bundled_names():
+    """Building a model loads class names without a network round trip."""
+    model = ResNet18Model(ModelConfig(pretrained=False))
+
+    assert model.get_class_names()[1] == "goldfish"
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the selectable execution backends
+
+torch.compile needs a C compiler and is slow to build, so these tests use
+the TorchScript backend, which shares the same caching wrapper.
+"""
+
+import os
+import sys
+
+import pytest
+import torch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from attacks.pgd_attack import PGDAttack
+from config.settings import ModelConfig
+from models.execution_backend import CompiledModule, build_execution_model
+from models.resnet_model import ResNet18Model
+
+
+def make_model(backend):
+    """Create a small randomly initialized model on a backend."""
+    torch.manual_seed(0)
+    return ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32), execution_backend=backend))
+
+
+def test_eager_backend_uses_the_model_directly():
+    """Eager execution adds no wrapper."""
+    model = make_model("eager")
+
+    assert model.get_attack_model() is model.model
+    assert model.get_inference_model() is model.model
+
+
+def test_torchscript_predict_matches_eager():
+    """Traced predictions match the eager model."""
+    model = make_model("torchscript")
+    image = torch.rand(2, 3, 32, 32)
+
+    with torch.no_grad():
+        expected = model.model(image)
+
+    assert isinstance(model.get_inference_model(), CompiledModule)
+    assert torch.allclose(model.predict(image), expected, atol=1e-5)
+
+
+def test_compiled_forms_are_cached_per_signature():
+    """Each (sample shape, dtype, grad mode) is traced once and then reused for any batch size."""
+    model = make_model("torchscript")
+    compiled = model.execution_model
+
+    model.predict(torch.rand(1, 3, 32, 32))
+    model.predict(torch.rand(1, 3, 32, 32))
+    assert compiled.cache_size() == 1
+
+    batch = torch.rand(3, 3, 32, 32)
+    assert torch.allclose(model.predict(batch), model.model(batch), atol=1e-5)
+    assert compiled.cache_size() == 1
+
+    model.predict(torch.rand(1, 3, 24, 24))
+    assert compiled.cache_size() == 2
+
+    first = compiled.get_compiled(torch.rand(1, 3, 32, 32))
+    assert compiled.get_compiled(torch.rand(1, 3, 32, 32)) is first
+
+
+def test_compiled_cache_is_bounded():
+    """The least recently used compiled forms are dropped over the limit."""
+    compiled = CompiledModule(torch.nn.Conv2d(3, 4, 3), "torchscript", max_compiled=2)
+
+    for size in (8, 10, 12):
+        compiled(torch.rand(1, 3, size, size))
+
+    assert compiled.cache_size() == 2
+
+
+def test_pgd_runs_on_the_compiled_model():
+    """The PGD forward and backward step works through the traced model."""
+    model = make_model("torchscript")
+    image = torch.rand(2, 3, 32, 32)
+    attack = PGDAttack(epsilon=0.03, alpha=0.01, steps=3, random_start=False)
+
+    compiled = attack(image, model.get_attack_model())
+    eager = attack(image, model.model)
+
+    assert torch.allclose(compiled, eager, atol=1e-5)
+
+
+def test_unknown_backend_is_rejected():
+    """Only the known backends are accepted."""
+    with pytest.raises(ValueError):
+        build_execution_model(torch.nn.Identity(), "tensorrt")
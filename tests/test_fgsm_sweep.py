@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the FGSM epsilon sweep
+"""
+
+import os
+import sys
+
+import torch
+import torch.nn as nn
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from attacks.fgsm_attack import FGSMAttack
+
+
+class CountingModel(nn.Module):
+    """Small classifier that counts forward and backward passes."""
+
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.net = nn.Sequential(
+            nn.Conv2d(3, 4, 3, padding=1), nn.ReLU(), nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(4, 10)
+        )
+        self.forward_calls = 0
+        self.backward_calls = 0
+
+    def forward(self, x):
+        self.forward_calls += 1
+        if x.requires_grad:
+            x.register_hook(self._count_backward)
+        return self.net(x)
+
+    def _count_backward(self, grad):
+        self.backward_calls += 1
+        return grad
+
+
+def test_sweep_matches_individual_attacks():
+    """Each sweep entry equals a standalone FGSM attack at that epsilon."""
+    FGSMAttack.clear_gradient_cache()
+    model = CountingModel().eval()
+    torch.manual_seed(1)
+    image = torch.rand(1, 3, 16, 16)
+    epsilons = [0.0, 0.05, 0.1, 0.2]
+
+    sweep = FGSMAttack().sweep(image, model, epsilons)
+
+    assert sweep["adversarial"].shape == (4, 1, 3, 16, 16)
+    for i, epsilon in enumerate(epsilons):
+        expected = FGSMAttack(epsilon=epsilon)(image, model)
+        assert torch.allclose(sweep["adversarial"][i], expected, atol=1e-6)
+    assert not sweep["success"][0, 0]
+
+
+def test_gradient_is_computed_once_per_image_and_model():
+    """Changing epsilon reuses the cached gradient; the sweep needs one forward."""
+    FGSMAttack.clear_gradient_cache()
+    model = CountingModel().eval()
+    torch.manual_seed(2)
+    image = torch.rand(2, 3, 16, 16)
+
+    FGSMAttack(epsilon=0.1, cache_gradients=True)(image, model)
+    FGSMAttack(epsilon=0.2, cache_gradients=True)(image.clone(), model)
+    assert model.backward_calls == 1
+
+    forward_calls = model.forward_calls
+    sweep = FGSMAttack(cache_gradients=True).sweep(image, model, torch.linspace(0.0, 0.3, 7))
+
+    assert model.backward_calls == 1
+    assert model.forward_calls == forward_calls + 1
+    assert sweep["confidence"].shape == (7, 2)
+    assert sweep["original_confidence"].shape == (7, 2)
+
+
+def test_gradient_cache_is_opt_in():
+    """Without cache_gradients every call computes its own gradient."""
+    FGSMAttack.clear_gradient_cache()
+    model = CountingModel().eval()
+    image = torch.rand(1, 3, 16, 16)
+
+    FGSMAttack(epsilon=0.1)(image, model)
+    FGSMAttack(epsilon=0.2)(image, model)
+
+    assert model.backward_calls == 2
+    assert FGSMAttack.get_gradient_cache_bytes() == 0
+
+
+def test_gradient_cache_tracks_weights_and_models():
+    """Reloaded weights and freed models never serve stale gradients."""
+    FGSMAttack.clear_gradient_cache()
+    model = CountingModel().eval()
+    image = torch.rand(1, 3, 16, 16)
+    attack = FGSMAttack(epsilon=0.1, cache_gradients=True)
+
+    attack(image, model)
+    model.load_state_dict(CountingModel().state_dict())
+    attack(image, model)
+    assert model.backward_calls == 2
+
+    del model
+    assert FGSMAttack.get_gradient_cache_bytes() == 0
+
+
+def test_gradient_cache_is_bounded_by_bytes(monkeypatch):
+    """The least recently used gradients are evicted over the byte budget."""
+    FGSMAttack.clear_gradient_cache()
+    model = CountingModel().eval()
+    entry_bytes = 3 * 16 * 16 + 8
+    monkeypatch.setattr(FGSMAttack, "gradient_cache_bytes", 2 * entry_bytes)
+    attack = FGSMAttack(epsilon=0.1, cache_gradients=True)
+
+    for seed in range(3):
+        attack(torch.rand(1, 3, 16, 16, generator=torch.Generator().manual_seed(seed)), model)
+
+    assert FGSMAttack.get_gradient_cache_bytes() == 2 * entry_bytes
+    FGSMAttack.clear_gradient_cache()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for reduced-scale decoding of uploads
+"""
+
+import io
+import os
+import sys
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import UIConfig
+from utils.image_processing import ImageProcessor, pil_to_pixels
+
+
+def encode(size=(1600, 1200), image_format="JPEG"):
+    """Encode a smooth synthetic photo."""
+    torch.manual_seed(0)
+    noise = torch.rand(1, 3, size[1] // 16, size[0] // 16)
+    pixels = F.interpolate(noise, size=(size[1], size[0]), mode="bilinear", align_corners=False)[0]
+    image = Image.fromarray((pixels.permute(1, 2, 0) * 255).to(torch.uint8).numpy())
+
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def model_input(image):
+    """Resize to a 224x224 model input in [0, 1]."""
+    return pil_to_pixels(image.convert("RGB").resize((224, 224), Image.Resampling.BILINEAR))
+
+
+def test_jpeg_decodes_near_min_size():
+    """Large JPEGs decode at a reduced scale that keeps both sides at least min_size."""
+    processor = ImageProcessor(UIConfig())
+    image = processor.load_image_from_bytes(encode(), min_size=256)
+    image.load()
+
+    assert image.size == (400, 300)
+    assert min(image.size) >= 256
+
+
+def test_full_resolution_without_min_size():
+    """Without min_size, or for small images, the image decodes at full resolution."""
+    processor = ImageProcessor(UIConfig())
+    assert processor.load_image_from_bytes(encode()).size == (1600, 1200)
+    assert processor.load_image_from_bytes(encode(), min_size=1000).size == (1600, 1200)
+
+
+def test_other_formats_are_unchanged():
+    """Only JPEGs support reduced-scale decoding."""
+    processor = ImageProcessor(UIConfig())
+    assert processor.load_image_from_bytes(encode(image_format="PNG"), min_size=256).size == (1600, 1200)
+
+
+def test_reduced_decode_keeps_model_input():
+    """The model input from a reduced decode matches the one from a full decode."""
+    processor = ImageProcessor(UIConfig())
+    data = encode()
+
+    full = model_input(processor.load_image_from_bytes(data))
+    reduced = model_input(processor.load_image_from_bytes(data, min_size=256))
+
+    assert (full - reduced).abs().mean() < 0.01
+    assert np.isclose(full.mean().item(), reduced.mean().item(), atol=0.005)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for header-only image validation
+"""
+
+import io
+import os
+import sys
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import UIConfig
+from utils.image_processing import ImageProcessor, decoded_size
+
+
+def open_lazily(size=(120, 80), mode="RGB", image_format="PNG"):
+    """Encode an image and reopen it without decoding the pixels."""
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format=image_format)
+    return Image.open(io.BytesIO(buffer.getvalue()))
+
+
+def test_decoded_size_matches_pixel_buffer():
+    """The arithmetic size equals the raw pixel buffer for the supported modes."""
+    for mode in ("RGB", "RGBA", "L"):
+        image = Image.new(mode, (37, 21))
+        assert decoded_size(image) == len(image.tobytes())
+
+
+def test_validation_does_not_decode():
+    """A valid image passes validation without its pixels being decoded."""
+    processor = ImageProcessor(UIConfig())
+    image = open_lazily()
+
+    assert processor.validate_image(image)
+    assert image.tile, "pixels were decoded during validation"
+
+    info = processor.get_image_info(image)
+    assert info["memory_size"] == 120 * 80 * 3
+    assert info["frames"] == 1
+    assert info["format"] == "PNG"
+    assert image.tile
+
+
+def test_pixel_limit_rejects_before_decode():
+    """Images over the pixel limit are rejected from the header alone."""
+    processor = ImageProcessor(UIConfig(max_image_pixels=120 * 80 - 1))
+    image = open_lazily()
+
+    with pytest.raises(ValueError, match="too many pixels"):
+        processor.validate_image(image)
+    assert image.tile
+
+
+def test_decoded_size_limit():
+    """The decoded byte budget is enforced arithmetically."""
+    processor = ImageProcessor(UIConfig(max_image_size=120 * 80 * 3 - 1))
+
+    with pytest.raises(ValueError, match="Image too large"):
+        processor.validate_image(open_lazily())
+    assert ImageProcessor(UIConfig(max_image_size=120 * 80)).validate_image(open_lazily(mode="L"))
+
+
+def test_unsupported_mode_rejected():
+    """Palette images are still rejected by mode."""
+    with pytest.raises(ValueError, match="Unsupported image mode"):
+        ImageProcessor(UIConfig()).validate_image(open_lazily(mode="P"))
+
+
+def test_frame_limit_rejects_animations():
+    """Animated images with more frames than allowed are rejected from the header."""
+    buffer = io.BytesIO()
+    frames = [Image.new("RGB", (16, 16), (value, 0, 0)) for value in (0, 80, 160)]
+    frames[0].save(buffer, format="PNG", save_all=True, append_images=frames[1:])
+
+    image = Image.open(io.BytesIO(buffer.getvalue()))
+    with pytest.raises(ValueError, match="too many frames"):
+        ImageProcessor(UIConfig(max_image_frames=2)).validate_image(image)
+    assert image.tile
+
+    assert ImageProcessor(UIConfig(max_image_frames=3)).validate_image(image)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the load-time inference setup of BaseModel.predict
+"""
+
+import os
+import sys
+
+import torch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig
+from models.resnet_model import ResNet18Model
+
+
+def make_model():
+    """Create a small randomly initialized model."""
+    return ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32), device="cpu"))
+
+
+def test_model_is_placed_and_in_eval_mode_after_load():
+    """Placement and mode are fixed once when the model is built."""
+    model = make_model()
+
+    assert model.device == torch.device("cpu")
+    assert not model.model.training
+    assert all(p.device == model.device for p in model.model.parameters())
+
+
+def test_predict_does_not_switch_mode_or_move_the_model(monkeypatch):
+    """predict runs the forward without per-call eval() or .to() on the model."""
+    model = make_model()
+    calls = []
+    monkeypatch.setattr(model.model, "eval", lambda: calls.append("eval"))
+    monkeypatch.setattr(model.model, "to", lambda *args, **kwargs: calls.append("to"))
+
+    logits = model.predict(torch.rand(2, 3, 32, 32))
+
+    assert calls == []
+    assert logits.shape == (2, 1000)
+    assert logits.is_inference()
+    assert torch.is_grad_enabled()
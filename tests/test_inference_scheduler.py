@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the micro-batching inference scheduler
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+import torch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.base_model import PredictionError
+from models.inference_scheduler import InferenceScheduler
+
+
+class FakeModel:
+    """Stand-in for BaseModel whose logits encode the input."""
+
+    def __init__(self, fail=False):
+        self.batch_sizes = []
+        self.fail = fail
+        self.class_names = [f"label_{i}" for i in range(4)]
+
+    def predict(self, image):
+        self.batch_sizes.append(image.size(0))
+        if self.fail:
+            raise RuntimeError("boom")
+        # Logit i of each row is the row's mean value times (i + 1)
+        return image.flatten(1).mean(dim=1, keepdim=True) * torch.arange(1, 5, dtype=image.dtype)
+
+    def format_predictions(self, logits, top_k=5):
+        return [{"class_id": int(logits[0].argmax()), "confidence": float(logits[0].max())}]
+
+
+def test_concurrent_requests_share_a_batch():
+    """Requests arriving within the wait window run in one forward pass."""
+    model = FakeModel()
+    scheduler = InferenceScheduler(model, max_batch_size=8, max_wait_ms=200)
+    images = [torch.full((1, 3, 4, 4), float(i)) for i in range(5)]
+    results = {}
+    barrier = threading.Barrier(5)
+
+    def worker(i):
+        barrier.wait()
+        results[i] = scheduler.predict(images[i], timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    scheduler.shutdown()
+
+    assert sum(model.batch_sizes) == 5
+    assert len(model.batch_sizes) < 5
+    for i in range(5):
+        assert torch.allclose(results[i], float(i) * torch.arange(1, 5, dtype=torch.float32).view(1, 4))
+
+
+def test_batch_size_is_bounded():
+    """No forward pass exceeds the maximum batch size."""
+    model = FakeModel()
+    scheduler = InferenceScheduler(model, max_batch_size=3, max_wait_ms=100)
+
+    futures = [scheduler.submit(torch.rand(1, 3, 4, 4)) for _ in range(7)]
+    for future in futures:
+        future.result(timeout=5)
+    scheduler.shutdown()
+
+    assert max(model.batch_sizes) <= 3
+    assert sum(model.batch_sizes) == 7
+
+
+def test_mismatched_shapes_are_not_batched_together():
+    """Images of different sizes go into separate forward passes."""
+    model = FakeModel()
+    scheduler = InferenceScheduler(model, max_batch_size=8, max_wait_ms=100)
+
+    small = scheduler.submit(torch.rand(1, 3, 4, 4))
+    large = scheduler.submit(torch.rand(2, 3, 8, 8))
+
+    assert small.result(timeout=5).shape == (1, 4)
+    assert large.result(timeout=5).shape == (2, 4)
+    scheduler.shutdown()
+
+
+def test_errors_reach_every_caller():
+    """A failing forward pass fails each request in the batch."""
+    scheduler = InferenceScheduler(FakeModel(fail=True), max_batch_size=4, max_wait_ms=50)
+
+    futures = [scheduler.submit(torch.rand(1, 3, 4, 4)) for _ in range(2)]
+    for future in futures:
+        with pytest.raises(PredictionError):
+            future.result(timeout=5)
+    scheduler.shutdown()
+
+    with pytest.raises(RuntimeError):
+        scheduler.submit(torch.rand(1, 3, 4, 4))
+
+
+def test_get_predictions_formats_per_request():
+    """Top-k formatting uses each caller's own logits."""
+    scheduler = InferenceScheduler(FakeModel(), max_batch_size=4, max_wait_ms=0)
+
+    predictions = scheduler.get_predictions(torch.ones(1, 3, 4, 4), timeout=5)
+    scheduler.shutdown()
+
+    assert predictions == [{"class_id": 3, "confidence": 4.0}]
+
+
+def test_shutdown_during_submits_resolves_every_request():
+    """Requests racing a shutdown are either rejected or resolved, never left waiting."""
+    scheduler = InferenceScheduler(FakeModel(), max_batch_size=4, max_wait_ms=1)
+    futures = []
+    submitting = threading.Event()
+
+    def submit_loop():
+        submitting.set()
+        while True:
+            try:
+                futures.append(scheduler.submit(torch.rand(1, 3, 4, 4)))
+            except RuntimeError:
+                return
+
+    threads = [threading.Thread(target=submit_loop) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    submitting.wait(timeout=5)
+    scheduler.shutdown(wait=False)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    for future in futures:
+        try:
+            assert future.result(timeout=5).shape == (1, 4)
+        except PredictionError:
+            pass
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the LRU model cache in ModelFactory
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig
+from models.model_factory import ModelFactory
+from models.model_registry import ModelRegistry
+from models.resnet_model import ResNet18Model
+
+
+class FakeModel:
+    """Stand-in model with a fixed footprint."""
+
+    def __init__(self, model_type, size):
+        self.model_type = model_type
+        self.size = size
+
+
+class SizedFactory(ModelFactory):
+    """Factory creating fake models of known sizes."""
+
+    SIZES = {"a": 40, "b": 30, "c": 50, "resnet18": 10}
+
+    def __init__(self, cache_size=3, max_memory_usage=None):
+        super().__init__(ModelConfig(model_cache_size=cache_size), max_memory_usage=max_memory_usage)
+        self.events = []
+        self.add_eviction_listener(lambda model_type, model, reason: self.events.append((model_type, reason)))
+
+    def _create_model(self, model_type):
+        return FakeModel(model_type, self.SIZES[model_type])
+
+    @staticmethod
+    def _measure_model(model):
+        return model.size
+
+
+def test_entry_limit_evicts_least_recently_used():
+    """Hits refresh recency; the coldest model goes first."""
+    factory = SizedFactory(cache_size=2)
+
+    factory.get_model("a")
+    factory.get_model("b")
+    factory.get_model("a")
+    factory.get_model("c")
+
+    assert factory.get_cached_models() == ["a", "c"]
+    assert factory.events == [("b", "size")]
+
+
+def test_memory_budget_evicts_until_within_budget():
+    """Models are evicted by byte budget, never the one just loaded."""
+    factory = SizedFactory(cache_size=5, max_memory_usage=80)
+
+    factory.get_model("a")
+    factory.get_model("b")
+    assert factory.get_cache_memory_usage() == 70
+
+    factory.get_model("c")
+
+    assert factory.get_cached_models() == ["b", "c"]
+    assert factory.get_cache_memory_usage() == 80
+    assert factory.events == [("a", "memory")]
+
+
+def test_oversized_model_is_still_cached():
+    """A single model larger than the budget stays cached on its own."""
+    factory = SizedFactory(cache_size=5, max_memory_usage=20)
+
+    factory.get_model("a")
+    factory.get_model("c")
+
+    assert factory.get_cached_models() == ["c"]
+    assert factory.events == [("a", "memory")]
+
+
+def test_registry_drops_scheduler_of_evicted_model():
+    """Eviction shuts down the scheduler that referenced the model."""
+    registry = ModelRegistry(SizedFactory(cache_size=1))
+    scheduler = registry.get_scheduler("a", max_wait_ms=0)
+
+    registry.get_model("b")
+
+    assert not registry.is_loaded("a")
+    assert "a" not in registry._schedulers
+    assert not scheduler._running
+
+
+def test_memory_usage_counts_parameters_and_buffers():
+    """Real models report parameter and buffer bytes."""
+    model = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+    expected = sum(t.numel() * t.element_size() for t in [*model.model.parameters(), *model.model.buffers()])
+
+    assert model.get_memory_usage() == expected
+    assert model.get_model_info()["memory_bytes"] == expected
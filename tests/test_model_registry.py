@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide model registry
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig
+from models.model_factory import ModelFactory
+from models.model_registry import ModelRegistry, get_model_registry
+
+
+class CountingFactory(ModelFactory):
+    """Model factory that records how often each model is created."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.created = []
+
+    def _create_model(self, model_type):
+        time.sleep(0.05)  # Widen the race window
+        self.created.append(model_type)
+        return object()
+
+
+def test_concurrent_callers_load_once():
+    """Concurrent sessions asking for the same model share one load."""
+    registry = ModelRegistry(CountingFactory(ModelConfig()))
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(registry.get_model("resnet18"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.factory.created == ["resnet18"]
+    assert all(result is results[0] for result in results)
+
+
+def test_cached_model_lookup():
+    """Cached lookups never trigger a load."""
+    registry = ModelRegistry(CountingFactory(ModelConfig()))
+
+    assert registry.get_cached_model() is None
+    assert not registry.is_loaded()
+
+    model = registry.get_model()
+
+    assert registry.is_loaded("resnet18")
+    assert registry.get_cached_model("resnet18") is model
+    assert registry.factory.created == ["resnet18"]
+
+
+def test_registry_is_process_wide():
+    """Every caller gets the same registry instance."""
+    assert get_model_registry(ModelConfig()) is get_model_registry(ModelConfig())
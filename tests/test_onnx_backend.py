@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the ONNX Runtime prediction backend
+"""
+
+import os
+import sys
+
+import pytest
+import torch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import models.model_factory as model_factory
+from config.settings import ModelConfig
+from models.model_factory import ModelFactory
+from models.onnx_backend import OnnxRuntimeModel, weights_hash
+from models.resnet_model import ResNet18Model
+
+
+def make_config(tmp_path, **kwargs):
+    """Create a small configuration using the ONNX Runtime backend."""
+    return ModelConfig(
+        pretrained=False,
+        input_size=(32, 32),
+        inference_backend="onnxruntime",
+        onnx_cache_dir=str(tmp_path),
+        **kwargs,
+    )
+
+
+def test_weights_hash_tracks_weights():
+    """The export key changes when the weights change."""
+    model = torch.nn.Linear(4, 2)
+    before = weights_hash(model)
+
+    with torch.no_grad():
+        model.weight.add_(1)
+
+    assert weights_hash(model) != before
+
+
+def test_model_weights_hash_identifies_weights():
+    """Models with the same weights share a digest; different weights do not."""
+    torch.manual_seed(0)
+    first = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+    second = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+    second.model.load_state_dict(first.model.state_dict())
+    third = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+
+    assert first.get_weights_hash() == weights_hash(first.model)
+    assert first.get_weights_hash() == second.get_weights_hash()
+    assert first.get_weights_hash() != third.get_weights_hash()
+
+
+def test_onnx_predictions_match_torch(tmp_path):
+    """ORT serves predictions behind predict(); attacks keep the torch model."""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+
+    torch.manual_seed(0)
+    model = ModelFactory(make_config(tmp_path, onnx_intra_op_threads=1)).get_model()
+    image = torch.rand(3, 3, 32, 32)
+
+    with torch.no_grad():
+        expected = model.model(image)
+
+    assert isinstance(model.get_inference_model(), OnnxRuntimeModel)
+    assert model.get_model_info()["inference_backend"] == "onnxruntime"
+    assert model.get_attack_model() is model.model
+    assert torch.allclose(model.predict(image), expected, atol=1e-4)
+
+
+def test_export_is_cached_on_disk(tmp_path):
+    """A second model with the same weights reuses the exported file."""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+
+    first = ResNet18Model(make_config(tmp_path))
+    first.enable_onnx_inference(cache_dir=str(tmp_path))
+    path = first.get_inference_model().path
+    mtime = os.path.getmtime(path)
+
+    second = ResNet18Model(make_config(tmp_path))
+    second.model.load_state_dict(first.model.state_dict())
+    second.enable_onnx_inference(cache_dir=str(tmp_path))
+
+    assert second.get_inference_model().path == path
+    assert os.path.getmtime(path) == mtime
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_missing_onnxruntime_falls_back_to_torch(tmp_path, monkeypatch):
+    """Without onnxruntime the factory keeps the torch prediction path."""
+    monkeypatch.setattr(model_factory, "ONNX_RUNTIME_AVAILABLE", False)
+
+    model = ModelFactory(make_config(tmp_path)).get_model()
+
+    assert model.inference_backend == "torch"
+    assert model.predict(torch.rand(1, 3, 32, 32)).shape == (1, 1000)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the PGD attack engine
+"""
+
+import os
+import sys
+
+import torch
+import torch.nn as nn
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from attacks.pgd_attack import PGDAttack
+
+
+class RecordingModel(nn.Module):
+    """Small classifier that records the batch size of every forward pass."""
+
+    def __init__(self, num_classes=10):
+        super().__init__()
+        torch.manual_seed(0)
+        self.net = nn.Sequential(
+            nn.Conv2d(3, 8, 3, padding=1), nn.ReLU(), nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(8, num_classes)
+        )
+        self.batch_sizes = []
+
+    def forward(self, x):
+        self.batch_sizes.append(x.size(0))
+        return self.net(x)
+
+
+def make_batch(batch_size=6):
+    """Create a batch of images in [0, 1]."""
+    torch.manual_seed(1)
+    return torch.rand(batch_size, 3, 16, 16)
+
+
+def test_early_stop_compacts_working_batch():
+    """Finished samples drop out of later forward passes."""
+    model = RecordingModel().eval()
+    images = make_batch()
+    epsilon = torch.tensor([0.0, 0.0, 0.0, 1.0, 1.0, 1.0])
+
+    attack = PGDAttack(epsilon=epsilon, alpha=0.2, steps=20, random_start=False, early_stop=True)
+    adversarial = attack(images, model)
+
+    # The first three samples cannot move, so they are never finished early
+    assert torch.equal(adversarial[:3], images[:3])
+    assert torch.all(attack.steps_taken[:3] == 20)
+    # The working batch shrinks once the unconstrained samples break
+    assert min(model.batch_sizes[1:]) < images.size(0)
+    assert attack.compute_success(model, images, adversarial)[3:].all()
+
+
+def test_early_stop_keeps_successful_point():
+    """Samples are returned at the step where they first succeeded."""
+    model = RecordingModel().eval()
+    images = make_batch()
+
+    attack = PGDAttack(epsilon=1.0, alpha=0.2, steps=30, random_start=False, early_stop=True)
+    adversarial = attack(images, model)
+
+    success = attack.compute_success(model, images, adversarial)
+    assert torch.all(success[attack.steps_taken < 30])
+    assert torch.all(attack.compute_perturbation_linf(images, adversarial, per_sample=True) <= 1.0)
+
+
+def test_without_early_stop_all_steps_run_on_full_batch():
+    """The default mode keeps the whole batch for every step."""
+    model = RecordingModel().eval()
+    images = make_batch()
+
+    PGDAttack(epsilon=0.1, alpha=0.02, steps=5)(images, model)
+
+    # One clean forward for the labels, then one per step
+    assert model.batch_sizes == [images.size(0)] * 6
+
+
+def test_restarts_run_as_one_stacked_batch():
+    """All restarts share each forward pass and one result per sample comes back."""
+    model = RecordingModel().eval()
+    images = make_batch()
+
+    attack = PGDAttack(epsilon=0.05, alpha=0.01, steps=3, n_restarts=4)
+    adversarial = attack(images, model)
+
+    assert adversarial.shape == images.shape
+    # Clean labels, three steps on the stacked batch, then restart selection
+    assert model.batch_sizes == [6, 24, 24, 24, 24]
+    assert attack.best_restart.shape == (images.size(0),)
+    assert torch.all(attack.compute_perturbation_linf(images, adversarial, per_sample=True) <= 0.05 + 1e-6)
+
+
+def test_best_restart_has_highest_loss():
+    """Without success, the restart with the highest loss is kept."""
+    model = RecordingModel().eval()
+    images = make_batch()
+    with torch.no_grad():
+        labels = model(images).argmax(dim=1)
+
+    attack = PGDAttack(epsilon=0.01, alpha=0.002, steps=2, n_restarts=5)
+    candidates = []
+    run = attack._run
+    attack._run = lambda *args: candidates.append(run(*args)) or candidates[-1]
+    adversarial = attack(images, model)
+
+    with torch.no_grad():
+        restart_loss = nn.functional.cross_entropy(model(candidates[0]), labels.repeat(5), reduction="none").view(5, -1)
+        loss = nn.functional.cross_entropy(model(adversarial), labels, reduction="none")
+        success = attack.compute_success(model, images, adversarial)
+
+    assert not success.any()
+    assert torch.allclose(loss, restart_loss.max(dim=0).values)
+    assert torch.equal(attack.best_restart, restart_loss.argmax(dim=0))
+
+
+def test_inplace_engine_reuses_a_single_leaf():
+    """Every step feeds the same storage to the model."""
+    model = RecordingModel().eval()
+    pointers = []
+    model.register_forward_pre_hook(lambda module, inputs: pointers.append(inputs[0].data_ptr()))
+    images = make_batch()
+
+    PGDAttack(epsilon=0.1, alpha=0.02, steps=5)(images, model)
+
+    # Skip the clean forward used for the labels
+    assert len(set(pointers[1:])) == 1
+
+
+def test_inplace_engine_matches_reference_update():
+    """The in-place step, projection and clipping match the out-of-place formulation."""
+    model = RecordingModel().eval()
+    images = make_batch()
+    epsilon, alpha, steps = 0.05, 0.02, 4
+    with torch.no_grad():
+        labels = model(images).argmax(dim=1)
+
+    reference = images.clone()
+    for _ in range(steps):
+        reference.requires_grad_(True)
+        nn.functional.cross_entropy(model(reference), labels, reduction="sum").backward()
+        with torch.no_grad():
+            reference = reference + alpha * reference.grad.sign()
+            reference = torch.clamp(images + torch.clamp(reference - images, -epsilon, epsilon), 0, 1)
+
+    adversarial = PGDAttack(epsilon=epsilon, alpha=alpha, steps=steps, random_start=False)(images, model)
+
+    assert torch.allclose(adversarial, reference, atol=1e-6)
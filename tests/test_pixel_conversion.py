@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for uint8 PIL <-> tensor pixel conversions
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+import torch
+import torchvision.transforms as transforms
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import UIConfig
+from utils.image_processing import ImageProcessor, images_to_pixels, pixels_to_images, pixels_to_uint8
+
+
+def make_images(count=3, size=(40, 30)):
+    """Create random RGB images."""
+    rng = np.random.default_rng(0)
+    return [Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)) for _ in range(count)]
+
+
+def legacy_to_uint8(pixels):
+    """The original numpy conversion: transpose, clip, * 255 and truncate."""
+    array = np.transpose(pixels.detach().numpy(), (1, 2, 0))
+    return (np.clip(array, 0, 1) * 255).astype(np.uint8)
+
+
+@pytest.mark.parametrize("size", [(40, 30), (200, 160)])
+def test_batch_matches_to_tensor(size):
+    """Both batch layouts hold the same values as torchvision's ToTensor, for small and large images."""
+    images = make_images(size=size)
+    expected = torch.stack([transforms.ToTensor()(image) for image in images])
+
+    contiguous = images_to_pixels(images)
+    channels_last = images_to_pixels(images, channels_last=True)
+
+    assert torch.equal(contiguous, expected)
+    assert torch.equal(channels_last, expected)
+    assert contiguous.is_contiguous()
+    assert channels_last.is_contiguous(memory_format=torch.channels_last)
+
+
+def test_mismatched_sizes_rejected():
+    """A batch needs equally sized images."""
+    with pytest.raises(ValueError, match="expected"):
+        images_to_pixels(make_images(1) + make_images(1, size=(20, 20)))
+
+
+def test_uint8_matches_legacy_conversion():
+    """Scaling matches the original numpy conversion, including out-of-range values and block edges."""
+    torch.manual_seed(0)
+    pixels = torch.rand(3, 160, 150) * 1.4 - 0.2  # More elements than one scale block
+
+    converted = pixels_to_uint8(pixels)
+
+    assert converted.dtype == torch.uint8
+    assert converted.shape == pixels.shape
+    assert np.array_equal(converted.permute(1, 2, 0).numpy(), legacy_to_uint8(pixels))
+
+
+def test_uint8_accepts_graph_and_double_tensors():
+    """Tensors that require grad or use other float types convert too."""
+    pixels = torch.rand(3, 8, 8, dtype=torch.float64, requires_grad=True)
+    assert np.array_equal(pixels_to_uint8(pixels).permute(1, 2, 0).numpy(), legacy_to_uint8(pixels))
+
+
+def test_round_trip_is_lossless():
+    """Images survive a conversion to pixels and back unchanged."""
+    images = make_images()
+    restored = pixels_to_images(images_to_pixels(images))
+
+    assert len(restored) == len(images)
+    for original, image in zip(images, restored):
+        assert image.mode == "RGB"
+        assert np.array_equal(np.asarray(original), np.asarray(image))
+
+
+def test_tensor_to_pil_accepts_single_image_batch():
+    """tensor_to_pil still takes (C, H, W) and (1, C, H, W) tensors."""
+    processor = ImageProcessor(UIConfig())
+    pixels = images_to_pixels(make_images(1))
+
+    assert np.array_equal(np.asarray(processor.tensor_to_pil(pixels)), np.asarray(processor.tensor_to_pil(pixels[0])))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for pixel-space models and attacks
+"""
+
+import os
+import sys
+
+import numpy as np
+import torch
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from attacks.fgsm_attack import FGSMAttack
+from config.settings import ModelConfig, UIConfig
+from models.normalized_model import NormalizedModel
+from models.resnet_model import ResNet18Model
+from utils.image_processing import ImageProcessor
+
+
+def make_image(size=(64, 48)):
+    """Create a random RGB image."""
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, size=(size[1], size[0], 3), dtype=np.uint8))
+
+
+def test_preprocess_returns_pixels():
+    """Preprocessing stops at [0, 1] pixels; normalization lives in the model."""
+    config = ModelConfig(pretrained=False, input_size=(32, 32))
+    model = ResNet18Model(config)
+
+    tensor = model.preprocess(make_image())
+
+    assert tensor.shape == (1, 3, 32, 32)
+    assert tensor.min() >= 0 and tensor.max() <= 1
+    assert isinstance(model.model, NormalizedModel)
+
+    mean = torch.tensor(config.mean).view(1, 3, 1, 1)
+    std = torch.tensor(config.std).view(1, 3, 1, 1)
+    with torch.no_grad():
+        expected = model.model.model((tensor - mean) / std)
+    assert torch.allclose(model.predict(tensor), expected, atol=1e-5)
+
+
+def test_attack_output_converts_directly_to_image():
+    """Adversarial pixels stay within epsilon of the input after conversion to PIL."""
+    model = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+    processor = ImageProcessor(UIConfig())
+    tensor = model.preprocess(make_image())
+
+    adversarial = FGSMAttack(epsilon=8 / 255)(tensor, model.model)
+    image = processor.tensor_to_pil(adversarial)
+
+    original = np.asarray(processor.tensor_to_pil(tensor), dtype=np.int16)
+    assert np.abs(np.asarray(image, dtype=np.int16) - original).max() <= 9
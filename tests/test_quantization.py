@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for quantized inference
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from attacks.fgsm_attack import FGSMAttack
+from config.settings import AppConfig, ModelConfig
+from models.model_factory import ModelFactory
+from models.quantization import compare_models, load_calibration_images
+
+
+def make_config(**kwargs):
+    """Small, offline model configuration."""
+    return ModelConfig(pretrained=False, input_size=(32, 32), **kwargs)
+
+
+def write_images(directory, count=4):
+    """Write random calibration images."""
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        pixels = rng.integers(0, 256, size=(40, 40, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(os.path.join(directory, f"image_{i}.png"))
+
+
+def test_quantization_disabled_by_default():
+    """Without enable_quantization the prediction path stays fp32."""
+    model = ModelFactory(make_config()).get_model()
+
+    assert model.inference_model is None
+    assert model.get_inference_model() is model.model
+    assert model.get_model_info()["quantization"] == "none"
+
+
+def test_dynamic_quantization_keeps_fp32_for_attacks():
+    """Predictions use the int8 copy while attacks still get gradients from fp32."""
+    model = ModelFactory(make_config(quantization_mode="dynamic"), enable_quantization=True).get_model()
+    image = torch.rand(1, 3, 32, 32)
+
+    assert model.quantization_mode == "dynamic"
+    assert model.get_inference_model() is not model.model
+    assert model.predict(image).shape == (1, 1000)
+
+    adversarial = FGSMAttack(epsilon=0.1)(image, model.model)
+    assert adversarial.shape == image.shape
+
+
+def test_dynamic_quantization_shares_non_linear_layers():
+    """Only the classifier is quantized; the rest of the network is shared with fp32."""
+    model = ModelFactory(make_config(quantization_mode="dynamic"), enable_quantization=True).get_model()
+    fp32_bytes = sum(t.numel() * t.element_size() for t in model.model.state_dict().values())
+
+    assert model.get_inference_model().model.layer1 is model.model.model.layer1
+    assert isinstance(model.model.model.fc, torch.nn.Linear)
+    assert model.get_memory_usage() < 1.1 * fp32_bytes
+
+
+def test_enable_quantization_without_mode_uses_dynamic():
+    """The enable_quantization switch alone selects dynamic quantization; an explicit "none" disables it."""
+    default_mode = ModelFactory(make_config(), enable_quantization=True).get_model()
+    disabled = ModelFactory(make_config(quantization_mode="none"), enable_quantization=True).get_model()
+
+    assert default_mode.quantization_mode == "dynamic"
+    assert disabled.quantization_mode == "none"
+
+
+def test_unknown_quantization_mode_is_rejected():
+    """A misspelled mode fails validation instead of silently running fp32."""
+    with pytest.raises(ValueError, match="Quantization mode"):
+        AppConfig(model=make_config(quantization_mode="dynamc"))
+
+
+def test_static_quantization_calibrates_on_local_folder(tmp_path):
+    """Static quantization reads calibration images from the configured folder."""
+    write_images(str(tmp_path))
+    config = make_config(quantization_mode="static", quantization_calibration_dir=str(tmp_path))
+    model = ModelFactory(config, enable_quantization=True).get_model()
+
+    assert model.quantization_mode == "static"
+    images = load_calibration_images(str(tmp_path), model.preprocess)
+    assert images.shape == (4, 3, 32, 32)
+
+    report = compare_models(model.model, model.inference_model, images, repeats=1)
+    assert 0.0 <= report["top1_agreement"] <= 1.0
+    assert report["candidate_latency_ms"] > 0
+
+
+def test_static_without_calibration_falls_back_to_dynamic():
+    """A missing calibration folder degrades to dynamic quantization."""
+    model = ModelFactory(make_config(quantization_mode="static"), enable_quantization=True).get_model()
+
+    assert model.quantization_mode == "dynamic"
+
+
+def test_per_model_mode_override():
+    """The factory selects the quantization mode per model type."""
+    factory = ModelFactory(make_config(quantization_mode="dynamic"), enable_quantization=True)
+    factory.set_quantization_mode("resnet18", "none")
+
+    assert factory.get_model("resnet18").quantization_mode == "none"
+
+    factory.set_quantization_mode("resnet18", "dynamic")
+    assert factory.get_model("resnet18").quantization_mode == "dynamic"
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed result cache
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.result_cache import ResultCache, estimate_size, image_digest, make_cache_key
+
+
+def make_image(seed=0, size=(32, 24)):
+    """Create a random RGB image."""
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8))
+
+
+def test_digest_depends_on_pixels_only():
+    """Identical pixels hash the same; any pixel change changes the digest."""
+    image = make_image()
+    assert image_digest(image) == image_digest(image.copy())
+    assert image_digest(image) != image_digest(make_image(seed=1))
+
+    changed = image.copy()
+    changed.putpixel((0, 0), (0, 0, 0) if image.getpixel((0, 0)) != (0, 0, 0) else (1, 1, 1))
+    assert image_digest(image) != image_digest(changed)
+
+
+def test_key_covers_model_operation_and_params():
+    """Keys differ by model, operation and parameters, but not by parameter order."""
+    digest = image_digest(make_image())
+    key = make_cache_key(digest, "resnet18", "pgd", epsilon=0.03, steps=10)
+
+    assert key == make_cache_key(digest, "resnet18", "pgd", steps=10, epsilon=0.03)
+    assert key != make_cache_key(digest, "mobilenet_v2", "pgd", epsilon=0.03, steps=10)
+    assert key != make_cache_key(digest, "resnet18", "fgsm", epsilon=0.03, steps=10)
+    assert key != make_cache_key(digest, "resnet18", "pgd", epsilon=0.05, steps=10)
+    assert make_cache_key(digest, "resnet18", "pgd", epsilon=torch.tensor(0.5)) == make_cache_key(
+        digest, "resnet18", "pgd", epsilon=0.5
+    )
+
+
+def test_hits_and_misses_are_counted():
+    """Lookups update the hit and miss counters."""
+    cache = ResultCache(max_bytes=1024 * 1024)
+    assert cache.get("a") is None
+    cache.put("a", [{"class_id": 1, "confidence": 0.9}])
+    assert cache.get("a") == [{"class_id": 1, "confidence": 0.9}]
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1
+
+
+def test_byte_budget_evicts_least_recently_used():
+    """Entries over the budget are evicted oldest-used first."""
+    tensor_bytes = estimate_size(torch.zeros(1, 3, 32, 32))
+    cache = ResultCache(max_bytes=int(tensor_bytes * 2.5))
+    cache.put("a", torch.zeros(1, 3, 32, 32))
+    cache.put("b", torch.zeros(1, 3, 32, 32))
+    cache.get("a")
+    cache.put("c", torch.zeros(1, 3, 32, 32))
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.current_bytes <= cache.max_bytes
+
+
+def test_oversized_values_are_not_stored():
+    """A value larger than the whole budget is rejected."""
+    cache = ResultCache(max_bytes=1024)
+    assert not cache.put("big", torch.zeros(1024))
+    assert len(cache) == 0
+
+
+def test_estimate_size_counts_pixel_buffers():
+    """Attack results are sized by their tensors and images."""
+    result = {
+        "adversarial_tensor": torch.zeros(1, 3, 224, 224),
+        "adversarial_image": make_image(size=(224, 224)),
+        "adversarial_predictions": [{"class_id": 1}],
+    }
+    size = estimate_size(result)
+    assert size >= 4 * 3 * 224 * 224 + 3 * 224 * 224
+
+
+def test_repeat_lookup_is_fast():
+    """A cache hit returns the stored result in well under a millisecond."""
+    cache = ResultCache()
+    key = make_cache_key(image_digest(make_image()), "resnet18", "predict")
+    cache.put(key, [{"class_id": 1, "confidence": 0.9}])
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        cache.get(key)
+    assert (time.perf_counter() - start) / 1000 < 1e-3
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent result store
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+
+import numpy as np
+import torch
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.result_store import ResultStore
+
+
+def make_result(seed=0):
+    """Create an attack result like the one the app stores."""
+    # A private generator keeps concurrent writers from sharing the global RNG
+    tensor = torch.rand(1, 3, 8, 8, generator=torch.Generator().manual_seed(seed))
+    pixels = (tensor[0].permute(1, 2, 0) * 255).round().to(torch.uint8).numpy()
+    return {
+        "adversarial_tensor": tensor,
+        "adversarial_image": Image.fromarray(pixels),
+        "adversarial_predictions": [{"class_id": 3, "class_name": "cat", "confidence": 0.75}],
+        "epsilon_sweep": None,
+    }
+
+
+def test_round_trip(tmp_path):
+    """Tensors, images and JSON fields come back unchanged."""
+    store = ResultStore(str(tmp_path))
+    result = make_result()
+    store.put("key", result, image_hash="abc", model_type="resnet18", operation="pgd", params={"epsilon": 0.03})
+
+    loaded = store.get("key")
+    assert torch.equal(loaded["adversarial_tensor"], result["adversarial_tensor"])
+    assert np.array_equal(np.asarray(loaded["adversarial_image"]), np.asarray(result["adversarial_image"]))
+    assert loaded["adversarial_predictions"] == result["adversarial_predictions"]
+    assert loaded["epsilon_sweep"] is None
+    assert store.get("missing") is None
+
+
+def test_results_survive_reopening(tmp_path):
+    """A new store on the same directory sees earlier runs."""
+    store = ResultStore(str(tmp_path))
+    store.put("key", make_result(), image_hash="abc", model_type="resnet18", operation="pgd")
+    store.close()
+
+    reopened = ResultStore(str(tmp_path))
+    assert "key" in reopened
+    assert reopened.list_runs(image_hash="abc")[0]["operation"] == "pgd"
+    assert reopened.list_runs(image_hash="other") == []
+
+
+def test_index_uses_wal_and_sharded_blobs(tmp_path):
+    """The index is in WAL mode and blobs live in two-level shard directories."""
+    store = ResultStore(str(tmp_path))
+    store.put("key", make_result())
+
+    connection = sqlite3.connect(os.path.join(str(tmp_path), "index.sqlite3"))
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    connection.close()
+
+    blobs = [
+        os.path.relpath(os.path.join(root, name), store.blob_dir)
+        for root, _, files in os.walk(store.blob_dir)
+        for name in files
+    ]
+    assert len(blobs) == 2
+    for blob in blobs:
+        first, second, name = blob.split(os.sep)
+        assert name.startswith(first + second)
+        assert not name.endswith(".tmp")
+
+
+def test_identical_artifacts_are_stored_once(tmp_path):
+    """Blobs are content-addressed, so repeated artifacts share a file."""
+    store = ResultStore(str(tmp_path))
+    store.put("a", make_result())
+    store.put("b", make_result())
+
+    files = [name for _, _, names in os.walk(store.blob_dir) for name in names]
+    assert len(files) == 2
+    assert store.get_stats()["runs"] == 2
+
+
+def test_missing_blob_is_a_miss(tmp_path):
+    """A run whose blob has been deleted is dropped instead of failing."""
+    store = ResultStore(str(tmp_path))
+    store.put("key", make_result())
+    for root, _, names in os.walk(store.blob_dir):
+        for name in names:
+            os.remove(os.path.join(root, name))
+
+    assert store.get("key") is None
+    assert "key" not in store
+
+
+def test_concurrent_writers_share_the_store(tmp_path):
+    """Separate store instances, as in separate processes, can write concurrently."""
+    stores = [ResultStore(str(tmp_path)) for _ in range(4)]
+
+    def write(index):
+        for run in range(5):
+            stores[index].put(f"{index}-{run}", make_result(seed=index * 10 + run))
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stores[0].get_stats()["runs"] == 20
+    assert torch.equal(stores[1].get("3-4")["adversarial_tensor"], make_result(seed=34)["adversarial_tensor"])
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for process-wide instances
+"""
+
+import os
+import sys
+import threading
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.singleton import ProcessSingleton
+
+
+def test_factory_runs_once_across_threads():
+    """Concurrent first calls share one instance."""
+    holder = ProcessSingleton()
+    calls = []
+    results = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    threads = [threading.Thread(target=lambda: results.append(holder.get(factory))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_reset_returns_the_instance_and_allows_a_new_one():
+    """After a reset the next get builds a fresh instance."""
+    holder = ProcessSingleton()
+    first = holder.get(object)
+
+    assert holder.reset() is first
+    assert holder.reset() is None
+    assert holder.get(object) is not first
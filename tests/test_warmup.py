@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the background model warm-up
+"""
+
+import json
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig
+from models.model_factory import ModelFactory
+from models.model_registry import ModelRegistry
+from models.warmup import ModelWarmup
+
+
+class RecordingFactory(ModelFactory):
+    """Factory creating small random models and recording each load."""
+
+    def __init__(self, fail=False):
+        super().__init__(ModelConfig(pretrained=False, input_size=(32, 32)))
+        self.created = []
+        self.fail = fail
+
+    def _create_model(self, model_type):
+        if self.fail:
+            raise RuntimeError("no weights")
+        self.created.append(model_type)
+        return super()._create_model(model_type)
+
+
+def test_warmup_loads_models_and_reports_ready(tmp_path):
+    """Warm-up loads through the registry, flips the readiness flag and writes the status file."""
+    registry = ModelRegistry(RecordingFactory())
+    status_path = str(tmp_path / "warmup_status.json")
+    warmup = ModelWarmup(registry, ["resnet18"], iterations=1, status_path=status_path)
+
+    assert not warmup.is_ready()
+    warmup.start()
+
+    assert warmup.wait(timeout=60)
+    assert registry.is_loaded("resnet18")
+    assert registry.factory.created == ["resnet18"]
+
+    # The model is reused afterwards, not loaded again
+    registry.get_model("resnet18")
+    assert registry.factory.created == ["resnet18"]
+
+    with open(status_path) as f:
+        status = json.load(f)
+    assert status["state"] == "ready"
+    assert "resnet18" in status["durations_s"]
+
+
+def test_warmup_stores_no_parameter_gradients():
+    """The dummy backward pass only differentiates with respect to the input."""
+    registry = ModelRegistry(RecordingFactory())
+    warmup = ModelWarmup(registry, ["resnet18"], iterations=1)
+    warmup.start()
+    warmup.wait(timeout=60)
+
+    model = registry.get_model("resnet18")
+    assert all(p.grad is None for p in model.model.parameters())
+
+
+def test_warmup_failure_is_reported(tmp_path):
+    """A failing load leaves the flag unset and records the error."""
+    status_path = str(tmp_path / "warmup_status.json")
+    warmup = ModelWarmup(ModelRegistry(RecordingFactory(fail=True)), ["resnet18"], status_path=status_path)
+    warmup.start()
+
+    assert not warmup.wait(timeout=60)
+    assert warmup.get_status()["state"] == "failed"
+    with open(status_path) as f:
+        assert "no weights" in json.load(f)["error"]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for memory-mapped weight loading from a local weight store
+"""
+
+import os
+import sys
+
+import pytest
+import torch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import ModelConfig
+from models import weight_store
+from models.base_model import ModelLoadError
+from models.resnet_model import ResNet18Model
+from models.weight_store import checkpoint_path, export_weights, load_weights
+
+
+def test_model_loads_from_weight_store(tmp_path):
+    """A stored checkpoint reproduces the exported model's predictions."""
+    source = ResNet18Model(ModelConfig(pretrained=False, input_size=(32, 32)))
+    export_weights(source.model, checkpoint_path(str(tmp_path), "resnet18"))
+
+    loaded = ResNet18Model(ModelConfig(pretrained=True, input_size=(32, 32), weight_store_dir=str(tmp_path)))
+
+    image = torch.rand(2, 3, 32, 32)
+    assert torch.equal(loaded.predict(image), source.predict(image))
+    assert not loaded.model.training
+    assert not any(p.is_meta for p in loaded.model.parameters())
+
+
+def test_load_weights_assigns_checkpoint_tensors(tmp_path, monkeypatch):
+    """Weights are assigned from the memory-mapped checkpoint, not copied into a fresh model."""
+    import torchvision.models as models
+
+    path = str(tmp_path / "resnet18.pt")
+    export_weights(models.resnet18(weights=None), path)
+
+    loaded = {}
+    torch_load = torch.load
+
+    def recording_load(*args, **kwargs):
+        loaded.update(torch_load(*args, **kwargs))
+        assert kwargs.get("mmap")
+        return loaded
+
+    monkeypatch.setattr(weight_store.torch, "load", recording_load)
+    model = load_weights(models.resnet18, path)
+
+    assert set(model.state_dict()) == set(loaded)
+    for name, tensor in model.state_dict().items():
+        assert tensor.data_ptr() == loaded[name].data_ptr(), name
+
+
+def test_missing_checkpoint_fails_to_load(tmp_path):
+    """A configured weight store without the checkpoint is a load error, not a download."""
+    with pytest.raises(ModelLoadError, match="Checkpoint not found"):
+        ResNet18Model(ModelConfig(weight_store_dir=str(tmp_path)))
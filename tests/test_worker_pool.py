@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for torch thread settings and the bounded worker pool
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import TimeoutError
+
+import pytest
+import torch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils import worker_pool
+from utils.worker_pool import (
+    configure_torch_threads,
+    get_worker_pool,
+    resolve_intra_op_threads,
+    run_work,
+    shutdown_worker_pool,
+    submit_work,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    """Give each test its own pool and restore torch's thread count."""
+    threads = torch.get_num_threads()
+    shutdown_worker_pool()
+    yield
+    shutdown_worker_pool()
+    torch.set_num_threads(threads)
+
+
+def test_pool_bounds_concurrent_jobs():
+    """No more than max_workers jobs run at the same time."""
+    get_worker_pool(max_workers=2, intra_op_threads=1)
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def job():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    futures = [submit_work(job) for _ in range(6)]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert max(peak) == 2
+
+
+def test_workers_use_configured_intra_op_threads():
+    """Each worker thread runs torch with the configured thread count."""
+    get_worker_pool(max_workers=1, intra_op_threads=1)
+
+    assert run_work(torch.get_num_threads) == 1
+
+
+def test_run_work_returns_results_and_times_out():
+    """Results come back to the caller; slow jobs raise a timeout."""
+    get_worker_pool(max_workers=1, intra_op_threads=1)
+
+    assert run_work(lambda a, b=0: a + b, 2, b=3) == 5
+    with pytest.raises(TimeoutError):
+        run_work(time.sleep, 0.5, timeout=0.01)
+
+
+def test_automatic_threads_split_cores_between_workers():
+    """With 0 intra-op threads the cores are divided between the workers."""
+    cores = os.cpu_count() or 1
+
+    assert resolve_intra_op_threads(3, 2) == 3
+    assert resolve_intra_op_threads(0, 1) == cores
+    assert resolve_intra_op_threads(0, cores * 2) == 1
+
+
+def test_thread_settings_apply_once(monkeypatch):
+    """The first configuration wins for the rest of the process."""
+    monkeypatch.setattr(worker_pool, "_threads_configured", None)
+
+    first = configure_torch_threads(1)
+    second = configure_torch_threads(4)
+
+    assert first == second
+    assert first[0] == 1